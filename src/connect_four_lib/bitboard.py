@@ -0,0 +1,447 @@
+import random
+from functools import cache
+from typing import NamedTuple
+
+
+@cache
+def zobrist_keys(size: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Returns random 64-bit keys for every color and bit of board, built once per size.
+
+    Args:
+        size (int): Number of bits in board.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: Keys indexed by color and bit.
+    """
+
+    generator = random.Random(size)
+
+    return tuple(
+        tuple(generator.getrandbits(64) for _ in range(size)) for _ in range(3)
+    )
+
+
+class Layout(NamedTuple):
+    stride: int
+    bottom: int
+    full: int
+    column_masks: tuple[int, ...]
+    top_masks: tuple[int, ...]
+
+
+@cache
+def get_layout(width: int, height: int) -> Layout:
+    """
+    Returns bitmasks describing board of given size, built once per size.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+
+    Returns:
+        Layout: Stride of columns and masks of bottom row, board, columns and tops.
+    """
+
+    stride = height + 1
+    column_masks = tuple(
+        ((1 << height) - 1) << (column * stride) for column in range(width)
+    )
+
+    return Layout(
+        stride,
+        sum(1 << (column * stride) for column in range(width)),
+        sum(column_masks),
+        column_masks,
+        tuple(1 << (column * stride + height - 1) for column in range(width)),
+    )
+
+
+@cache
+def get_run_shifts(stride: int, length: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Returns shifts that find runs of given length, built once per geometry.
+
+    For every direction, runs are doubled while possible and extended with the
+    remainder, so that runs of four take two shifts and runs of five three.
+
+    Args:
+        stride (int): Number of bits per column.
+        length (int): Length of runs.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: Shifts of every direction.
+    """
+
+    directions = []
+
+    for shift in (1, stride, stride - 1, stride + 1):
+        covered, shifts = 1, []
+
+        while 2 * covered <= length:
+            shifts.append(covered * shift)
+            covered *= 2
+
+        if covered < length:
+            shifts.append((length - covered) * shift)
+
+        directions.append(tuple(shifts))
+
+    return tuple(directions)
+
+
+def winning_cells(pieces: int, occupied: int, layout: Layout, length: int = 4) -> int:
+    """
+    Returns empty cells that would connect given number of pieces for owner of
+    pieces.
+
+    Args:
+        pieces (int): Pieces of one player.
+        occupied (int): Pieces of both players.
+        layout (Layout): Layout of board.
+        length (int): Number of connected pieces needed to win. Defaults to 4.
+
+    Returns:
+        int: Bits of winning cells, not necessarily playable yet.
+    """
+
+    if length != 4:
+        return _winning_cells(pieces, occupied, layout, length)
+
+    stride = layout.stride
+    cells = (pieces << 1) & (pieces << 2) & (pieces << 3)
+
+    for shift in (stride, stride - 1, stride + 1):
+        pairs = (pieces << shift) & (pieces << 2 * shift)
+        cells |= pairs & (pieces << 3 * shift)
+        cells |= pairs & (pieces >> shift)
+        pairs = (pieces >> shift) & (pieces >> 2 * shift)
+        cells |= pairs & (pieces << shift)
+        cells |= pairs & (pieces >> 3 * shift)
+
+    return cells & (layout.full ^ occupied)
+
+
+def _winning_cells(pieces: int, occupied: int, layout: Layout, length: int) -> int:
+    """
+    Finds winning cells for any length. Runs of pieces ending right before and
+    starting right after each cell are built one step at a time, and a cell wins
+    if the runs on its two sides are long enough together.
+    """
+
+    stride = layout.stride
+    steps = length - 1
+    cells = -1
+
+    for step in range(1, length):
+        cells &= pieces << step
+
+    for shift in (stride, stride - 1, stride + 1):
+        before, after = [-1], [-1]
+
+        for step in range(1, length):
+            before.append(before[-1] & (pieces << step * shift))
+            after.append(after[-1] & (pieces >> step * shift))
+
+        for step in range(length):
+            cells |= before[step] & after[steps - step]
+
+    return cells & (layout.full ^ occupied)
+
+
+class BitBoard:
+    """
+    Connect four position stored as integer bitmasks.
+
+    Every column uses ``height + 1`` bits, bottom cell first. The extra bit on top
+    of each column is always empty so that shifted masks never wrap from one
+    column to the next.
+
+    Zobrist hash of the position is updated on every move and stored in ``hash``,
+    and hash of its mirror image in ``mirror_hash``.
+    """
+
+    def __init__(self, width: int = 7, height: int = 6, length: int = 4) -> None:
+        self.length: int = length
+        self.masks: list[int] = [0, 0, 0]
+        self.occupied: int = 0
+        self.hash: int = 0
+        self.mirror_hash: int = 0
+
+        self.layout: Layout = get_layout(width, height)
+        self.__keys: tuple[tuple[int, ...], ...] = zobrist_keys(
+            width * self.layout.stride
+        )
+        self.__run_shifts: tuple[tuple[int, ...], ...] = get_run_shifts(
+            self.layout.stride, length
+        )
+
+    @property
+    def width(self) -> int:
+        return len(self.layout.column_masks)
+
+    @property
+    def height(self) -> int:
+        return self.layout.stride - 1
+
+    @classmethod
+    def from_board(cls, board: list[list[int]], length: int = 4) -> "BitBoard":
+        """
+        Builds bitboard from column-major board.
+
+        Args:
+            board (list[list[int]]): Board as list of columns, bottom cell first.
+            length (int): Number of connected pieces needed to win. Defaults to 4.
+
+        Returns:
+            BitBoard: Bitboard with same position.
+        """
+
+        bitboard = cls(len(board), len(board[0]), length)
+
+        for column, cells in enumerate(board):
+            for row, color in enumerate(cells):
+                if color == 0:
+                    continue
+
+                index = column * bitboard.layout.stride + row
+                bitboard.occupied |= 1 << index
+
+                if color in (1, 2):
+                    bitboard.masks[color] |= 1 << index
+                    bitboard.__toggle_hash(column, row, color)
+
+        return bitboard
+
+    def can_play(self, column: int) -> bool:
+        return self.occupied & self.layout.top_masks[column] == 0
+
+    def column_height(self, column: int) -> int:
+        layout = self.layout
+
+        return (
+            (self.occupied & layout.column_masks[column]) >> (column * layout.stride)
+        ).bit_length()
+
+    def next_bit(self, column: int) -> int:
+        """
+        Returns bit of the cell where next piece of column would land.
+
+        Args:
+            column (int): Column of move.
+
+        Returns:
+            int: Bit of the cell, 0 if column is full.
+        """
+
+        layout = self.layout
+        bottom = 1 << (column * layout.stride)
+
+        return (self.occupied + bottom) & layout.column_masks[column]
+
+    def play(self, column: int, color: int) -> int:
+        """
+        Drops piece of given color to column.
+
+        Args:
+            column (int): Column of move, must not be full.
+            color (int): Color of piece.
+
+        Returns:
+            int: Row where piece landed.
+        """
+
+        bit = self.next_bit(column)
+
+        if not bit:
+            raise IndexError
+
+        row = bit.bit_length() - 1 - column * self.layout.stride
+        self.occupied |= bit
+        self.masks[color] |= bit
+        self.__toggle_hash(column, row, color)
+
+        return row
+
+    def undo(self, column: int) -> int:
+        """
+        Removes topmost piece of column.
+
+        Args:
+            column (int): Column of move.
+
+        Returns:
+            int: Row where piece was removed from.
+        """
+
+        row = self.column_height(column) - 1
+
+        if row < 0:
+            raise IndexError
+
+        bit = 1 << (column * self.layout.stride + row)
+
+        for color in (1, 2):
+            if self.masks[color] & bit:
+                self.masks[color] ^= bit
+                self.__toggle_hash(column, row, color)
+
+        self.occupied ^= bit
+
+        return row
+
+    def __toggle_hash(self, column: int, row: int, color: int) -> None:
+        keys = self.__keys[color]
+        stride = self.layout.stride
+
+        self.hash ^= keys[column * stride + row]
+        self.mirror_hash ^= keys[(self.width - 1 - column) * stride + row]
+
+    def is_winning_move(self, column: int, color: int) -> bool:
+        """
+        Checks if dropping piece of given color to column connects four.
+
+        Args:
+            column (int): Column of move.
+            color (int): Color of piece.
+
+        Returns:
+            bool: True if move wins, otherwise False.
+        """
+
+        bit = self.next_bit(column)
+
+        return bool(bit) and self.is_win(self.masks[color] | bit)
+
+    def is_win(self, mask: int) -> bool:
+        """
+        Checks if mask contains ``length`` consecutive pieces in any direction.
+
+        Args:
+            mask (int): Pieces of one player.
+
+        Returns:
+            bool: True if pieces are connected, otherwise False.
+        """
+
+        for shifts in self.__run_shifts:
+            runs = mask
+
+            for shift in shifts:
+                runs &= runs >> shift
+
+            if runs:
+                return True
+
+        return False
+
+    def playable(self) -> int:
+        """
+        Returns mask of cells where next pieces of columns would land.
+
+        Returns:
+            int: Bits of playable cells.
+        """
+
+        return (self.occupied + self.layout.bottom) & self.layout.full
+
+    def winning_cells(self, color: int) -> int:
+        """
+        Returns empty cells that would connect ``length`` pieces for given color.
+
+        Cells do not need to be playable yet.
+
+        Args:
+            color (int): Color of pieces.
+
+        Returns:
+            int: Bits of winning cells.
+        """
+
+        return winning_cells(self.masks[color], self.occupied, self.layout, self.length)
+
+    def columns(self, mask: int) -> list[int]:
+        """
+        Returns columns that have any of given bits.
+
+        Args:
+            mask (int): Bits of cells.
+
+        Returns:
+            list[int]: Columns in ascending order.
+        """
+
+        return [
+            column
+            for column, column_mask in enumerate(self.layout.column_masks)
+            if mask & column_mask
+        ]
+
+    def key(self) -> int:
+        """
+        Returns integer that identifies position uniquely.
+
+        Returns:
+            int: Pieces of first player added to occupied cells.
+        """
+
+        return self.masks[1] + self.occupied
+
+    def canonical_key(self) -> tuple[int, bool]:
+        """
+        Returns key of position or its mirror image, whichever is smaller.
+
+        Returns:
+            tuple[int, bool]: Canonical key and whether it belongs to mirror image.
+        """
+
+        key = self.key()
+        mirrored = self.__mirror(key)
+
+        if mirrored < key:
+            return mirrored, True
+
+        return key, False
+
+    def canonical_hash(self) -> tuple[int, bool]:
+        """
+        Returns Zobrist hash of position or its mirror image, whichever is smaller.
+
+        Returns:
+            tuple[int, bool]: Canonical hash and whether it belongs to mirror image.
+        """
+
+        if self.mirror_hash < self.hash:
+            return self.mirror_hash, True
+
+        return self.hash, False
+
+    def is_symmetric(self) -> bool:
+        """
+        Checks if position is its own mirror image.
+
+        Returns:
+            bool: True if position is symmetric, otherwise False.
+        """
+
+        if self.hash != self.mirror_hash:
+            return False
+
+        key = self.key()
+
+        return self.__mirror(key) == key
+
+    def mirror_column(self, column: int) -> int:
+        return self.width - 1 - column
+
+    def __mirror(self, mask: int) -> int:
+        stride = self.layout.stride
+        width = self.width
+        column_bits = (1 << stride) - 1
+        mirrored = 0
+
+        for column in range(width):
+            cells = (mask >> (column * stride)) & column_bits
+            mirrored |= cells << ((width - 1 - column) * stride)
+
+        return mirrored
@@ -1,64 +1,547 @@
 import random
 import time
+from functools import cache
 
 from duo_game_lib.game_state import GameState
 
 from connect_four_lib.config import INFINITY
 from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.engine_scheduler import EngineScheduler, get_default_scheduler
+from connect_four_lib.move_ordering import MoveOrdering, center_first_columns
+from connect_four_lib.opening_book import OpeningBook
+from connect_four_lib.parallel_search import (
+    ParallelSearch,
+    Position,
+    TaskResult,
+    worker_limits,
+)
+from connect_four_lib.pondering import Ponderer
+from connect_four_lib.search_info import IterationCallback, SearchInfo, StopReason
+from connect_four_lib.search_limits import LimitChecker, SearchLimits, SearchStopped
+from connect_four_lib.transposition_table import Bound, TranspositionTable
 
 
 class ConnectFourEngine:
+    """
+    Finds moves with iterative deepening alpha-beta search.
+
+    Difficulty is the default wall-clock time limit of a search in milliseconds,
+    other limits can be given per search with SearchLimits. Size of the board
+    and length of winning lines are taken from the judge.
+
+    Iterations from the third on are searched with an aspiration window of
+    ``ASPIRATION_WINDOW`` around the value of the iteration two plies shallower,
+    since values of odd and even depths differ a lot. When the value falls
+    outside, the window is widened four times on that side, and opened fully
+    once it is wider than ``ASPIRATION_LIMIT``.
+    """
+
+    ASPIRATION_WINDOW = 25
+    ASPIRATION_LIMIT = 5000
+
     def __init__(
         self,
         difficulty: int = 1000,
         judge: ConnectFourJudge | None = None,
         weight: int = 2,
+        *,
+        table: TranspositionTable | None = None,
+        ordering: MoveOrdering | None = None,
+        book: OpeningBook | None = None,
+        workers: int = 1,
+        on_iteration: IterationCallback | None = None,
     ) -> None:
         self.__judge: ConnectFourJudge = judge or ConnectFourJudge()
-        self.__difficulty: int = difficulty
-        self.__start_time: float = 0
+        self.__table: TranspositionTable = (
+            table if table is not None else TranspositionTable()
+        )
+        self.__ordering: MoveOrdering = ordering or MoveOrdering(threats=False)
+        self.__book: OpeningBook | None = book
+        self.__limits: SearchLimits = SearchLimits(time_limit=difficulty)
+        self.__checker: LimitChecker = LimitChecker(self.__limits)
         self.__color: int = -1
         self.__weight: int = weight
+        self.__ply: int = 0
+        self.__root_ply: int = 0
+        self.__partial_move: int | None = None
+        self.__info: SearchInfo = SearchInfo()
+        self.__on_iteration: IterationCallback | None = on_iteration
+        self.__parallel: ParallelSearch | None = (
+            ParallelSearch(workers, _search_root_move, weight) if workers > 1 else None
+        )
+        self.__ponderer: Ponderer | None = None
+
+    @property
+    def info(self) -> SearchInfo:
+        """
+        Statistics of last search.
+        """
+
+        return self.__info
+
+    @property
+    def nodes(self) -> int:
+        """
+        Number of positions visited by last search.
+        """
+
+        return self.__info.nodes
+
+    @property
+    def depth(self) -> int:
+        """
+        Deepest completed iteration of last search.
+        """
+
+        return self.__info.depth
+
+    @property
+    def pondering(self) -> bool:
+        """
+        Whether pondering search is running in background.
+        """
+
+        return self.__ponderer is not None and self.__ponderer.running
+
+    def close(self) -> None:
+        """
+        Stops pondering and shuts down worker processes of parallel search.
+        """
+
+        self.stop_pondering()
+
+        if self.__parallel is not None:
+            self.__parallel.close()
 
     def add_move(self, move: str) -> None:
+        """
+        Adds move to position. The first move after pondering decides whether
+        the prediction was hit, any later move makes the result of pondering
+        useless.
+        """
+
+        if self.__ponderer is not None and self.__ponderer.stopped:
+            self.__ponderer = None
+        elif self.__ponderer is not None:
+            self.__ponderer.stop(int(move))
+
         self.__judge.add_move(move)
 
-    def get_best_move(self) -> str:
-        if len(self.__judge.get_all_moves()) <= 2:
-            return "3"
+    def ponder(self, limits: SearchLimits | None = None) -> None:
+        """
+        Starts searching in background thread while opponent is thinking.
+
+        The reply predicted by principal variation of last search is played
+        before searching. If there is no prediction, the current position is
+        searched, which covers all replies. Transposition table is shared with
+        the pondering search, so its results are reused when the real move
+        arrives. If the prediction was right, time spent pondering is subtracted
+        from time limit of next search.
+
+        Args:
+            limits (SearchLimits | None): Limits of pondering. Defaults to
+                searching until next move is added.
+        """
+
+        self.stop_pondering()
+
+        if self.__judge.is_game_over() != GameState.CONTINUE:
+            return
+
+        moves = [int(move) for move in self.__judge.get_all_moves()]
+        judge = ConnectFourJudge(
+            moves,
+            [column.copy() for column in self.__judge.board],
+            length=self.__judge.length,
+        )
+        variation = self.__info.principal_variation
+        prediction = None
+
+        if len(variation) > 1 and moves and variation[0] == moves[-1]:
+            prediction = variation[1]
+            judge.add_move(str(prediction))
+
+            if judge.is_game_over() != GameState.CONTINUE:
+                judge.remove_last_move()
+                prediction = None
+
+        ordering = self.__ordering
+        engine = ConnectFourEngine(
+            judge=judge,
+            weight=self.__weight,
+            table=self.__table,
+            ordering=MoveOrdering(
+                ordering.hash_move,
+                ordering.threats,
+                ordering.killers,
+                ordering.history,
+                ordering.center_first,
+            ),
+        )
+        self.__ponderer = Ponderer(
+            lambda ponder_limits: engine.search(limits=ponder_limits),
+            prediction,
+            limits or SearchLimits(),
+        )
+
+    def stop_pondering(self) -> None:
+        if self.__ponderer is not None:
+            self.__ponderer.stop()
+            self.__ponderer = None
+
+    def get_best_move(
+        self, max_depth: int | None = None, limits: SearchLimits | None = None
+    ) -> str:
+        return self.search(max_depth, limits).move
+
+    def search(
+        self, max_depth: int | None = None, limits: SearchLimits | None = None
+    ) -> SearchInfo:
+        """
+        Finds best move with iterative deepening and collects statistics of search.
+
+        If search is stopped in the middle of an iteration, best move of the
+        unfinished iteration is used when the best move of previous iteration
+        has already been searched in it.
+
+        Args:
+            max_depth (int | None): Maximum depth of search. Defaults to None.
+            limits (SearchLimits | None): Limits of search. Defaults to time limit
+                of difficulty.
+
+        Returns:
+            SearchInfo: Best move, completed iterations and reason for stopping.
+        """
+
+        start_time = time.perf_counter()
+        limits = limits or self.__limits
+
+        if max_depth is not None:
+            limits = limits._replace(depth=max_depth)
+
+        ponder_result, limits = self.__use_pondering(limits)
+
+        if ponder_result is not None:
+            self.__info = ponder_result
+            return ponder_result
 
-        self.__color = len(self.__judge.get_all_moves()) % 2 + 1
-        depth = 1
-        best_move = self.__judge.get_valid_moves()[0]
-        self.__start_time = time.process_time()
+        book_move = (
+            self.__book.get_move(self.__judge.bitboard)
+            if self.__book is not None
+            else None
+        )
+
+        if book_move is not None:
+            self.__info = SearchInfo(str(book_move), StopReason.BOOK)
+        elif self.__judge.ply <= 2:
+            self.__info = SearchInfo(
+                str(center_first_columns(self.__judge.bitboard.width)[0]),
+                StopReason.OPENING,
+            )
+        elif self.__parallel is not None:
+            self.__info = self.__search_in_parallel(limits)
+        else:
+            self.__info = SearchInfo()
+            self.__iterative_deepening(limits, start_time)
+
+        self.__info.time = time.perf_counter() - start_time
+
+        return self.__info
+
+    async def get_best_move_async(
+        self,
+        max_depth: int | None = None,
+        limits: SearchLimits | None = None,
+        scheduler: EngineScheduler | None = None,
+    ) -> str:
+        return (await self.search_async(max_depth, limits, scheduler)).move
+
+    async def search_async(
+        self,
+        max_depth: int | None = None,
+        limits: SearchLimits | None = None,
+        scheduler: EngineScheduler | None = None,
+    ) -> SearchInfo:
+        """
+        Runs search in a thread of scheduler without blocking the event loop.
+
+        Moves must not be added to the engine while the search is running.
+
+        Args:
+            max_depth (int | None): Maximum depth of search. Defaults to None.
+            limits (SearchLimits | None): Limits of search, deadline also limits
+                time spent waiting in queue. Defaults to time limit of difficulty.
+            scheduler (EngineScheduler | None): Scheduler to run search in.
+                Defaults to scheduler shared by all engines.
+
+        Raises:
+            EngineBusy: If queue of scheduler is full.
+            TimeoutError: If deadline passed before search was started.
+
+        Returns:
+            SearchInfo: Best move, completed iterations and reason for stopping.
+        """
+
+        scheduler = scheduler or get_default_scheduler()
+
+        return await scheduler.run(
+            self,
+            lambda search_limits: self.search(max_depth, search_limits),
+            limits or self.__limits,
+        )
+
+    def evaluate(self, depth: int, limits: SearchLimits | None = None) -> float | None:
+        """
+        Searches current position to given depth.
+
+        Args:
+            depth (int): Depth of search.
+            limits (SearchLimits | None): Limits of search. Defaults to time
+                limit of difficulty.
+
+        Returns:
+            float | None: Evaluation for player who made the last move,
+            None if search ran out of time.
+        """
+
+        self.__ply = self.__root_ply = self.__judge.ply
+        self.__color = 2 - self.__ply % 2
+        self.__info = SearchInfo()
+        self.__checker = LimitChecker(limits or self.__limits)
+        self.__table.new_search()
+        self.__ordering.new_search()
+
+        try:
+            return self.__min_max(depth, False)[1]
+        except SearchStopped:
+            return None
+
+    def get_random_move(self, generator: random.Random | None = None) -> str:
+        """
+        Returns random valid move. Moves that let the opponent win right away are
+        avoided unless all moves do.
+
+        Args:
+            generator (random.Random | None): Source of randomness. Defaults to
+                module random.
+
+        Returns:
+            str: Random move.
+        """
+
+        moves = self.__judge.get_valid_moves()
+        losing = self.__judge.bitboard.columns(
+            self.__judge.threats(self.__judge.ply % 2 + 1).losing
+        )
+        safe_moves = [move for move in moves if move not in losing] or moves
+
+        return str((generator or random).choice(safe_moves))
+
+    def __use_pondering(
+        self, limits: SearchLimits
+    ) -> tuple[SearchInfo | None, SearchLimits]:
+        """
+        Stops pondering. If opponent played the predicted move, returns result of
+        pondering when it is good enough, otherwise limits with time spent
+        pondering subtracted.
+        """
+
+        ponderer, self.__ponderer = self.__ponderer, None
+
+        if ponderer is None:
+            return None, limits
+
+        ponderer.stop()
+        result = ponderer.result
+
+        if not ponderer.hit or result is None or not result.move:
+            return None, limits
+
+        time_left = (
+            None
+            if limits.time_limit is None
+            else int(limits.time_limit - result.time * 1000)
+        )
+
+        if (
+            ponderer.finished()
+            or (time_left is not None and time_left <= 0)
+            or (limits.depth is not None and result.depth >= limits.depth)
+        ):
+            result.stop_reason = StopReason.PONDER_HIT
+            return result, limits
+
+        return None, limits._replace(time_limit=time_left)
+
+    def __iterative_deepening(self, limits: SearchLimits, start_time: float) -> None:
+        info = self.__info
+        self.__ply = self.__root_ply = self.__judge.ply
+        self.__color = self.__ply % 2 + 1
+        info.move = str(self.__judge.get_valid_moves()[0])
+        self.__checker = LimitChecker(limits)
+        self.__table.new_search()
+        self.__ordering.new_search()
+
+        for depth in range(1, self.__cells() + 1 - self.__ply):
+            if limits.depth is not None and depth > limits.depth:
+                info.stop_reason = StopReason.MAX_DEPTH
+                return
+
+            reason = self.__checker.stop_reason(info.nodes)
+
+            if reason is None and not self.__next_iteration_fits():
+                reason = StopReason.TIMEOUT
+
+            if reason is not None:
+                info.stop_reason = reason
+                return
 
-        while not self.__is_timeout():
             try:
-                best_move = self.__min_max(depth, True)[0]
-            except TimeoutError:
+                best_move, value = self.__aspiration_search(depth)
+            except SearchStopped as stopped:
+                info.stop_reason = stopped.reason
+
+                if self.__partial_move is not None:
+                    info.move = str(self.__partial_move)
+
+                return
+
+            info.move = str(best_move)
+            self.__complete_iteration(depth, value, start_time)
+
+            if depth == 1 and len(self.__get_moves(None)) == 1:
+                info.stop_reason = StopReason.CRITICAL_MOVE
+                return
+
+        info.stop_reason = StopReason.END_OF_GAME
+
+    def __aspiration_search(self, depth: int) -> tuple[int | None, float]:
+        """
+        Searches root with aspiration window around value of iteration two plies
+        shallower. Values of wins and losses are not used as center of the
+        window. Best move found so far is kept when the window is widened, so
+        it can be played if the iteration does not finish.
+        """
+
+        iterations = self.__info.iterations
+        previous = iterations[-2].value if len(iterations) >= 2 else INFINITY
+        delta = self.ASPIRATION_WINDOW
+        alpha, beta = -INFINITY, INFINITY
+
+        if abs(previous) < self.ASPIRATION_LIMIT:
+            alpha, beta = previous - delta, previous + delta
+
+        self.__partial_move = None
+
+        while True:
+            best_move, value = self.__min_max(depth, True, alpha, beta)
+
+            if alpha < value < beta:
+                return best_move, value
+
+            delta *= 4
+
+            if value <= alpha:
+                alpha = value - delta if delta <= self.ASPIRATION_LIMIT else -INFINITY
+            else:
+                beta = value + delta if delta <= self.ASPIRATION_LIMIT else INFINITY
+
+    def __next_iteration_fits(self) -> bool:
+        """
+        Estimates if next iteration ends before deadline. Odd and even depths
+        grow at different rates, so nodes of next iteration are predicted from
+        the iteration two plies shallower, scaled by growth over the last two
+        plies. Nodes are converted to time with speed of the whole search, since
+        durations of short iterations are mostly noise.
+        """
+
+        iterations = self.__info.iterations
+
+        if len(iterations) < 4 or iterations[-1].time <= 0:
+            return True
+
+        nodes = [
+            current.nodes - previous.nodes
+            for previous, current in zip(iterations[-4:], iterations[-3:])
+        ]
+        growth = nodes[2] / max(nodes[0], 1)
+        estimate = max(nodes[1] * max(growth, 1), nodes[2])
+        estimate *= iterations[-1].time / iterations[-1].nodes
+
+        return estimate < self.__checker.time_left()
+
+    def __complete_iteration(self, depth: int, value: float, start_time: float) -> None:
+        iteration = self.__info.add_iteration(
+            depth,
+            value,
+            time.perf_counter() - start_time,
+            self.__principal_variation(depth),
+        )
+
+        if self.__on_iteration is not None:
+            self.__on_iteration(iteration)
+
+    def __principal_variation(self, depth: int) -> list[int]:
+        """
+        Follows best moves stored in transposition table from current position.
+        """
+
+        variation = []
+
+        while (
+            len(variation) < depth and self.__judge.is_game_over() == GameState.CONTINUE
+        ):
+            key, mirrored = self.__judge.canonical_hash
+            entry = self.__table.get(key)
+
+            if entry is None or entry.move is None:
                 break
 
-            if (
-                depth == 1
-                and self.__is_critical_move(str(best_move))
-                or depth + len(self.__judge.get_all_moves()) >= 42
-            ):
+            move = (
+                self.__judge.bitboard.mirror_column(entry.move)
+                if mirrored
+                else entry.move
+            )
+
+            if not self.__judge.bitboard.can_play(move):
                 break
 
-            depth += 1
+            variation.append(move)
+            self.__judge.add_move(str(move))
+
+        for _ in variation:
+            self.__judge.remove_last_move()
+
+        return variation
+
+    def __search_in_parallel(self, limits: SearchLimits) -> SearchInfo:
+        """
+        Searches root moves in worker processes.
+        """
+
+        bitboard = self.__judge.bitboard
+        color = self.__judge.ply % 2 + 1
 
-        return str(best_move)
+        for threats in (self.__judge.threats(color), self.__judge.threats(3 - color)):
+            if threats.immediate:
+                move = bitboard.columns(threats.immediate & -threats.immediate)[0]
+                return SearchInfo(str(move), StopReason.CRITICAL_MOVE)
 
-    def get_random_move(self) -> str:
-        move = str(random.choice(self.__judge.get_valid_moves()))
-        return move
+        valid_moves = self.__judge.get_valid_moves()
 
-    def __is_timeout(self) -> bool:
-        time_used = (time.process_time() - self.__start_time) * 1000
-        return time_used >= self.__difficulty
+        root_moves = [
+            move
+            for move in center_first_columns(self.__judge.bitboard.width)
+            if move in valid_moves
+            and (
+                not self.__judge.is_symmetric()
+                or move <= self.__judge.bitboard.mirror_column(move)
+            )
+        ]
 
-    def __is_critical_move(self, move: str) -> bool:
-        return self.__judge.check_win(move) or self.__judge.check_lose(move)
+        return self.__parallel.search(
+            self.__judge, root_moves, limits, self.__on_iteration
+        )
 
     def __min_max(
         self,
@@ -70,6 +553,13 @@ class ConnectFourEngine:
         """
         Function that performs Minmax algorithm as DFS and returns the evaluation of last move.
 
+        Results are stored in transposition table relative to the player to move,
+        shared by position and its mirror image. In symmetric positions only
+        moves on one half of the board are searched.
+        Wins and losses are scaled by the number of moves left in the game instead
+        of the remaining depth, so that values searched to different depths are
+        comparable.
+
         Args:
             move (int): Move to evaluate.
             depth (int): Maximum depth of DFS.
@@ -81,43 +571,225 @@ class ConnectFourEngine:
             int: Evaluation of last move.
         """
 
-        if self.__is_timeout():
-            raise TimeoutError
+        self.__info.nodes += 1
+
+        if self.__info.nodes >= self.__checker.next_check:
+            self.__checker.check(self.__info.nodes)
+
+        if self.__judge.is_game_over() != GameState.CONTINUE:
+            return None, self.__terminal_value()
+
+        if depth == 0:
+            return None, self.__judge.analyze(self.__color)
+
+        lower, upper, cached_move = self.__probe(depth, maximizing)
 
-        if self.__judge.is_game_over() != GameState.CONTINUE or depth == 0:
-            return None, self.__weight**depth * self.__judge.analyze(self.__color)
+        if lower >= beta or upper <= alpha or lower == upper:
+            return cached_move, upper if upper <= alpha else lower
 
+        alpha, beta = max(alpha, lower), min(beta, upper)
+        sign = 1 if maximizing else -1
+        window = (alpha, beta) if maximizing else (-beta, -alpha)
         best_move = None
+        best_value = -sign * INFINITY
 
-        if maximizing:
-            best_value = -INFINITY
+        for index, next_move in enumerate(self.__get_moves(cached_move)):
+            new_value = self.__search_child(
+                next_move, depth - 1, maximizing, alpha, beta, first=index == 0
+            )
+
+            if sign * new_value > sign * best_value:
+                best_value = new_value
+                best_move = next_move
 
-            for next_move in self.__judge.get_valid_moves():
-                self.__judge.add_move(str(next_move))
-                new_value = self.__min_max(depth - 1, False, alpha, beta)[1]
-                self.__judge.remove_last_move()
+            if self.__ply == self.__root_ply and (
+                self.__partial_move is not None or next_move == cached_move
+            ):
+                self.__partial_move = best_move
 
-                if new_value > best_value:
-                    best_value = new_value
-                    best_move = next_move
+            if maximizing:
                 alpha = max(alpha, best_value)
+            else:
+                beta = min(beta, best_value)
+
+            if alpha >= beta:
+                self.__info.cutoffs += 1
+                self.__ordering.record_cutoff(
+                    next_move, self.__ply % 2 + 1, self.__ply, depth
+                )
+                break
+
+        self.__store(depth, sign * best_value, window, best_move)
 
-                if alpha >= beta:
-                    break
+        return best_move, best_value
+
+    def __search_child(
+        self,
+        move: int,
+        depth: int,
+        maximizing: bool,
+        alpha: float,
+        beta: float,
+        *,
+        first: bool,
+    ) -> float:
+        """
+        Principal variation search. The first move is searched with the full
+        window and the others with a null window, which only shows whether they
+        are better than the best move so far. Values are integers, so a window
+        of width 1 is enough. Moves that turn out better are searched again with
+        the full window.
+        """
+
+        if first or beta - alpha <= 1:
+            return self.__search_move(move, depth, maximizing, alpha, beta)
+
+        if maximizing:
+            value = self.__search_move(move, depth, maximizing, alpha, alpha + 1)
         else:
-            best_value = INFINITY
+            value = self.__search_move(move, depth, maximizing, beta - 1, beta)
 
-            for next_move in self.__judge.get_valid_moves():
-                self.__judge.add_move(str(next_move))
-                new_value = self.__min_max(depth - 1, True, alpha, beta)[1]
-                self.__judge.remove_last_move()
+        if alpha < value < beta:
+            value = self.__search_move(move, depth, maximizing, alpha, beta)
 
-                if new_value < best_value:
-                    best_value = new_value
-                    best_move = next_move
-                beta = min(beta, best_value)
+        return value
 
-                if alpha >= beta:
-                    break
+    def __search_move(
+        self, move: int, depth: int, maximizing: bool, alpha: float, beta: float
+    ) -> float:
+        """
+        Evaluates move, which is always taken back even if search is stopped.
+        """
 
-        return best_move, best_value
+        self.__judge.add_move(str(move))
+        self.__ply += 1
+
+        try:
+            return self.__min_max(depth, not maximizing, alpha, beta)[1]
+        finally:
+            self.__ply -= 1
+            self.__judge.remove_last_move()
+
+    def __get_moves(self, hash_move: int | None) -> list[int]:
+        """
+        Returns moves to search in order. If player to move can win or must block,
+        only that move is returned. Moves under winning cells of the opponent are
+        left out unless all moves are such.
+        """
+
+        bitboard = self.__judge.bitboard
+        color = self.__ply % 2 + 1
+        own = self.__judge.threats(color)
+
+        if own.immediate:
+            return bitboard.columns(own.immediate & -own.immediate)
+
+        opponent = self.__judge.threats(3 - color)
+
+        if opponent.immediate:
+            return bitboard.columns(opponent.immediate & -opponent.immediate)
+
+        moves = self.__ordering.order(bitboard, color, self.__ply, hash_move)
+
+        if own.losing:
+            losing = bitboard.columns(own.losing)
+            moves = [move for move in moves if move not in losing] or moves
+
+        if self.__judge.is_symmetric():
+            return [move for move in moves if move <= bitboard.mirror_column(move)]
+
+        return moves
+
+    def __cells(self) -> int:
+        return self.__judge.bitboard.width * self.__judge.bitboard.height
+
+    def __terminal_value(self) -> float:
+        moves_left = self.__cells() - self.__judge.ply
+
+        return self.__weight**moves_left * self.__judge.analyze(self.__color)
+
+    def __probe(self, depth: int, maximizing: bool) -> tuple[float, float, int | None]:
+        """
+        Looks up bounds of evaluation of current position from transposition table.
+        Best move is returned also from entries of shallower searches.
+
+        Args:
+            depth (int): Depth of search below position.
+            maximizing (bool): Whether position is evaluated for maximizing player.
+
+        Returns:
+            tuple[float, float, int | None]: Lower bound, upper bound and best move.
+        """
+
+        key, mirrored = self.__judge.canonical_hash
+        entry = self.__table.get(key)
+
+        if entry is None:
+            return -INFINITY, INFINITY, None
+
+        move = entry.move
+
+        if mirrored and move is not None:
+            move = self.__judge.bitboard.mirror_column(move)
+
+        if entry.depth < depth:
+            return -INFINITY, INFINITY, move
+
+        self.__info.table_hits += 1
+        lower = entry.value if entry.bound != Bound.UPPER else -INFINITY
+        upper = entry.value if entry.bound != Bound.LOWER else INFINITY
+
+        if maximizing:
+            return lower, upper, move
+
+        return -upper, -lower, move
+
+    def __store(
+        self,
+        depth: int,
+        value: float,
+        window: tuple[float, float],
+        move: int | None,
+    ) -> None:
+        key, mirrored = self.__judge.canonical_hash
+        bound = Bound.EXACT
+
+        if mirrored and move is not None:
+            move = self.__judge.bitboard.mirror_column(move)
+
+        if value <= window[0]:
+            bound = Bound.UPPER
+        elif value >= window[1]:
+            bound = Bound.LOWER
+
+        self.__table.store(key, depth, value, bound, move)
+
+
+@cache
+def _worker_table() -> TranspositionTable:
+    """
+    Returns transposition table kept by worker process between tasks.
+    """
+
+    return TranspositionTable()
+
+
+def _search_root_move(
+    position: Position, move: int, depth: int, limits: SearchLimits, weight: int
+) -> TaskResult:
+    """
+    Searches root move of parallel search in worker process. Search also stops
+    when the process that owns the pool stops the search.
+
+    Returns:
+        TaskResult: Evaluation of move, None if search was stopped, and visited
+        nodes, cutoffs and table hits.
+    """
+
+    moves, board, length = position
+    judge = ConnectFourJudge(moves, board, length=length)
+    judge.add_move(str(move))
+    engine = ConnectFourEngine(judge=judge, weight=weight, table=_worker_table())
+    value = engine.evaluate(depth, worker_limits(limits))
+
+    return value, engine.info.nodes, engine.info.cutoffs, engine.info.table_hits
@@ -1,49 +1,25 @@
 from functools import cache
+from typing import Any
 
 from connect_four_lib.config import HEURISTIC_BASE, MAX_HEURISTIC
+from connect_four_lib.evaluation_cache import EvaluationCache
+from connect_four_lib.winning_lines import get_winning_lines
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 
 class ConnectFourHeuristic:
-    @cache
-    @staticmethod
-    def __get_point(column: int, row: int, board: list[list[int]]) -> int:
-        if not 0 <= column < len(board) or not 0 <= row < len(board[0]):
-            return -1
+    """
+    Evaluates boards by scoring every window of four cells.
 
-        return board[column][row]
+    Evaluations of ``evaluate`` are memoized in a bounded EvaluationCache keyed
+    by the packed board, shared by default through ``evaluation_cache``.
+    """
 
-    @staticmethod
-    def __get_windows(
-        column: int, row: int, board: tuple[tuple[int, ...], ...]
-    ) -> list[int]:
-        windows = []
-
-        windows.append(
-            tuple(
-                ConnectFourHeuristic.__get_point(column, row + i, board)
-                for i in range(4)
-            )
-        )
-        windows.append(
-            tuple(
-                ConnectFourHeuristic.__get_point(column + i, row, board)
-                for i in range(4)
-            )
-        )
-        windows.append(
-            tuple(
-                ConnectFourHeuristic.__get_point(column + i, row + i, board)
-                for i in range(4)
-            )
-        )
-        windows.append(
-            tuple(
-                ConnectFourHeuristic.__get_point(column + i, row - i, board)
-                for i in range(4)
-            )
-        )
-
-        return windows
+    evaluation_cache: EvaluationCache = EvaluationCache()
 
     @cache
     @staticmethod
@@ -53,34 +29,225 @@ class ConnectFourHeuristic:
 
         evaluation = 0
 
-        if points == 4:
+        if points == len(window):
             return MAX_HEURISTIC
 
-        if points + empty_points == 4:
+        if points + empty_points == len(window):
             evaluation = HEURISTIC_BASE**points
 
         return evaluation
 
     @staticmethod
-    def evaluate(board: list[list[int]], color: int) -> int:
-        windows = []
-        hashable_board = tuple(tuple(column) for column in board)
-
-        for column in range(len(board)):
-            for row in range(len(board[0])):
-                windows.extend(
-                    ConnectFourHeuristic.__get_windows(column, row, hashable_board)
+    def evaluate(
+        board: list[list[int]],
+        color: int,
+        evaluation_cache: EvaluationCache | None = None,
+        length: int = 4,
+    ) -> int:
+        """
+        Evaluates board for given color.
+
+        Args:
+            board (list[list[int]]): Board as list of columns, bottom cell first.
+            color (int): Color to evaluate board for.
+            evaluation_cache (EvaluationCache | None): Cache of evaluations. Defaults to
+                ConnectFourHeuristic.evaluation_cache.
+            length (int): Number of connected pieces needed to win. Defaults to 4.
+
+        Returns:
+            int: Evaluation of board.
+        """
+
+        if evaluation_cache is None:
+            evaluation_cache = ConnectFourHeuristic.evaluation_cache
+
+        key = ConnectFourHeuristic.position_key(board, length)
+        evaluation = evaluation_cache.get(key)
+
+        if evaluation is None:
+            evaluation = ConnectFourHeuristic.clamp(
+                sum(
+                    ConnectFourHeuristic._evaluate_window(window, 1)
+                    - ConnectFourHeuristic._evaluate_window(window, 2)
+                    for window in (
+                        tuple(board[column][row] for column, row in line)
+                        for line in get_winning_lines(
+                            len(board), len(board[0]), length
+                        ).lines
+                    )
                 )
+            )
+            evaluation_cache.put(key, evaluation)
+
+        return evaluation if color == 1 else -evaluation
+
+    @staticmethod
+    def position_key(board: list[list[int]], length: int = 4) -> tuple[int, int, int]:
+        """
+        Packs board to integer with one base 3 digit per cell.
+
+        Returns:
+            tuple[int, int, int]: Width of board, length of winning lines and
+            cells packed after a leading 1, which keeps boards of different sizes
+            apart.
+        """
+
+        packed = 1
+
+        for column in board:
+            for cell in column:
+                packed = packed * 3 + cell
+
+        return len(board), length, packed
+
+    @cache
+    @staticmethod
+    def __batch_tables(width: int, height: int, length: int) -> tuple[Any, Any]:
+        """
+        Returns cells of winning lines as indices of flattened board, and scores of
+        windows indexed by number of own pieces and number of empty cells.
+        """
+
+        lines = get_winning_lines(width, height, length)
+        cells = np.array(
+            [[column * height + row for column, row in line] for line in lines.lines],
+            dtype=np.intp,
+        ).reshape(-1, length)
+        scores = np.zeros((length + 1, length + 1), dtype=np.int64)
+
+        for own in range(length + 1):
+            for empty in range(length + 1 - own):
+                window = (1,) * own + (0,) * empty + (2,) * (length - own - empty)
+                scores[own, empty] = ConnectFourHeuristic._evaluate_window(window, 1)
+
+        return cells, scores
 
-        evaluation = sum(
-            ConnectFourHeuristic._evaluate_window(window, color)
-            - ConnectFourHeuristic._evaluate_window(window, 3 - color)
-            for window in windows
+    @staticmethod
+    def evaluate_batch(boards: Any, color: int, length: int = 4) -> Any:
+        """
+        Evaluates many boards at once with NumPy, without looping over boards
+        in Python. Results are equal to evaluate.
+
+        Args:
+            boards (numpy.ndarray): Boards in array of shape (N, width, height),
+                column-major like boards of evaluate.
+            color (int): Color to evaluate boards for.
+            length (int): Number of connected pieces needed to win. Defaults to 4.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Returns:
+            numpy.ndarray: Evaluations of boards in array of shape (N,).
+        """
+
+        if np is None:
+            raise ImportError("evaluate_batch requires numpy")
+
+        boards = np.asarray(boards, dtype=np.int8)
+        count, width, height = boards.shape
+        cells, scores = ConnectFourHeuristic.__batch_tables(width, height, length)
+        windows = boards.reshape(count, width * height)[:, cells]
+
+        empty = np.count_nonzero(windows == 0, axis=2)
+        own = np.count_nonzero(windows == color, axis=2)
+        opponent = np.count_nonzero(windows == 3 - color, axis=2)
+        evaluation = (scores[own, empty] - scores[opponent, empty]).sum(axis=1)
+
+        return np.where(
+            evaluation >= 5000,
+            MAX_HEURISTIC,
+            np.where(evaluation <= -5000, -MAX_HEURISTIC, evaluation),
+        )
+
+    @cache
+    @staticmethod
+    def line_scores(length: int) -> tuple[tuple[int, ...], ...]:
+        """
+        Returns scores of lines for first player indexed by number of pieces of
+        first and second player, built once per length.
+        """
+
+        return tuple(
+            tuple(
+                ConnectFourHeuristic._evaluate_window(window, 1)
+                - ConnectFourHeuristic._evaluate_window(window, 2)
+                for window in (
+                    (1,) * first + (2,) * second + (0,) * (length - first - second)
+                    for second in range(length + 1 - first)
+                )
+            )
+            for first in range(length + 1)
         )
 
+    @staticmethod
+    def clamp(evaluation: int) -> int:
         if evaluation >= 5000:
-            evaluation = MAX_HEURISTIC
-        elif evaluation <= -5000:
-            evaluation = -MAX_HEURISTIC
+            return MAX_HEURISTIC
+
+        if evaluation <= -5000:
+            return -MAX_HEURISTIC
 
         return evaluation
+
+
+class IncrementalHeuristic:
+    """
+    Keeps evaluation of board up to date while pieces are added and removed.
+
+    Every winning line stores how many pieces of each color it contains, so that
+    a move only rescores the lines going through its cell.
+    Evaluations are equal to ConnectFourHeuristic.evaluate.
+    """
+
+    def __init__(self, board: list[list[int]], length: int = 4) -> None:
+        lines = get_winning_lines(len(board), len(board[0]), length)
+
+        self.__height: int = len(board[0])
+        self.__cell_lines: list[list[int]] = lines.cell_lines
+        self.__counts: list[list[int]] = [
+            [],
+            [0] * len(lines.lines),
+            [0] * len(lines.lines),
+        ]
+        self.__scores: tuple[tuple[int, ...], ...] = ConnectFourHeuristic.line_scores(
+            length
+        )
+        self.__score: int = 0
+
+        for column, cells in enumerate(board):
+            for row, color in enumerate(cells):
+                if color in (1, 2):
+                    self.add(column, row, color)
+
+    def add(self, column: int, row: int, color: int) -> None:
+        self.__update(column, row, color, 1)
+
+    def remove(self, column: int, row: int, color: int) -> None:
+        self.__update(column, row, color, -1)
+
+    def evaluate(self, color: int) -> int:
+        """
+        Returns evaluation of current board in O(1).
+
+        Args:
+            color (int): Color to evaluate board for.
+
+        Returns:
+            int: Evaluation of board.
+        """
+
+        if color == 1:
+            return ConnectFourHeuristic.clamp(self.__score)
+
+        return ConnectFourHeuristic.clamp(-self.__score)
+
+    def __update(self, column: int, row: int, color: int, change: int) -> None:
+        first, second = self.__counts[1], self.__counts[2]
+        counts = self.__counts[color]
+        scores = self.__scores
+
+        for window in self.__cell_lines[column * self.__height + row]:
+            self.__score -= scores[first[window]][second[window]]
+            counts[window] += change
+            self.__score += scores[first[window]][second[window]]
@@ -1,36 +1,120 @@
 from duo_game_lib.game_state import GameState
 from duo_game_lib.judge import Judge
 
-from connect_four_lib.connect_four_heuristic import ConnectFourHeuristic
+from connect_four_lib.bitboard import BitBoard
+from connect_four_lib.connect_four_heuristic import IncrementalHeuristic
 from connect_four_lib.point import Point
+from connect_four_lib.threats import Threats, ThreatTracker
+from connect_four_lib.winning_lines import WinningLines, get_winning_lines
 
 
 class ConnectFourJudge(Judge):
+    """
+    Rules of connect-N on a board of any size, connect four on 7x6 by default.
+
+    Size of the board is taken from ``board`` when it is given. Ply, heights of
+    columns, playable columns and state of the game are kept up to date by
+    ``add_move`` and ``remove_last_move``, so querying them is O(1).
+    """
+
     def __init__(
         self,
         moves: list[int] | None = None,
         board: list[list[int]] | None = None,
+        *,
+        width: int = 7,
+        height: int = 6,
+        length: int = 4,
     ) -> None:
-        self.__board: list[list[int]] = board or [([0] * 6) for i in range(7)]
+        self.__board: list[list[int]] = board or [([0] * height) for i in range(width)]
         self.__moves: list[int] = moves or []
+        self.__bitboard: BitBoard = BitBoard.from_board(self.__board, length)
+        self.__heuristic: IncrementalHeuristic = IncrementalHeuristic(
+            self.__board, length
+        )
+        self.__lines: WinningLines = get_winning_lines(
+            len(self.__board), len(self.__board[0]), length
+        )
+        self.__threats: ThreatTracker = ThreatTracker(self.__bitboard)
+        self.__cells: int = len(self.__board) * len(self.__board[0])
+        self.__heights: list[int] = [
+            self.__bitboard.column_height(column) for column in range(len(self.__board))
+        ]
+        self.__valid_mask: int = sum(
+            1 << column
+            for column in range(len(self.__board))
+            if self.__bitboard.can_play(column)
+        )
+        self.__states: list[GameState] = [self.__scan_state()]
 
     @property
     def board(self) -> list[list[int]]:
         return self.__board
 
+    @property
+    def bitboard(self) -> BitBoard:
+        return self.__bitboard
+
+    @property
+    def length(self) -> int:
+        """
+        Number of connected pieces needed to win.
+        """
+
+        return self.__bitboard.length
+
+    @property
+    def ply(self) -> int:
+        """
+        Number of moves played.
+        """
+
+        return len(self.__moves)
+
+    @property
+    def heights(self) -> list[int]:
+        """
+        Number of pieces in every column. Must not be modified.
+        """
+
+        return self.__heights
+
+    @property
+    def valid_mask(self) -> int:
+        """
+        Playable columns as bits, bit ``1 << column`` set if column is not full.
+        """
+
+        return self.__valid_mask
+
+    @property
+    def hash(self) -> int:
+        return self.__bitboard.hash
+
+    @property
+    def canonical_hash(self) -> tuple[int, bool]:
+        """
+        Hash shared by position and its mirror image, and whether the position
+        is the mirrored one. Moves of mirrored positions must be mirrored back
+        with ``BitBoard.mirror_column``.
+        """
+
+        return self.__bitboard.canonical_hash()
+
+    def is_symmetric(self) -> bool:
+        return self.__bitboard.is_symmetric()
+
     def get_last_move(self) -> tuple[int, int] | None:
         if not self.__moves:
             return None
 
-        last_move = None
         column = self.__moves[-1]
+        row = self.__heights[column] - 1
 
-        for row in range(len(self.__board[column]) - 1, -1, -1):
-            if self.__board[column][row] != 0:
-                last_move = (column, row)
-                break
+        if row < 0:
+            return None
 
-        return last_move
+        return (column, row)
 
     def validate(self, move: str) -> GameState:
         state = GameState.CONTINUE
@@ -43,22 +127,31 @@ class ConnectFourJudge(Judge):
         return state
 
     def is_game_over(self) -> GameState:
-        state = GameState.CONTINUE
-        if self.__is_draw():
-            return GameState.DRAW
-
-        if self.__is_win():
-            return GameState.WIN
-
-        return state
+        return self.__states[-1]
 
     def add_move(self, move: str) -> Point:
         column = int(move)
-        point = self.__get_position_of_move(move)
+        color = len(self.__moves) % 2 + 1
+        row = self.__bitboard.play(column, color)
+        wins = self.__bitboard.masks[color] & self.__threats.winning(color)
 
-        self.__board[point.y][point.x] = (len(self.__moves)) % 2 + 1
+        self.__board[column][row] = color
+        self.__heuristic.add(column, row, color)
+        self.__threats.add(color)
         self.__moves.append(column)
-        return point
+        self.__heights[column] = row + 1
+
+        if row + 1 == len(self.__board[column]):
+            self.__valid_mask &= ~(1 << column)
+
+        if self.__is_draw():
+            self.__states.append(GameState.DRAW)
+        elif wins:
+            self.__states.append(GameState.WIN)
+        else:
+            self.__states.append(GameState.CONTINUE)
+
+        return Point(row, column)
 
     def remove_last_move(self) -> tuple[int, int]:
         move = self.get_last_move()
@@ -67,6 +160,12 @@ class ConnectFourJudge(Judge):
             raise IndexError
 
         self.__moves.pop()
+        self.__states.pop()
+        self.__heights[move[0]] = move[1]
+        self.__valid_mask |= 1 << move[0]
+        self.__bitboard.undo(move[0])
+        self.__threats.remove()
+        self.__heuristic.remove(move[0], move[1], self.__board[move[0]][move[1]])
         self.__board[move[0]][move[1]] = 0
 
         return move
@@ -78,13 +177,15 @@ class ConnectFourJudge(Judge):
         if self.__is_draw():
             return 0
 
-        return ConnectFourHeuristic.evaluate(self.__board, color)
+        return self.__heuristic.evaluate(color)
 
     def get_all_moves(self) -> list[str]:
         return [str(move) for move in self.__moves]
 
     def get_valid_moves(self) -> list[int]:
-        return [move for move in range(7) if self.__check_illegal_move(move)]
+        valid_mask = self.__valid_mask
+
+        return [move for move in range(len(self.__board)) if valid_mask >> move & 1]
 
     def __check_valid_move(self, move: str) -> bool:
         move_int = -1
@@ -93,41 +194,36 @@ class ConnectFourJudge(Judge):
         except ValueError:
             return False
 
-        if not 0 <= move_int <= len(self.__board):
+        if not 0 <= move_int < len(self.__board):
             return False
 
         return True
 
     def __check_illegal_move(self, move: int) -> bool:
-        if self.__board[move][-1] != 0:
-            return False
-
-        return True
+        return self.__bitboard.can_play(move)
 
     def __is_draw(self) -> bool:
-        return len(self.__moves) >= 42
+        return len(self.__moves) >= self.__cells
 
-    def __is_win(self, point: Point | None = None, next_color=False) -> bool:
-        directions = [Point(0, 1), Point(1, 0), Point(1, 1), Point(1, -1)]
-        color = self.__calculate_color(next_color)
+    def __scan_state(self) -> GameState:
+        if self.__is_draw():
+            return GameState.DRAW
+
+        if self.__is_win():
+            return GameState.WIN
+
+        return GameState.CONTINUE
+
+    def __is_win(self) -> bool:
         last_move = self.get_last_move()
 
         if not last_move:
             return False
 
-        point = point or Point(last_move[1], last_move[0])
-
-        consecutive_points = [
-            1
-            + self.__count_consecutive_points(point + direction, direction, color)
-            + self.__count_consecutive_points(point - direction, -direction, color)
-            for direction in directions
-        ]
-
-        return max(consecutive_points) >= 4
+        return self.__connects(*last_move, self.__calculate_color(False))
 
     def __calculate_color(self, next_color: bool) -> int:
-        color = (len(self.get_all_moves()) + 1) % 2 + 1
+        color = (len(self.__moves) + 1) % 2 + 1
 
         if next_color:
             color = 3 - color
@@ -135,28 +231,29 @@ class ConnectFourJudge(Judge):
         return color
 
     def check_win(self, move: str) -> bool:
-        return self.__is_win(self.__get_position_of_move(move), False)
+        return self.__is_winning_move(int(move), self.__calculate_color(False))
 
     def check_lose(self, move: str) -> bool:
-        return self.__is_win(self.__get_position_of_move(move), True)
+        return self.__is_winning_move(int(move), self.__calculate_color(True))
 
-    def __get_position_of_move(self, move: str) -> Point:
-        column = int(move)
+    def threats(self, color: int) -> Threats:
+        """
+        Returns threats of given color in current position.
 
-        for row, point in enumerate(self.__board[column]):
-            if point == 0:
-                return Point(row, column)
+        Args:
+            color (int): Color of player.
 
-        return Point(-1, -1)
+        Returns:
+            Threats: Winning, immediate, double threat and losing cells.
+        """
 
-    def __count_consecutive_points(
-        self, point: Point, direction: Point, color: int
-    ) -> int:
-        if (
-            not 0 <= point.x < len(self.__board[0])
-            or not 0 <= point.y < len(self.__board)
-            or self.__board[point.y][point.x] != color
-        ):
-            return 0
+        return self.__threats.threats(color)
+
+    def __is_winning_move(self, column: int, color: int) -> bool:
+        return bool(self.__bitboard.next_bit(column) & self.__threats.winning(color))
+
+    def __connects(self, column: int, row: int, color: int) -> bool:
+        cell = column * len(self.__board[0]) + row
+        mask = self.__bitboard.masks[color] | self.__lines.cell_bits[cell]
 
-        return 1 + self.__count_consecutive_points(point + direction, direction, color)
+        return any(line & mask == line for line in self.__lines.cell_masks[cell])
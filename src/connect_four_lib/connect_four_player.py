@@ -1,30 +1,87 @@
+import random
+from types import TracebackType
+
 from duo_game_lib.player import Player
 
 from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.search_info import IterationInfo
+from connect_four_lib.strength import StrengthLevel, get_level, play_move
 
 
 class ConnectFourPlayer(Player):
-    def __init__(self, elo) -> None:
+    """
+    Player whose strength is the strength level of its Elo. Moves are searched
+    with the node and depth budget of the level, so strength does not depend on
+    hardware and weak players answer almost instantly.
+    """
+
+    def __init__(self, elo: int, ponder: bool = False, seed: int | None = None) -> None:
         super().__init__()
 
-        self.engine: ConnectFourEngine = ConnectFourEngine()
+        self.engine: ConnectFourEngine = ConnectFourEngine(
+            on_iteration=self.__log_iteration
+        )
         self.elo: int = elo
+        self.level: StrengthLevel = get_level(elo)
+        self.ponder: bool = ponder
+        self.__generator: random.Random = random.Random(seed)
+        self.__all_logs: list[str] = []
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool | None:
+        self.engine.close()
+
+        return super().__exit__(exc_type, exc_value, traceback)
 
     def play(self, move: str) -> str:
         if move:
             self.engine.add_move(move)
 
-        new_move = self.engine.get_best_move()
+        new_move = play_move(
+            self.engine, self.level.limits, self.level.randomness, self.__generator
+        )
+        self.__log(str(self.engine.info))
+
+        if new_move != self.engine.info.move:
+            self.__log(f"random move {new_move}")
 
         if not new_move:
             new_move = self.engine.get_random_move()
             print("random move")
 
         self.engine.add_move(new_move)
+
+        if self.ponder:
+            self.engine.ponder(self.level.limits)
+
         return new_move
 
     def get_and_reset_current_logs(self) -> str:
-        return ""
+        """
+        Returns search logs written since previous call.
+        """
+
+        return self.pop_logs()
 
     def get_and_reset_all_logs(self) -> str:
-        return ""
+        """
+        Returns all search logs written since previous call, also those already
+        returned by get_and_reset_current_logs.
+        """
+
+        logs = "\n".join(self.__all_logs)
+        self.__all_logs = []
+        self._logs = []
+
+        return logs
+
+    def __log_iteration(self, iteration: IterationInfo) -> None:
+        self.__log(str(iteration))
+
+    def __log(self, line: str) -> None:
+        self._logs.append(line)
+        self.__all_logs.append(line)
@@ -0,0 +1,297 @@
+import time
+from typing import NamedTuple
+
+from duo_game_lib.game_state import GameState
+
+from connect_four_lib.bitboard import get_layout, winning_cells
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.move_ordering import center_first_columns
+
+
+class SolveResult(NamedTuple):
+    score: int
+    state: GameState
+    plies: int
+    move: int | None
+    nodes: int
+    time: float
+
+
+class ConnectFourSolver:
+    """
+    Solves exact result of position with perfect play from both players.
+
+    Score is positive when player to move wins, negative when it loses and zero
+    for draw. The sooner the game is won, the bigger the score. Search is negamax
+    with alpha-beta pruning, repeated with null windows to narrow down the score.
+    Board size and length of winning lines are taken from the judge. As in the
+    judge, a move that fills the board is a draw even if it connects pieces.
+    """
+
+    CHECK_INTERVAL = 1024
+
+    def __init__(
+        self,
+        judge: ConnectFourJudge | None = None,
+        table_size: int = 1000003,
+        time_limit: int | None = None,
+    ) -> None:
+        self.__judge: ConnectFourJudge = judge or ConnectFourJudge()
+        self.__table_size: int = table_size
+        self.__keys: list[int] = [-1] * table_size
+        self.__values: list[int] = [0] * table_size
+        self.__time_limit: int | None = time_limit
+        self.__deadline: float = 0
+        self.__nodes: int = 0
+
+        bitboard = self.__judge.bitboard
+        self.__layout = get_layout(bitboard.width, bitboard.height)
+        self.__length: int = bitboard.length
+        self.__cells: int = bitboard.width * bitboard.height
+        self.__columns: list[int] = [
+            self.__layout.column_masks[column]
+            for column in center_first_columns(bitboard.width)
+        ]
+
+    def add_move(self, move: str) -> None:
+        self.__judge.add_move(move)
+
+    def solve(self) -> SolveResult:
+        """
+        Solves current position and finds a move reaching the score.
+
+        Raises:
+            TimeoutError: If time limit is exceeded.
+
+        Returns:
+            SolveResult: Score, result and number of plies until game ends
+            for player to move, best move, and visited nodes and seconds used.
+        """
+
+        start_time = time.perf_counter()
+        self.__deadline = start_time + (self.__time_limit or 0) / 1000
+        self.__nodes = 0
+
+        bitboard = self.__judge.bitboard
+        moves = bitboard.occupied.bit_count()
+        color = moves % 2 + 1
+
+        if self.__judge.is_game_over() == GameState.WIN:
+            score = -((self.__cells + 2 - moves) // 2)
+            move = None
+        elif moves >= self.__cells:
+            score, move = 0, None
+        else:
+            position, mask = bitboard.masks[color], bitboard.occupied
+            score = self.__solve(position, mask, moves)
+            move = self.__find_move(position, mask, moves, score)
+
+        return SolveResult(
+            score,
+            self.__state(score),
+            self.__plies(score, moves),
+            move,
+            self.__nodes,
+            time.perf_counter() - start_time,
+        )
+
+    def get_best_move(self) -> str:
+        return str(self.solve().move)
+
+    def __find_move(self, position: int, mask: int, moves: int, score: int) -> int:
+        """
+        Returns first move in center-first order that reaches score.
+        """
+
+        layout = self.__layout
+        losing_score = -((self.__cells - moves) // 2)
+
+        for column in center_first_columns(len(layout.column_masks)):
+            move = (mask + layout.bottom) & layout.column_masks[column]
+
+            if not move:
+                continue
+
+            if self.__winning_moves(position, mask, moves) & move or (
+                score == losing_score
+            ):
+                return column
+
+            opponent, new_mask = position ^ mask, mask | move
+
+            if self.__winning_moves(opponent, new_mask, moves + 1):
+                continue
+
+            if moves + 1 >= self.__cells or (
+                self.__negamax(opponent, new_mask, moves + 1, -score, -score + 1)
+                <= -score
+            ):
+                return column
+
+        return -1
+
+    def __solve(self, position: int, mask: int, moves: int) -> int:
+        """
+        Narrows down score of position with null window searches.
+
+        Player to move must not be able to win immediately.
+        """
+
+        if moves >= self.__cells:
+            return 0
+
+        if self.__winning_moves(position, mask, moves):
+            return (self.__cells + 1 - moves) // 2
+
+        lower = -((self.__cells - moves) // 2)
+        upper = (self.__cells + 1 - moves) // 2
+
+        while lower < upper:
+            middle = lower + (upper - lower) // 2
+
+            if lower // 2 < middle <= 0:
+                middle = lower // 2
+            elif 0 <= middle < upper // 2:
+                middle = upper // 2
+
+            score = self.__negamax(position, mask, moves, middle, middle + 1)
+
+            if score <= middle:
+                upper = score
+            else:
+                lower = score
+
+        return lower
+
+    def __negamax(
+        self, position: int, mask: int, moves: int, alpha: int, beta: int
+    ) -> int:
+        """
+        Returns score of position within window, player to move can not win
+        immediately.
+        """
+
+        self.__nodes += 1
+
+        if self.__nodes % self.CHECK_INTERVAL == 0 and self.__is_timeout():
+            raise TimeoutError
+
+        possible = self.__non_losing_moves(position, mask, moves)
+
+        if not possible:
+            return -((self.__cells - moves) // 2)
+
+        if moves >= self.__cells - 2:
+            return 0
+
+        lowest = -((self.__cells - 2 - moves) // 2)
+        alpha = max(alpha, lowest)
+
+        if alpha >= beta:
+            return alpha
+
+        key = position + mask
+        index = key % self.__table_size
+
+        if self.__keys[index] == key:
+            beta = min(beta, self.__values[index] + lowest - 1)
+
+            if alpha >= beta:
+                return beta
+
+        for move in self.__order(position, mask, possible):
+            score = -self.__negamax(
+                position ^ mask, mask | move, moves + 1, -beta, -alpha
+            )
+
+            if score >= beta:
+                return score
+
+            alpha = max(alpha, score)
+
+        self.__keys[index] = key
+        self.__values[index] = alpha - lowest + 1
+
+        return alpha
+
+    def __winning_moves(self, position: int, mask: int, moves: int) -> int:
+        """
+        Returns playable cells that win immediately. Cell that fills the board
+        is a draw, not a win.
+        """
+
+        if moves + 1 >= self.__cells:
+            return 0
+
+        layout = self.__layout
+
+        return winning_cells(position, mask, layout, self.__length) & (
+            (mask + layout.bottom) & layout.full
+        )
+
+    def __non_losing_moves(self, position: int, mask: int, moves: int) -> int:
+        """
+        Returns playable cells that do not let opponent win on next move. When
+        the opponent's next move fills the board it can not win.
+        """
+
+        layout = self.__layout
+        possible = (mask + layout.bottom) & layout.full
+
+        if moves + 2 >= self.__cells:
+            return possible
+
+        opponent_wins = winning_cells(position ^ mask, mask, layout, self.__length)
+        forced = possible & opponent_wins
+
+        if forced:
+            if forced & (forced - 1):
+                return 0
+
+            possible = forced
+
+        return possible & ~(opponent_wins >> 1)
+
+    def __order(self, position: int, mask: int, possible: int) -> list[int]:
+        scored = []
+
+        for column_mask in self.__columns:
+            move = possible & column_mask
+
+            if move:
+                threats = winning_cells(
+                    position | move, mask, self.__layout, self.__length
+                )
+                scored.append((-threats.bit_count(), len(scored), move))
+
+        scored.sort()
+
+        return [move for _, _, move in scored]
+
+    def __is_timeout(self) -> bool:
+        return self.__time_limit is not None and time.perf_counter() >= self.__deadline
+
+    def __state(self, score: int) -> GameState:
+        if score > 0:
+            return GameState.WIN
+
+        if score < 0:
+            return GameState.LOSE
+
+        return GameState.DRAW
+
+    def __plies(self, score: int, moves: int) -> int:
+        """
+        Returns number of plies until game ends with perfect play.
+        """
+
+        if score == 0:
+            return self.__cells - moves
+
+        winner_moves = self.__cells + 1 - 2 * abs(score)
+        winner_parity = moves % 2 if score > 0 else (moves + 1) % 2
+
+        if winner_moves % 2 != winner_parity:
+            winner_moves -= 1
+
+        return winner_moves - moves + 1
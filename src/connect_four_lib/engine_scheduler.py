@@ -0,0 +1,287 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Callable, Generic, Hashable, TypeVar
+
+from connect_four_lib.search_limits import CancelToken, SearchLimits
+
+T = TypeVar("T")
+
+
+class EngineBusy(Exception):
+    """
+    Raised when the queue of a scheduler is full or the scheduler is closed.
+    """
+
+
+class SchedulerMetrics:
+    """
+    Counters and latencies of an EngineScheduler.
+
+    Wait time is measured from submitting a job to starting it and run time from
+    starting to finishing it, both in seconds. Latencies of only the last
+    ``window`` jobs are kept.
+    """
+
+    def __init__(self, window: int = 1000) -> None:
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.running: int = 0
+        self.submitted: int = 0
+        self.completed: int = 0
+        self.rejected: int = 0
+        self.cancelled: int = 0
+        self.expired: int = 0
+        self.wait_times: deque[float] = deque(maxlen=window)
+        self.run_times: deque[float] = deque(maxlen=window)
+
+    def wait_time(self, percentile: float = 50) -> float:
+        return self.__percentile(self.wait_times, percentile)
+
+    def run_time(self, percentile: float = 50) -> float:
+        return self.__percentile(self.run_times, percentile)
+
+    def __percentile(self, values: deque[float], percentile: float) -> float:
+        if not values:
+            return 0
+
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+
+        return ordered[index]
+
+    def __str__(self) -> str:
+        return (
+            f"queue {self.queue_depth} max {self.max_queue_depth}"
+            f" running {self.running} completed {self.completed}"
+            f" rejected {self.rejected} cancelled {self.cancelled}"
+            f" expired {self.expired}"
+            f" wait p50 {self.wait_time(50) * 1000:.0f}"
+            f" p95 {self.wait_time(95) * 1000:.0f}"
+            f" run p50 {self.run_time(50) * 1000:.0f}"
+            f" p95 {self.run_time(95) * 1000:.0f}"
+        )
+
+
+class _Job(Generic[T]):
+    def __init__(
+        self,
+        game: Hashable,
+        function: Callable[[SearchLimits], T],
+        limits: SearchLimits,
+        future: asyncio.Future,
+    ) -> None:
+        self.game: Hashable = game
+        self.function: Callable[[SearchLimits], T] = function
+        self.token: CancelToken = limits.cancel or CancelToken()
+        self.limits: SearchLimits = limits._replace(cancel=self.token)
+        self.future: asyncio.Future = future
+        self.submit_time: float = time.perf_counter()
+        self.start_time: float | None = None
+        self.timer: asyncio.TimerHandle | None = None
+
+    def run(self) -> T:
+        return self.function(self.limits)
+
+
+class EngineScheduler:
+    """
+    Runs blocking searches of many games in a bounded pool of threads without
+    blocking the event loop.
+
+    Jobs wait in a queue of their game and games take turns in round-robin
+    order, so a game with many requests cannot starve the others. Only one job
+    of a game runs at a time, which keeps the engine of the game from being
+    searched by two threads at once. When ``max_queue`` jobs are waiting, new
+    jobs are rejected with EngineBusy.
+
+    Deadline of the limits is the deadline of the whole request: a job that is
+    still queued at the deadline fails with TimeoutError, a running job returns
+    its best result so far. Cancelling the awaiting task removes a queued job
+    or cancels the search of a running one. Closing the scheduler fails queued
+    jobs with EngineBusy.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 64) -> None:
+        self.workers: int = workers
+        self.max_queue: int = max_queue
+        self.metrics: SchedulerMetrics = SchedulerMetrics()
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="engine"
+        )
+        self.__queues: dict[Hashable, deque[_Job]] = {}
+        self.__order: deque[Hashable] = deque()
+        self.__busy: set[Hashable] = set()
+        self.__running: set[_Job] = set()
+        self.__closed: bool = False
+
+    async def run(
+        self,
+        game: Hashable,
+        function: Callable[[SearchLimits], T],
+        limits: SearchLimits,
+    ) -> T:
+        """
+        Runs function in the pool when it is the turn of the game.
+
+        Args:
+            game (Hashable): Key of the game, usually its engine.
+            function (Callable[[SearchLimits], T]): Blocking search, called with
+                limits that include cancel token of the job.
+            limits (SearchLimits): Limits of the search.
+
+        Raises:
+            EngineBusy: If the queue is full or the scheduler is closed.
+            TimeoutError: If deadline passed before job was started.
+
+        Returns:
+            T: Return value of function.
+        """
+
+        if self.__closed:
+            raise EngineBusy("scheduler is closed")
+
+        if self.metrics.queue_depth >= self.max_queue:
+            self.metrics.rejected += 1
+            raise EngineBusy(f"{self.metrics.queue_depth} jobs queued")
+
+        loop = asyncio.get_running_loop()
+        job = _Job(game, function, limits, loop.create_future())
+        self.__enqueue(job)
+
+        if limits.deadline is not None:
+            job.timer = loop.call_later(
+                limits.deadline - time.perf_counter(), self.__expire, job
+            )
+
+        self.__dispatch()
+
+        try:
+            return await job.future
+        except asyncio.CancelledError:
+            self.__cancel(job)
+            raise
+
+    def close(self) -> None:
+        """
+        Cancels running searches, fails queued jobs and shuts down the pool.
+        """
+
+        self.__closed = True
+
+        for job in self.__running:
+            job.token.cancel()
+
+        for queue in list(self.__queues.values()):
+            for job in list(queue):
+                self.__remove(job)
+
+                if job.timer is not None:
+                    job.timer.cancel()
+
+                if not job.future.done():
+                    job.future.set_exception(EngineBusy("scheduler is closed"))
+
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enqueue(self, job: _Job) -> None:
+        if job.game not in self.__queues:
+            self.__queues[job.game] = deque()
+            self.__order.append(job.game)
+
+        self.__queues[job.game].append(job)
+        self.metrics.submitted += 1
+        self.metrics.queue_depth += 1
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self.metrics.queue_depth
+        )
+
+    def __remove(self, job: _Job) -> bool:
+        queue = self.__queues.get(job.game)
+
+        if queue is None or job not in queue:
+            return False
+
+        queue.remove(job)
+        self.metrics.queue_depth -= 1
+
+        if not queue:
+            del self.__queues[job.game]
+            self.__order.remove(job.game)
+
+        return True
+
+    def __next_job(self) -> _Job | None:
+        for _ in range(len(self.__order)):
+            game = self.__order.popleft()
+            self.__order.append(game)
+
+            if game not in self.__busy:
+                job = self.__queues[game][0]
+                self.__remove(job)
+                return job
+
+        return None
+
+    def __dispatch(self) -> None:
+        while not self.__closed and len(self.__running) < self.workers:
+            job = self.__next_job()
+
+            if job is None:
+                return
+
+            if job.timer is not None:
+                job.timer.cancel()
+
+            job.start_time = time.perf_counter()
+            self.metrics.wait_times.append(job.start_time - job.submit_time)
+            self.metrics.running += 1
+            self.__busy.add(job.game)
+            self.__running.add(job)
+
+            future = asyncio.get_running_loop().run_in_executor(
+                self.__executor, job.run
+            )
+            future.add_done_callback(lambda result, job=job: self.__finish(job, result))
+
+    def __finish(self, job: _Job, result: asyncio.Future) -> None:
+        self.metrics.running -= 1
+        self.metrics.completed += 1
+        self.metrics.run_times.append(time.perf_counter() - (job.start_time or 0))
+        self.__busy.discard(job.game)
+        self.__running.discard(job)
+
+        if not job.future.done():
+            if result.cancelled():
+                job.future.cancel()
+            elif result.exception() is not None:
+                job.future.set_exception(result.exception())
+            else:
+                job.future.set_result(result.result())
+
+        self.__dispatch()
+
+    def __expire(self, job: _Job) -> None:
+        if self.__remove(job):
+            self.metrics.expired += 1
+            job.future.set_exception(TimeoutError("deadline passed in queue"))
+
+    def __cancel(self, job: _Job) -> None:
+        self.metrics.cancelled += 1
+
+        if job.timer is not None:
+            job.timer.cancel()
+
+        if not self.__remove(job):
+            job.token.cancel()
+
+
+@cache
+def get_default_scheduler() -> EngineScheduler:
+    """
+    Returns scheduler shared by all engines of the process.
+    """
+
+    return EngineScheduler()
@@ -0,0 +1,219 @@
+from collections import OrderedDict
+from typing import NamedTuple
+
+from duo_game_lib.game_state import GameState
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.engine_scheduler import EngineScheduler, get_default_scheduler
+from connect_four_lib.opening_book import OpeningBook
+from connect_four_lib.search_info import SearchInfo
+from connect_four_lib.search_limits import SearchLimits
+from connect_four_lib.transposition_table import TranspositionTable
+
+
+class Game(NamedTuple):
+    engine: ConnectFourEngine
+    judge: ConnectFourJudge
+
+
+class EngineServer:
+    """
+    Hosts engines of many games by game id.
+
+    All engines share the opening book and one transposition table. Entries of
+    the table are keyed by the position only and every engine uses the same
+    weight, so an entry stored by one game is valid in every other game reaching
+    the same position. Winning lines and heuristic tables are cached by module.
+
+    When more than ``max_games`` games are hosted, the least recently used game
+    is evicted. Moves are given as the whole move history of the game, so an
+    evicted game is rebuilt transparently on its next request.
+    """
+
+    def __init__(
+        self,
+        max_games: int = 256,
+        difficulty: int = 1000,
+        *,
+        table: TranspositionTable | None = None,
+        book: OpeningBook | None = None,
+        scheduler: EngineScheduler | None = None,
+    ) -> None:
+        self.max_games: int = max_games
+        self.difficulty: int = difficulty
+        self.table: TranspositionTable = (
+            table if table is not None else TranspositionTable(size_mb=64)
+        )
+        self.book: OpeningBook | None = book
+        self.evictions: int = 0
+        self.__scheduler: EngineScheduler | None = scheduler
+        self.__games: OrderedDict[str, Game] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__games)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self.__games
+
+    def set_position(self, game_id: str, moves: str) -> None:
+        """
+        Updates game to given move history.
+
+        Only the new moves are played if the game has already been hosted with
+        a prefix of the moves, otherwise the game is started from scratch. The
+        moves are checked before any of them is played, so the game is left
+        unchanged when they are not valid.
+
+        Args:
+            game_id (str): Id of the game.
+            moves (str): All moves of the game as column numbers.
+
+        Raises:
+            ValueError: If a move is not valid or is played after game over.
+        """
+
+        self.__check_moves(moves)
+        game = self.__games.get(game_id)
+        played = [] if game is None else game.judge.get_all_moves()
+
+        if game is None or moves[: len(played)] != "".join(played):
+            game = self.__new_game(game_id)
+            played = []
+
+        self.__games.move_to_end(game_id)
+
+        for move in moves[len(played) :]:
+            game.engine.add_move(move)
+
+    def add_move(self, game_id: str, move: str) -> None:
+        """
+        Adds move to a hosted game.
+
+        Raises:
+            KeyError: If game is not hosted.
+        """
+
+        self.__get_game(game_id).engine.add_move(move)
+
+    def search(self, game_id: str, limits: SearchLimits | None = None) -> SearchInfo:
+        """
+        Searches best move of a hosted game.
+
+        Raises:
+            KeyError: If game is not hosted.
+        """
+
+        return self.__get_game(game_id).engine.search(limits=limits)
+
+    def get_best_move(self, game_id: str, limits: SearchLimits | None = None) -> str:
+        return self.search(game_id, limits).move
+
+    async def search_async(
+        self, game_id: str, limits: SearchLimits | None = None
+    ) -> SearchInfo:
+        """
+        Searches best move of a hosted game in scheduler of the server.
+
+        Raises:
+            KeyError: If game is not hosted.
+        """
+
+        return await self.__get_game(game_id).engine.search_async(
+            limits=limits, scheduler=self.__scheduler or get_default_scheduler()
+        )
+
+    def end_game(self, game_id: str) -> None:
+        game = self.__games.pop(game_id, None)
+
+        if game is not None:
+            game.engine.close()
+
+    def close(self) -> None:
+        for game_id in list(self.__games):
+            self.end_game(game_id)
+
+        if self.book is not None:
+            self.book.close()
+
+    def handle(self, line: str) -> str | None:
+        """
+        Handles one command of the text protocol.
+
+        Commands are ``position <id> [moves]``, ``move <id> <move>``,
+        ``go <id> [movetime <ms>] [depth <n>] [nodes <n>]`` answered with
+        ``bestmove <move>``, ``end <id>`` and ``isready`` answered with
+        ``readyok``.
+
+        Returns:
+            str | None: Answer to command, None if command has no answer.
+        """
+
+        words = line.split()
+
+        if not words:
+            return None
+
+        command, arguments = words[0], words[1:]
+
+        try:
+            return self.__handle(command, arguments)
+        except (KeyError, IndexError, ValueError) as error:
+            return f"error {command} {error}"
+
+    def __handle(self, command: str, arguments: list[str]) -> str | None:
+        if command == "isready":
+            return "readyok"
+
+        if command == "position":
+            self.set_position(arguments[0], "".join(arguments[1:]))
+        elif command == "move":
+            self.add_move(arguments[0], arguments[1])
+        elif command == "go":
+            options = dict(zip(arguments[1::2], map(int, arguments[2::2])))
+            limits = SearchLimits(
+                time_limit=options.get("movetime", self.difficulty),
+                depth=options.get("depth"),
+                nodes=options.get("nodes"),
+            )
+            return str(self.search(arguments[0], limits))
+        elif command == "end":
+            self.end_game(arguments[0])
+        else:
+            raise ValueError("unknown command")
+
+        return None
+
+    def __check_moves(self, moves: str) -> None:
+        judge = ConnectFourJudge()
+
+        for move in moves:
+            if judge.is_game_over() != GameState.CONTINUE:
+                raise ValueError(f"move {move} after game over")
+
+            if judge.validate(move) != GameState.CONTINUE:
+                raise ValueError(f"invalid move {move}")
+
+            judge.add_move(move)
+
+    def __new_game(self, game_id: str) -> Game:
+        self.end_game(game_id)
+
+        judge = ConnectFourJudge()
+        engine = ConnectFourEngine(
+            self.difficulty, judge, table=self.table, book=self.book
+        )
+        self.__games[game_id] = Game(engine, judge)
+
+        while len(self.__games) > self.max_games:
+            _, evicted = self.__games.popitem(last=False)
+            evicted.engine.close()
+            self.evictions += 1
+
+        return self.__games[game_id]
+
+    def __get_game(self, game_id: str) -> Game:
+        game = self.__games[game_id]
+        self.__games.move_to_end(game_id)
+
+        return game
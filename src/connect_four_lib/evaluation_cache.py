@@ -0,0 +1,57 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+
+class EvaluationCache:
+    """
+    Bounded cache of evaluations with least recently used eviction.
+
+    Keeps at most ``capacity`` entries, so memory stays flat however many
+    positions are evaluated. Hits, misses and evictions are counted from
+    creation of the cache. The cache is shared by engines in different threads,
+    so access is guarded by a lock.
+    """
+
+    def __init__(self, capacity: int = 65536) -> None:
+        self.capacity: int = capacity
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.__entries: OrderedDict[Hashable, int] = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: Hashable) -> int | None:
+        with self.__lock:
+            value = self.__entries.get(key)
+
+            if value is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.__entries.move_to_end(key)
+
+            return value
+
+    def put(self, key: Hashable, value: int) -> None:
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.capacity:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0
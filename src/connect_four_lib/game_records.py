@@ -0,0 +1,212 @@
+import struct
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Sequence, TextIO
+
+from duo_game_lib.game_state import GameState
+
+from connect_four_lib.bitboard import BitBoard
+from connect_four_lib.connect_four_heuristic import IncrementalHeuristic
+
+
+class ReplayedPly(NamedTuple):
+    """
+    Position after one move of a replayed game.
+
+    Attributes:
+        game (int): Index of game in replayed games.
+        ply (int): Number of moves played, starting from 1.
+        move (int): Column of move.
+        key (int): Unique key of position, see ``BitBoard.key``.
+        state (GameState): State like ``ConnectFourJudge.is_game_over``, DRAW
+            if move filled the board, WIN if it won, otherwise CONTINUE.
+        score (float | None): Evaluation of position for first player like
+            ``ConnectFourJudge.analyze``, None if not analyzed.
+    """
+
+    game: int
+    ply: int
+    move: int
+    key: int
+    state: GameState
+    score: float | None
+
+
+class GameArchive:
+    """
+    Games stored in binary file, read one game at a time.
+
+    File starts with a header of board size and length of winning lines. Every
+    game is stored as number of moves followed by moves packed two per byte,
+    first move in low bits. Boards can have at most 16 columns and 255 cells.
+    """
+
+    MAGIC = b"C4GR"
+    HEADER = struct.Struct("<4sBBB")
+
+    def __init__(self, file: BinaryIO) -> None:
+        magic, self.width, self.height, self.length = self.HEADER.unpack(
+            file.read(self.HEADER.size)
+        )
+
+        if magic != self.MAGIC:
+            raise ValueError("file is not a game archive")
+
+        self.__file: BinaryIO = file
+
+    def __iter__(self) -> Iterator[list[int]]:
+        read = self.__file.read
+
+        while count := read(1):
+            packed = read((count[0] + 1) // 2)
+            moves = []
+
+            for byte in packed:
+                moves.append(byte & 15)
+                moves.append(byte >> 4)
+
+            yield moves[: count[0]]
+
+    @classmethod
+    def write(
+        cls,
+        file: BinaryIO,
+        games: Iterable[Sequence[int]],
+        size: tuple[int, int] = (7, 6),
+        length: int = 4,
+    ) -> int:
+        """
+        Writes games to binary file.
+
+        Args:
+            file (BinaryIO): File opened for writing bytes.
+            games (Iterable[Sequence[int]]): Moves of games as columns.
+            size (tuple[int, int]): Width and height of board. Defaults to (7, 6).
+            length (int): Number of connected pieces needed to win. Defaults to 4.
+
+        Raises:
+            ValueError: If board is too large for the format.
+
+        Returns:
+            int: Number of games written.
+        """
+
+        if size[0] > 16 or size[0] * size[1] > 255:
+            raise ValueError(f"board of size {size} does not fit in game archive")
+
+        file.write(cls.HEADER.pack(cls.MAGIC, size[0], size[1], length))
+        written = 0
+
+        for moves in games:
+            packed = bytearray([len(moves)])
+
+            for i in range(0, len(moves) - 1, 2):
+                packed.append(moves[i] | moves[i + 1] << 4)
+
+            if len(moves) % 2:
+                packed.append(moves[-1])
+
+            file.write(packed)
+            written += 1
+
+        return written
+
+
+def read_move_strings(lines: Iterable[str]) -> Iterator[list[int]]:
+    """
+    Reads games written as strings of column digits, one game per line, like
+    ``3342``. Empty lines and lines starting with ``#`` are skipped.
+
+    Args:
+        lines (Iterable[str]): Lines, for example an open text file.
+
+    Yields:
+        list[int]: Moves of game as columns.
+    """
+
+    for line in lines:
+        line = line.strip()
+
+        if line and not line.startswith("#"):
+            yield [int(move) for move in line]
+
+
+def write_move_strings(file: TextIO, games: Iterable[Sequence[int]]) -> int:
+    """
+    Writes games as strings of column digits, one game per line.
+
+    Args:
+        file (TextIO): File opened for writing text.
+        games (Iterable[Sequence[int]]): Moves of games as columns, at most 10
+            columns.
+
+    Returns:
+        int: Number of games written.
+    """
+
+    written = 0
+
+    for moves in games:
+        file.write("".join(map(str, moves)) + "\n")
+        written += 1
+
+    return written
+
+
+def replay(
+    games: Iterable[Sequence[int]],
+    width: int = 7,
+    height: int = 6,
+    length: int = 4,
+    analyze: bool = False,
+) -> Iterator[ReplayedPly]:
+    """
+    Replays games and yields every position.
+
+    Moves are played straight to a bitboard without validation, so records
+    must contain only legal moves. Heuristic is updated only when positions are
+    analyzed. Memory use does not grow with the number of games.
+
+    Args:
+        games (Iterable[Sequence[int]]): Moves of games as columns.
+        width (int): Number of columns. Defaults to 7.
+        height (int): Number of rows. Defaults to 6.
+        length (int): Number of connected pieces needed to win. Defaults to 4.
+        analyze (bool): Whether to evaluate positions. Defaults to False.
+
+    Yields:
+        ReplayedPly: Position and state after every move.
+    """
+
+    for game, moves in enumerate(games):
+        yield from _replay_game(game, moves, BitBoard(width, height, length), analyze)
+
+
+def _replay_game(
+    game: int, moves: Sequence[int], bitboard: BitBoard, analyze: bool
+) -> Iterator[ReplayedPly]:
+    cells = bitboard.width * bitboard.height
+    heuristic = (
+        IncrementalHeuristic(
+            [[0] * bitboard.height for _ in range(bitboard.width)], bitboard.length
+        )
+        if analyze
+        else None
+    )
+
+    for ply, move in enumerate(moves, 1):
+        color = 2 - ply % 2
+        wins = bitboard.is_winning_move(move, color)
+        row = bitboard.play(move, color)
+        score = None
+
+        if ply >= cells:
+            state = GameState.DRAW
+        elif wins:
+            state = GameState.WIN
+        else:
+            state = GameState.CONTINUE
+
+        if heuristic is not None:
+            heuristic.add(move, row, color)
+            score = 0 if ply >= cells else heuristic.evaluate(1)
+
+        yield ReplayedPly(game, ply, move, bitboard.key(), state, score)
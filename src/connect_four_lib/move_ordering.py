@@ -0,0 +1,120 @@
+from functools import cache
+
+from connect_four_lib.bitboard import BitBoard
+
+
+@cache
+def center_first_columns(width: int) -> tuple[int, ...]:
+    return tuple(sorted(range(width), key=lambda column: abs(2 * column - width + 1)))
+
+
+class MoveOrdering:
+    """
+    Strategy for ordering moves of alpha-beta search.
+
+    Moves are tried in order: move from transposition table, immediate wins,
+    blocks of opponent's immediate wins, killer moves of the ply and remaining
+    moves by history score. Ties are broken by distance from center column.
+    Every step can be turned off, and with all of them off moves are tried from
+    left to right.
+    """
+
+    def __init__(
+        self,
+        hash_move: bool = True,
+        threats: bool = True,
+        killers: bool = True,
+        history: bool = True,
+        center_first: bool = True,
+    ) -> None:
+        self.hash_move: bool = hash_move
+        self.threats: bool = threats
+        self.killers: bool = killers
+        self.history: bool = history
+        self.center_first: bool = center_first
+        self.__killer_moves: dict[int, list[int]] = {}
+        self.__history_scores: list[dict[int, int]] = [{}, {}, {}]
+
+    def new_search(self) -> None:
+        """
+        Forgets killer moves and halves history scores of previous searches.
+        """
+
+        self.__killer_moves = {}
+
+        for scores in self.__history_scores:
+            for column, score in scores.items():
+                scores[column] = score // 2
+
+    def order(
+        self, bitboard: BitBoard, color: int, ply: int, hash_move: int | None = None
+    ) -> list[int]:
+        """
+        Returns playable columns in order they should be searched.
+
+        Args:
+            bitboard (BitBoard): Current position.
+            color (int): Color of player to move.
+            ply (int): Number of moves played.
+            hash_move (int | None): Best move from transposition table.
+
+        Returns:
+            list[int]: Ordered columns.
+        """
+
+        columns = (
+            center_first_columns(bitboard.width)
+            if self.center_first
+            else range(bitboard.width)
+        )
+        moves = [column for column in columns if bitboard.can_play(column)]
+
+        if self.history and self.__history_scores[color]:
+            scores = self.__history_scores[color]
+            moves.sort(key=lambda column: -scores.get(column, 0))
+
+        first = []
+
+        if self.hash_move and hash_move is not None:
+            first.append(hash_move)
+
+        if self.threats:
+            playable = bitboard.playable()
+            first.extend(bitboard.columns(bitboard.winning_cells(color) & playable))
+            first.extend(bitboard.columns(bitboard.winning_cells(3 - color) & playable))
+
+        if self.killers:
+            first.extend(self.__killer_moves.get(ply, []))
+
+        if not first:
+            return moves
+
+        ordered = []
+
+        for column in first + moves:
+            if column in moves and column not in ordered:
+                ordered.append(column)
+
+        return ordered
+
+    def record_cutoff(self, move: int, color: int, ply: int, depth: int) -> None:
+        """
+        Remembers move that caused beta cutoff.
+
+        Args:
+            move (int): Move that caused cutoff.
+            color (int): Color of player who made the move.
+            ply (int): Number of moves played before the move.
+            depth (int): Remaining depth of search.
+        """
+
+        if self.killers:
+            killers = self.__killer_moves.setdefault(ply, [])
+
+            if move not in killers:
+                killers.insert(0, move)
+                del killers[2:]
+
+        if self.history:
+            scores = self.__history_scores[color]
+            scores[move] = scores.get(move, 0) + depth * depth
@@ -0,0 +1,171 @@
+import mmap
+import struct
+from types import TracebackType
+from typing import Callable
+
+from duo_game_lib.game_state import GameState
+
+from connect_four_lib.bitboard import BitBoard
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+
+
+class OpeningBook:
+    """
+    Read-only book of opening moves stored in a memory-mapped file.
+
+    File starts with a header followed by records of canonical position key and
+    move, sorted by key. Moves are looked up with binary search, so processes
+    opening the same file share its pages instead of loading it to memory.
+    Books are made for connect four, other lengths are never looked up.
+    """
+
+    LENGTH = 4
+
+    MAGIC = b"C4BK"
+    HEADER = struct.Struct("<4sBBB")
+    RECORD = struct.Struct("<QB")
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self.__data: mmap.mmap = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        magic, self.width, self.height, self.plies = self.HEADER.unpack_from(
+            self.__data
+        )
+
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an opening book")
+
+        self.__size: int = (len(self.__data) - self.HEADER.size) // self.RECORD.size
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __enter__(self) -> "OpeningBook":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.__data.close()
+
+    def get_move(self, bitboard: BitBoard) -> int | None:
+        """
+        Looks up move of position.
+
+        Args:
+            bitboard (BitBoard): Position to look up.
+
+        Returns:
+            int | None: Column of move, None if position is not in book.
+        """
+
+        if (bitboard.width, bitboard.height, bitboard.length) != (
+            self.width,
+            self.height,
+            self.LENGTH,
+        ):
+            return None
+
+        key, mirrored = bitboard.canonical_key()
+        low, high = 0, self.__size
+
+        while low < high:
+            middle = (low + high) // 2
+            record_key, move = self.RECORD.unpack_from(
+                self.__data, self.HEADER.size + middle * self.RECORD.size
+            )
+
+            if record_key == key:
+                return self.width - 1 - move if mirrored else move
+
+            if record_key < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+    @classmethod
+    def write(
+        cls,
+        path: str,
+        moves: dict[int, int],
+        size: tuple[int, int] = (7, 6),
+        plies: int = 0,
+    ) -> None:
+        """
+        Writes book file.
+
+        Args:
+            path (str): Path of file.
+            moves (dict[int, int]): Moves by canonical position key.
+            size (tuple[int, int]): Width and height of board. Defaults to (7, 6).
+            plies (int): Number of plies covered by book. Defaults to 0.
+        """
+
+        with open(path, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, size[0], size[1], plies))
+
+            for key in sorted(moves):
+                file.write(cls.RECORD.pack(key, moves[key]))
+
+
+def generate_opening_book(
+    path: str, plies: int, choose_move: Callable[[ConnectFourJudge], str]
+) -> int:
+    """
+    Chooses moves of all positions before given ply and writes them to book.
+    Mirror images are chosen only once.
+
+    Args:
+        path (str): Path of book file.
+        plies (int): Positions with fewer moves than this are included.
+        choose_move (Callable[[ConnectFourJudge], str]): Returns move of position,
+            for example with engine or solver. Gets a copy of judge.
+
+    Returns:
+        int: Number of positions in book.
+    """
+
+    moves: dict[int, int] = {}
+    judge = ConnectFourJudge()
+
+    def collect() -> None:
+        key, mirrored = judge.bitboard.canonical_key()
+
+        if (
+            key in moves
+            or judge.ply >= plies
+            or judge.is_game_over() != GameState.CONTINUE
+        ):
+            return
+
+        move = int(
+            choose_move(
+                ConnectFourJudge(
+                    [int(move) for move in judge.get_all_moves()],
+                    [column.copy() for column in judge.board],
+                )
+            )
+        )
+        moves[key] = judge.bitboard.width - 1 - move if mirrored else move
+
+        for next_move in judge.get_valid_moves():
+            judge.add_move(str(next_move))
+            collect()
+            judge.remove_last_move()
+
+    collect()
+    OpeningBook.write(path, moves, (judge.bitboard.width, judge.bitboard.height), plies)
+
+    return len(moves)
@@ -0,0 +1,210 @@
+import multiprocessing
+import time
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from multiprocessing.synchronize import Event as EventType
+from typing import Callable
+
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.search_info import IterationCallback, SearchInfo, StopReason
+from connect_four_lib.search_limits import CancelToken, LimitChecker, SearchLimits
+
+Position = tuple[list[int], list[list[int]], int]
+TaskResult = tuple[float | None, int, int, int]
+RootTask = Callable[[Position, int, int, SearchLimits, int], TaskResult]
+
+
+class _Worker:
+    """
+    State of worker process, set when the process starts.
+    """
+
+    cancel: CancelToken | None = None
+
+
+def _init_worker(event: EventType) -> None:
+    _Worker.cancel = CancelToken(event)
+
+
+def worker_limits(limits: SearchLimits) -> SearchLimits:
+    """
+    Returns limits of task in worker process with cancel token shared with the
+    process that owns the pool.
+    """
+
+    return limits._replace(cancel=_Worker.cancel)
+
+
+class ParallelSearch:
+    """
+    Searches root moves of a position in a pool of processes.
+
+    Search deepens one depth at a time. On every depth, each root move is
+    searched as a separate task in some worker process, which builds its own
+    judge from the moves, board and winning length of the game. The best move of
+    the deepest depth that was completed for all root moves within the limits is
+    selected. Every task gets the time left and an equal share of the nodes left.
+    When the search stops, running tasks are stopped through an event shared
+    with the workers and waited for, so no task outlives the search. Workers
+    evaluate with the weight of the engine that owns the search.
+    """
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, workers: int, task: RootTask, weight: int = 2) -> None:
+        self.workers: int = workers
+        self.weight: int = weight
+        self.__task: RootTask = task
+        self.__pool: ProcessPoolExecutor | None = None
+        self.__stop: EventType | None = None
+
+    def search(
+        self,
+        judge: ConnectFourJudge,
+        root_moves: list[int],
+        limits: SearchLimits,
+        on_iteration: IterationCallback | None = None,
+    ) -> SearchInfo:
+        """
+        Finds best root move.
+
+        Args:
+            judge (ConnectFourJudge): Current position.
+            root_moves (list[int]): Moves to search, ties are broken by this order.
+            limits (SearchLimits): Limits of search, depth counts the root move.
+            on_iteration (IterationCallback | None): Called after every depth.
+
+        Returns:
+            SearchInfo: Best move and statistics summed over workers.
+        """
+
+        checker = LimitChecker(limits)
+        position = (
+            [int(move) for move in judge.get_all_moves()],
+            [column.copy() for column in judge.board],
+            judge.length,
+        )
+        moves_left = judge.bitboard.width * judge.bitboard.height - len(position[0])
+        info = SearchInfo(str(root_moves[0]), StopReason.END_OF_GAME)
+
+        for depth in range(1, moves_left + 1):
+            if limits.depth is not None and depth > limits.depth:
+                info.stop_reason = StopReason.MAX_DEPTH
+                break
+
+            reason = checker.stop_reason(info.nodes)
+
+            if reason is not None:
+                info.stop_reason = reason
+                break
+
+            results = self.__search_depth(
+                position, root_moves, depth, checker, info.nodes
+            )
+
+            if results is None:
+                info.stop_reason = checker.stop_reason() or StopReason.TIMEOUT
+                break
+
+            if None in [result[0] for result in results]:
+                info.nodes += sum(result[1] for result in results)
+                info.stop_reason = checker.stop_reason(info.nodes) or (
+                    StopReason.NODES if limits.nodes is not None else StopReason.TIMEOUT
+                )
+                break
+
+            self.__complete_depth(info, depth, root_moves, results, checker.start_time)
+
+            if on_iteration is not None:
+                on_iteration(info.iterations[-1])
+
+        return info
+
+    def close(self) -> None:
+        if self.__pool is not None:
+            self.__pool.shutdown(cancel_futures=True)
+            self.__pool = None
+            self.__stop = None
+
+    def __complete_depth(
+        self,
+        info: SearchInfo,
+        depth: int,
+        root_moves: list[int],
+        results: list[TaskResult],
+        start_time: float,
+    ) -> None:
+        values = [result[0] for result in results]
+        best_value = max(values)
+        best_move = root_moves[values.index(best_value)]
+
+        info.move = str(best_move)
+        info.nodes += sum(result[1] for result in results)
+        info.cutoffs += sum(result[2] for result in results)
+        info.table_hits += sum(result[3] for result in results)
+        info.add_iteration(
+            depth, best_value, time.perf_counter() - start_time, [best_move]
+        )
+
+    def __search_depth(
+        self,
+        position: Position,
+        root_moves: list[int],
+        depth: int,
+        checker: LimitChecker,
+        nodes: int,
+    ) -> list[TaskResult] | None:
+        """
+        Searches all root moves to given depth, returns None if search is stopped
+        before all moves are searched. Tasks that are still running then are
+        stopped and waited for.
+        """
+
+        time_left = checker.time_left()
+        nodes_left = checker.max_nodes - nodes
+        limits = SearchLimits(
+            time_limit=None if time_left == float("inf") else int(time_left * 1000),
+            nodes=(
+                None
+                if nodes_left == float("inf")
+                else max(int(nodes_left) // len(root_moves), 1)
+            ),
+        )
+        pool, stop = self.__get_pool()
+        stop.clear()
+        futures = [
+            pool.submit(self.__task, position, move, depth - 1, limits, self.weight)
+            for move in root_moves
+        ]
+        pending = set(futures)
+
+        while pending and checker.stop_reason() is None:
+            _, pending = wait(
+                pending,
+                timeout=min(checker.time_left(), self.POLL_INTERVAL),
+                return_when=FIRST_EXCEPTION,
+            )
+
+        if not pending:
+            return [future.result() for future in futures]
+
+        stop.set()
+
+        for future in pending:
+            future.cancel()
+
+        wait(pending)
+
+        return None
+
+    def __get_pool(self) -> tuple[ProcessPoolExecutor, EventType]:
+        if self.__pool is None or self.__stop is None:
+            context = multiprocessing.get_context()
+            self.__stop = context.Event()
+            self.__pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.__stop,),
+            )
+
+        return self.__pool, self.__stop
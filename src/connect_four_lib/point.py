@@ -1,7 +1,33 @@
+FLYWEIGHT_RANGE = 8
+
+
 class Point:
-    def __init__(self, x: int, y: int) -> None:
-        self.x: int = x
-        self.y: int = y
+    """
+    Immutable point of the board or direction between points.
+
+    Points with both coordinates between -FLYWEIGHT_RANGE and FLYWEIGHT_RANGE,
+    which include every cell of the board and every direction, are created once
+    and shared. Arithmetic on them returns the shared points without allocating.
+    """
+
+    __slots__ = ("x", "y")
+
+    x: int
+    y: int
+
+    def __new__(cls, x: int, y: int) -> "Point":
+        if -FLYWEIGHT_RANGE <= x <= FLYWEIGHT_RANGE and (
+            -FLYWEIGHT_RANGE <= y <= FLYWEIGHT_RANGE
+        ):
+            return _FLYWEIGHTS[x + FLYWEIGHT_RANGE][y + FLYWEIGHT_RANGE]
+
+        return _create(x, y)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Point is immutable")
+
+    def __reduce__(self) -> tuple[type, tuple[int, int]]:
+        return Point, (self.x, self.y)
 
     def __add__(self, other: "Point") -> "Point":
         return Point(self.x + other.x, self.y + other.y)
@@ -18,5 +44,22 @@ class Point:
 
         return self.x == other.x and self.y == other.y
 
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
     def __repr__(self) -> str:
         return f"Point({self.x}, {self.y})"
+
+
+def _create(x: int, y: int) -> Point:
+    point = object.__new__(Point)
+    object.__setattr__(point, "x", x)
+    object.__setattr__(point, "y", y)
+
+    return point
+
+
+_FLYWEIGHTS: list[list[Point]] = [
+    [_create(x, y) for y in range(-FLYWEIGHT_RANGE, FLYWEIGHT_RANGE + 1)]
+    for x in range(-FLYWEIGHT_RANGE, FLYWEIGHT_RANGE + 1)
+]
@@ -0,0 +1,71 @@
+import threading
+from typing import Callable
+
+from connect_four_lib.search_info import SearchInfo, StopReason
+from connect_four_lib.search_limits import CancelToken, SearchLimits
+
+FINISHED = {StopReason.END_OF_GAME, StopReason.CRITICAL_MOVE, StopReason.MAX_DEPTH}
+
+
+class Ponderer:
+    """
+    Runs a search in a background thread while the opponent is thinking.
+
+    The search is given its own cancel token and runs until it finishes or
+    ``stop`` is called. ``move`` is the predicted reply of the opponent that was
+    played before searching, None if the position before the reply is searched.
+    Whether the prediction was hit is decided by the first call of ``stop``.
+    """
+
+    def __init__(
+        self,
+        search: Callable[[SearchLimits], SearchInfo],
+        move: int | None,
+        limits: SearchLimits,
+    ) -> None:
+        self.move: int | None = move
+        self.hit: bool = False
+        self.stopped: bool = False
+        self.result: SearchInfo | None = None
+        self.__token: CancelToken = CancelToken()
+        self.__thread: threading.Thread = threading.Thread(
+            target=self.__run,
+            args=(search, limits._replace(cancel=self.__token)),
+            daemon=True,
+        )
+        self.__thread.start()
+
+    @property
+    def running(self) -> bool:
+        return self.__thread.is_alive()
+
+    def stop(self, move: int | None = None) -> None:
+        """
+        Stops search and waits for the thread to end. Only the first call
+        decides whether the prediction was hit.
+
+        Args:
+            move (int | None): Move actually played by opponent. Defaults to None.
+        """
+
+        self.__token.cancel()
+        self.__thread.join()
+
+        if not self.stopped:
+            self.hit = move is not None and move == self.move
+            self.stopped = True
+
+    def finished(self) -> bool:
+        """
+        Checks if search ended by itself instead of being stopped.
+
+        Returns:
+            bool: True if search reached its limits or end of game.
+        """
+
+        return self.result is not None and self.result.stop_reason in FINISHED
+
+    def __run(
+        self, search: Callable[[SearchLimits], SearchInfo], limits: SearchLimits
+    ) -> None:
+        self.result = search(limits)
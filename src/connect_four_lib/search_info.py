@@ -0,0 +1,121 @@
+from enum import Enum
+from typing import Callable, NamedTuple
+
+
+class StopReason(Enum):
+    BOOK = "book"
+    PONDER_HIT = "ponder_hit"
+    OPENING = "opening"
+    CRITICAL_MOVE = "critical_move"
+    END_OF_GAME = "end_of_game"
+    MAX_DEPTH = "max_depth"
+    TIMEOUT = "timeout"
+    NODES = "nodes"
+    CANCELLED = "cancelled"
+
+
+class IterationInfo(NamedTuple):
+    """
+    Completed iteration of iterative deepening. Nodes, cutoffs, table hits and
+    time are counted from start of search, iteration time only for the iteration.
+    """
+
+    depth: int
+    move: int
+    value: float
+    nodes: int
+    cutoffs: int
+    table_hits: int
+    time: float
+    iteration_time: float
+    principal_variation: list[int]
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.time if self.time > 0 else 0
+
+    def __str__(self) -> str:
+        return (
+            f"info depth {self.depth} move {self.move} value {self.value:g}"
+            f" nodes {self.nodes} nps {self.nodes_per_second:.0f}"
+            f" time {self.time * 1000:.0f} iteration {self.iteration_time * 1000:.0f}"
+            f" cutoffs {self.cutoffs} hits {self.table_hits}"
+            f" pv {' '.join(str(move) for move in self.principal_variation)}"
+        )
+
+
+IterationCallback = Callable[[IterationInfo], None]
+
+
+class SearchInfo:
+    """
+    Statistics of one call of ConnectFourEngine.search.
+
+    Every completed iteration of iterative deepening is stored in ``iterations``.
+    Totals of nodes, cutoffs and table hits include also the unfinished iteration.
+    """
+
+    def __init__(
+        self, move: str = "", stop_reason: StopReason = StopReason.MAX_DEPTH
+    ) -> None:
+        self.move: str = move
+        self.stop_reason: StopReason = stop_reason
+        self.iterations: list[IterationInfo] = []
+        self.nodes: int = 0
+        self.cutoffs: int = 0
+        self.table_hits: int = 0
+        self.time: float = 0
+
+    @property
+    def depth(self) -> int:
+        return self.iterations[-1].depth if self.iterations else 0
+
+    def add_iteration(
+        self,
+        depth: int,
+        value: float,
+        time: float,
+        principal_variation: list[int],
+    ) -> IterationInfo:
+        """
+        Records completed iteration with current totals and best move.
+
+        Args:
+            depth (int): Depth of iteration.
+            value (float): Evaluation of best move.
+            time (float): Seconds from start of search.
+            principal_variation (list[int]): Expected moves starting from best move.
+
+        Returns:
+            IterationInfo: Recorded iteration.
+        """
+
+        iteration = IterationInfo(
+            depth,
+            int(self.move),
+            value,
+            self.nodes,
+            self.cutoffs,
+            self.table_hits,
+            time,
+            time - self.iterations[-1].time if self.iterations else time,
+            principal_variation,
+        )
+        self.iterations.append(iteration)
+
+        return iteration
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.time if self.time > 0 else 0
+
+    @property
+    def principal_variation(self) -> list[int]:
+        return self.iterations[-1].principal_variation if self.iterations else []
+
+    def __str__(self) -> str:
+        return (
+            f"bestmove {self.move} depth {self.depth} nodes {self.nodes}"
+            f" nps {self.nodes_per_second:.0f} time {self.time * 1000:.0f}"
+            f" stop {self.stop_reason.value}"
+        )
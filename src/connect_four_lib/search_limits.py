@@ -0,0 +1,115 @@
+import threading
+import time
+from multiprocessing.synchronize import Event as EventType
+from typing import NamedTuple
+
+from connect_four_lib.search_info import StopReason
+
+
+class CancelToken:
+    """
+    Flag for stopping a search from another thread. A multiprocessing event can
+    be given to stop searches in other processes.
+    """
+
+    def __init__(self, event: threading.Event | EventType | None = None) -> None:
+        self.__event: threading.Event | EventType = event or threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__event.is_set()
+
+    def cancel(self) -> None:
+        self.__event.set()
+
+    def reset(self) -> None:
+        self.__event.clear()
+
+
+class SearchLimits(NamedTuple):
+    """
+    Limits of one search. Search stops when any of the limits is reached.
+
+    Attributes:
+        time_limit (int | None): Wall-clock time in milliseconds.
+        deadline (float | None): Time of ``time.perf_counter`` when search must end.
+        nodes (int | None): Maximum number of visited nodes.
+        depth (int | None): Maximum depth of iterative deepening.
+        cancel (CancelToken | None): Token that stops search when cancelled.
+    """
+
+    time_limit: int | None = None
+    deadline: float | None = None
+    nodes: int | None = None
+    depth: int | None = None
+    cancel: CancelToken | None = None
+
+
+class SearchStopped(Exception):
+    def __init__(self, reason: StopReason) -> None:
+        super().__init__(reason.value)
+        self.reason: StopReason = reason
+
+
+class LimitChecker:
+    """
+    Checks limits of running search.
+
+    Clock and cancel token are read only every ``CHECK_INTERVAL`` nodes.
+    Search calls ``check`` when its node count reaches ``next_check``.
+    """
+
+    CHECK_INTERVAL = 256
+
+    def __init__(self, limits: SearchLimits) -> None:
+        self.start_time: float = time.perf_counter()
+        self.deadline: float = float("inf")
+        self.max_nodes: float = float("inf") if limits.nodes is None else limits.nodes
+        self.next_check: float = min(self.CHECK_INTERVAL, self.max_nodes)
+        self.__cancel: CancelToken | None = limits.cancel
+
+        if limits.time_limit is not None:
+            self.deadline = self.start_time + limits.time_limit / 1000
+
+        if limits.deadline is not None:
+            self.deadline = min(self.deadline, limits.deadline)
+
+    def check(self, nodes: int) -> None:
+        """
+        Checks limits and schedules next check.
+
+        Args:
+            nodes (int): Number of nodes visited so far.
+
+        Raises:
+            SearchStopped: If any limit is reached.
+        """
+
+        reason = self.stop_reason(nodes)
+
+        if reason is not None:
+            raise SearchStopped(reason)
+
+        self.next_check = min(nodes + self.CHECK_INTERVAL, self.max_nodes)
+
+    def stop_reason(self, nodes: int = 0) -> StopReason | None:
+        """
+        Returns reason for stopping search, None if no limit is reached.
+
+        Args:
+            nodes (int): Number of nodes visited so far. Defaults to 0.
+        """
+
+        if nodes >= self.max_nodes:
+            return StopReason.NODES
+
+        if self.__cancel is not None and self.__cancel.cancelled:
+            return StopReason.CANCELLED
+
+        if time.perf_counter() >= self.deadline:
+            return StopReason.TIMEOUT
+
+        return None
+
+    def time_left(self) -> float:
+        return self.deadline - time.perf_counter()
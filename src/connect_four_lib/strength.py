@@ -0,0 +1,93 @@
+import random
+from typing import NamedTuple
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.search_info import StopReason
+from connect_four_lib.search_limits import SearchLimits
+
+FORCED_STOP_REASONS = (
+    StopReason.BOOK,
+    StopReason.OPENING,
+    StopReason.CRITICAL_MOVE,
+)
+
+
+class StrengthLevel(NamedTuple):
+    """
+    Playing strength defined by search budget instead of time, so strength does
+    not depend on hardware or load and weak levels use little CPU.
+
+    Attributes:
+        elo (int): Lowest Elo the level is used for.
+        depth (int | None): Maximum depth of search.
+        nodes (int | None): Maximum number of nodes of search.
+        randomness (float): Probability of replacing searched move with a random
+            move.
+    """
+
+    elo: int
+    depth: int | None = None
+    nodes: int | None = None
+    randomness: float = 0
+
+    @property
+    def limits(self) -> SearchLimits:
+        return SearchLimits(nodes=self.nodes, depth=self.depth)
+
+
+LEVELS = (
+    StrengthLevel(400, depth=1, randomness=0.5),
+    StrengthLevel(500, depth=1, randomness=0.25),
+    StrengthLevel(700, depth=2),
+    StrengthLevel(900, depth=4, nodes=1000),
+    StrengthLevel(950, depth=6, nodes=4000),
+    StrengthLevel(1050, nodes=16000),
+)
+
+
+def get_level(elo: int) -> StrengthLevel:
+    """
+    Returns strongest level whose Elo is at most given Elo, or weakest level if
+    there is none.
+    """
+
+    level = LEVELS[0]
+
+    for candidate in LEVELS:
+        if candidate.elo <= elo:
+            level = candidate
+
+    return level
+
+
+def play_move(
+    engine: ConnectFourEngine,
+    limits: SearchLimits,
+    randomness: float = 0,
+    generator: random.Random | None = None,
+) -> str:
+    """
+    Searches move with given limits and replaces it with a random move with
+    given probability. Book and opening moves, immediate wins and blocks are
+    never replaced, and random moves avoid giving the opponent an immediate win.
+
+    Args:
+        engine (ConnectFourEngine): Engine in current position.
+        limits (SearchLimits): Limits of search.
+        randomness (float): Probability of random move. Defaults to 0.
+        generator (random.Random | None): Source of randomness. Defaults to
+            module random.
+
+    Returns:
+        str: Move to play. Statistics of search are in ``engine.info``.
+    """
+
+    info = engine.search(limits=limits)
+
+    if info.stop_reason in FORCED_STOP_REASONS or not randomness:
+        return info.move
+
+    if (generator or random).random() < randomness:
+        return engine.get_random_move(generator)
+
+    return info.move
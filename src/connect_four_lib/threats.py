@@ -0,0 +1,89 @@
+from typing import NamedTuple
+
+from connect_four_lib.bitboard import BitBoard
+
+
+class Threats(NamedTuple):
+    """
+    Threats of one player as bitmasks of cells.
+
+    Attributes:
+        winning (int): Empty cells that would connect four, playable or not.
+        immediate (int): Winning cells that can be played now.
+        double (int): Immediate threats that opponent cannot block. Either there
+            are several of them, or the cell above the threat also wins.
+        losing (int): Playable cells right below winning cells of the opponent,
+            the opponent wins by playing on top of them.
+    """
+
+    winning: int
+    immediate: int
+    double: int
+    losing: int
+
+
+class ThreatTracker:
+    """
+    Keeps winning cells of both players up to date while moves are played.
+
+    A move can add winning cells only for the player who made it, so only that
+    player is rescanned, and the cell is removed from winning cells of the
+    opponent. Previous values are stacked, so taking a move back is O(1).
+    """
+
+    def __init__(self, bitboard: BitBoard) -> None:
+        self.__bitboard: BitBoard = bitboard
+        self.__winning: list[int] = [0, 0, 0]
+        self.__history: list[tuple[int, int]] = []
+        self.__scan()
+
+    def add(self, color: int) -> None:
+        """
+        Updates winning cells after piece of given color was played to bitboard.
+        """
+
+        bitboard = self.__bitboard
+        self.__history.append((self.__winning[1], self.__winning[2]))
+        self.__winning[color] = bitboard.winning_cells(color)
+        self.__winning[3 - color] &= ~bitboard.occupied
+
+    def remove(self) -> None:
+        """
+        Restores winning cells after last move was taken back from bitboard.
+        """
+
+        if self.__history:
+            self.__winning[1], self.__winning[2] = self.__history.pop()
+        else:
+            self.__scan()
+
+    def winning(self, color: int) -> int:
+        return self.__winning[color]
+
+    def threats(self, color: int) -> Threats:
+        """
+        Returns threats of given color in current position.
+
+        Args:
+            color (int): Color of player.
+
+        Returns:
+            Threats: Winning, immediate, double threat and losing cells.
+        """
+
+        winning = self.__winning[color]
+        playable = self.__bitboard.playable()
+        immediate = winning & playable
+        double = (
+            immediate if immediate & (immediate - 1) else immediate & (winning >> 1)
+        )
+
+        return Threats(
+            winning, immediate, double, (self.__winning[3 - color] >> 1) & playable
+        )
+
+    def __scan(self) -> None:
+        bitboard = self.__bitboard
+
+        for color in (1, 2):
+            self.__winning[color] = bitboard.winning_cells(color)
@@ -0,0 +1,426 @@
+import itertools
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from statistics import NormalDist
+from typing import Iterable, Iterator, NamedTuple, Sequence, TextIO
+
+from duo_game_lib.game_state import GameState
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.move_ordering import MoveOrdering
+from connect_four_lib.search_limits import SearchLimits
+from connect_four_lib.strength import get_level, play_move
+from connect_four_lib.transposition_table import TranspositionTable
+
+
+class EngineConfig(NamedTuple):
+    """
+    Settings of an engine taking part in a tournament.
+
+    Attributes:
+        name (str): Unique name of configuration.
+        difficulty (int): Time limit of move in milliseconds, not used when
+            nodes or depth are limited. Defaults to 1000.
+        weight (int): Weight of ConnectFourEngine. Defaults to 2.
+        depth (int | None): Maximum depth of search, None for no limit.
+        nodes (int | None): Maximum number of nodes of search, None for no limit.
+        randomness (float): Probability of random move, see strength.play_move.
+        table_mb (float): Size of transposition table. Defaults to 16.
+        hash_move (bool): Move ordering step, see MoveOrdering.
+        threats (bool): Move ordering step, see MoveOrdering.
+        killers (bool): Move ordering step, see MoveOrdering.
+        history (bool): Move ordering step, see MoveOrdering.
+        center_first (bool): Move ordering step, see MoveOrdering.
+    """
+
+    name: str
+    difficulty: int = 1000
+    weight: int = 2
+    depth: int | None = None
+    nodes: int | None = None
+    randomness: float = 0
+    table_mb: float = 16
+    hash_move: bool = True
+    threats: bool = False
+    killers: bool = True
+    history: bool = True
+    center_first: bool = True
+
+    @classmethod
+    def from_elo(cls, name: str, elo: int, **fields) -> "EngineConfig":
+        """
+        Returns configuration with depth, nodes and randomness of strength level
+        of given Elo.
+        """
+
+        level = get_level(elo)
+
+        return cls(
+            name,
+            depth=level.depth,
+            nodes=level.nodes,
+            randomness=level.randomness,
+            **fields,
+        )
+
+    @property
+    def limits(self) -> SearchLimits:
+        return SearchLimits(
+            time_limit=(
+                self.difficulty if self.nodes is None and self.depth is None else None
+            ),
+            nodes=self.nodes,
+            depth=self.depth,
+        )
+
+    def create_engine(self) -> ConnectFourEngine:
+        return ConnectFourEngine(
+            self.difficulty,
+            weight=self.weight,
+            table=TranspositionTable(self.table_mb),
+            ordering=MoveOrdering(
+                self.hash_move,
+                self.threats,
+                self.killers,
+                self.history,
+                self.center_first,
+            ),
+        )
+
+
+class MoveStats(NamedTuple):
+    """
+    Totals over moves searched by one engine in one game.
+    """
+
+    moves: int = 0
+    time: float = 0
+    nodes: int = 0
+    depth: int = 0
+
+
+class GameResult(NamedTuple):
+    """
+    Result of one tournament game.
+
+    Attributes:
+        first (str): Name of configuration that moved first.
+        second (str): Name of configuration that moved second.
+        opening (str): Moves played before engines took over.
+        moves (str): All moves of the game.
+        score (float): 1 if first won, 0 if second won and 0.5 for a draw.
+        first_stats (MoveStats): Search totals of first.
+        second_stats (MoveStats): Search totals of second.
+    """
+
+    first: str
+    second: str
+    opening: str
+    moves: str
+    score: float
+    first_stats: MoveStats
+    second_stats: MoveStats
+
+
+class EloEstimate(NamedTuple):
+    """
+    Elo difference with bounds of its confidence interval.
+    """
+
+    elo: float
+    low: float
+    high: float
+
+
+class ConfigSummary(NamedTuple):
+    """
+    Results of one configuration in a tournament. Elo is relative to baseline
+    and estimated from games against it.
+    """
+
+    name: str
+    games: int
+    score: float
+    elo: EloEstimate
+    time_per_move: float
+    nodes_per_move: float
+    depth_per_move: float
+
+
+def play_game(first: EngineConfig, second: EngineConfig, opening: str) -> GameResult:
+    """
+    Plays game between two engines starting after opening moves. Random moves
+    are seeded by names of engines and opening, so games limited by nodes or
+    depth can be repeated.
+
+    Args:
+        first (EngineConfig): Engine moving first.
+        second (EngineConfig): Engine moving second.
+        opening (str): Moves played before engines start.
+
+    Returns:
+        GameResult: Result and search totals of both engines.
+    """
+
+    configs = (first, second)
+    engines = [config.create_engine() for config in configs]
+    stats = [MoveStats(), MoveStats()]
+    judge = ConnectFourJudge()
+    generator = random.Random(f"{first.name} {second.name} {opening}")
+
+    try:
+        for move in opening:
+            judge.add_move(move)
+
+            for engine in engines:
+                engine.add_move(move)
+
+        while judge.is_game_over() == GameState.CONTINUE:
+            player = judge.ply % 2
+            engine = engines[player]
+            move = play_move(
+                engine, configs[player].limits, configs[player].randomness, generator
+            )
+            info = engine.info
+            stats[player] = MoveStats(
+                stats[player].moves + 1,
+                stats[player].time + info.time,
+                stats[player].nodes + info.nodes,
+                stats[player].depth + info.depth,
+            )
+            judge.add_move(move)
+
+            for engine in engines:
+                engine.add_move(move)
+    finally:
+        for engine in engines:
+            engine.close()
+
+    if judge.is_game_over() == GameState.DRAW:
+        score = 0.5
+    else:
+        score = 1 if judge.ply % 2 == 1 else 0
+
+    return GameResult(
+        first.name,
+        second.name,
+        opening,
+        "".join(judge.get_all_moves()),
+        score,
+        *stats,
+    )
+
+
+def balanced_openings(plies: int = 3, count: int = 16, depth: int = 4) -> list[str]:
+    """
+    Returns openings where neither player has much advantage. Openings are
+    ranked by absolute evaluation of the engine searched to given depth. Mirror
+    images are returned only once.
+
+    Args:
+        plies (int): Number of moves in openings. Defaults to 3.
+        count (int): Number of openings. Defaults to 16.
+        depth (int): Depth of evaluation. Defaults to 4.
+
+    Returns:
+        list[str]: Openings, most balanced first.
+    """
+
+    table = TranspositionTable()
+    ranked = []
+
+    for moves in itertools.product(range(7), repeat=plies):
+        if list(moves) > [6 - move for move in moves]:
+            continue
+
+        engine = ConnectFourEngine(difficulty=10**9, table=table)
+        opening = "".join(map(str, moves))
+
+        for move in opening:
+            engine.add_move(move)
+
+        value = engine.evaluate(depth)
+
+        if value is not None:
+            ranked.append((abs(value), opening))
+
+    return [opening for _, opening in sorted(ranked)[:count]]
+
+
+def run_tournament(
+    configs: Sequence[EngineConfig],
+    openings: Sequence[str],
+    rounds: int = 1,
+    workers: int | None = None,
+) -> Iterator[GameResult]:
+    """
+    Plays every pair of configurations against each other from every opening
+    with both colors, games running in parallel in a pool of processes.
+
+    Args:
+        configs (Sequence[EngineConfig]): Configurations with unique names.
+        openings (Sequence[str]): Openings of games.
+        rounds (int): Number of times every game is played. Defaults to 1.
+        workers (int | None): Number of processes. Defaults to number of CPUs.
+
+    Yields:
+        GameResult: Results in order games finish.
+    """
+
+    games = [
+        (first, second, opening)
+        for _ in range(rounds)
+        for pair in itertools.combinations(configs, 2)
+        for first, second in (pair, pair[::-1])
+        for opening in openings
+    ]
+    pool = ProcessPoolExecutor(workers or os.cpu_count())
+
+    try:
+        futures = [pool.submit(play_game, *game) for game in games]
+
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def write_result(file: TextIO, result: GameResult) -> None:
+    """
+    Appends result to file as one line of JSON and flushes file, so results
+    are kept if the tournament is interrupted.
+    """
+
+    file.write(json.dumps(result) + "\n")
+    file.flush()
+
+
+def read_results(lines: Iterable[str]) -> Iterator[GameResult]:
+    """
+    Reads results written by write_result.
+    """
+
+    for line in lines:
+        if line.strip():
+            *fields, first_stats, second_stats = json.loads(line)
+            yield GameResult(*fields, MoveStats(*first_stats), MoveStats(*second_stats))
+
+
+def estimate_elo(scores: Sequence[float], confidence: float = 0.95) -> EloEstimate:
+    """
+    Estimates Elo difference from scores of games, with confidence interval
+    from normal approximation of the mean score.
+
+    Args:
+        scores (Sequence[float]): Scores of games, 1 for win, 0.5 for draw and
+            0 for loss.
+        confidence (float): Probability covered by interval. Defaults to 0.95.
+
+    Returns:
+        EloEstimate: Elo difference and bounds, infinite if score is 0 or 1.
+    """
+
+    if not scores:
+        return EloEstimate(0, -math.inf, math.inf)
+
+    mean = sum(scores) / len(scores)
+    deviation = math.sqrt(sum((score - mean) ** 2 for score in scores) / len(scores))
+    margin = NormalDist().inv_cdf((1 + confidence) / 2) * deviation
+    margin /= math.sqrt(len(scores))
+
+    return EloEstimate(
+        _score_to_elo(mean), _score_to_elo(mean - margin), _score_to_elo(mean + margin)
+    )
+
+
+def _score_to_elo(score: float) -> float:
+    if score <= 0:
+        return -math.inf
+
+    if score >= 1:
+        return math.inf
+
+    return -400 * math.log10(1 / score - 1)
+
+
+def summarize(
+    results: Iterable[GameResult], baseline: str | None = None
+) -> list[ConfigSummary]:
+    """
+    Summarizes results of every configuration.
+
+    Args:
+        results (Iterable[GameResult]): Results of tournament.
+        baseline (str | None): Name of configuration that has Elo 0. Defaults
+            to first configuration of first result.
+
+    Returns:
+        list[ConfigSummary]: Summaries in order configurations appear in results.
+    """
+
+    scores: dict[str, list[float]] = {}
+    baseline_scores: dict[str, list[float]] = {}
+    stats: dict[str, MoveStats] = {}
+
+    for result in results:
+        baseline = baseline or result.first
+        sides = (
+            (result.first, result.second, result.score, result.first_stats),
+            (result.second, result.first, 1 - result.score, result.second_stats),
+        )
+
+        for name, opponent, score, game_stats in sides:
+            scores.setdefault(name, []).append(score)
+            total = stats.get(name, MoveStats())
+            stats[name] = MoveStats(*map(sum, zip(total, game_stats)))
+
+            if opponent == baseline:
+                baseline_scores.setdefault(name, []).append(score)
+
+    summaries = []
+
+    for name, config_scores in scores.items():
+        moves = stats[name].moves or 1
+        summaries.append(
+            ConfigSummary(
+                name,
+                len(config_scores),
+                sum(config_scores) / len(config_scores),
+                (
+                    EloEstimate(0, 0, 0)
+                    if name == baseline
+                    else estimate_elo(baseline_scores.get(name, []))
+                ),
+                stats[name].time / moves,
+                stats[name].nodes / moves,
+                stats[name].depth / moves,
+            )
+        )
+
+    return summaries
+
+
+def format_report(summaries: Iterable[ConfigSummary]) -> str:
+    """
+    Formats summaries as a table with one configuration per line.
+    """
+
+    lines = [
+        f"{'name':<16} {'games':>6} {'score':>6} {'elo':>7} {'95% interval':>17}"
+        f" {'ms/move':>8} {'nodes/move':>11} {'depth':>6}"
+    ]
+
+    for summary in summaries:
+        interval = f"[{summary.elo.low:.0f}, {summary.elo.high:.0f}]"
+        lines.append(
+            f"{summary.name:<16} {summary.games:>6} {summary.score:>6.3f}"
+            f" {summary.elo.elo:>7.0f} {interval:>17}"
+            f" {summary.time_per_move * 1000:>8.1f} {summary.nodes_per_move:>11.0f}"
+            f" {summary.depth_per_move:>6.2f}"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,99 @@
+from enum import Enum
+from typing import NamedTuple
+
+
+class Bound(Enum):
+    EXACT = "EXACT"
+    LOWER = "LOWER"
+    UPPER = "UPPER"
+
+
+class ReplacementPolicy(Enum):
+    ALWAYS = "ALWAYS"
+    DEPTH_PREFERRED = "DEPTH_PREFERRED"
+
+
+class TableEntry(NamedTuple):
+    key: int
+    depth: int
+    value: float
+    bound: Bound
+    move: int | None
+    generation: int
+
+
+class TranspositionTable:
+    """
+    Fixed size hash table of searched positions.
+
+    Values are stored from the point of view of the player to move, so the same
+    table can be used for both colors.
+    """
+
+    ENTRY_SIZE = 200
+
+    def __init__(
+        self,
+        size_mb: float = 16,
+        policy: ReplacementPolicy = ReplacementPolicy.DEPTH_PREFERRED,
+    ) -> None:
+        self.capacity: int = max(1, int(size_mb * 1024 * 1024) // self.ENTRY_SIZE)
+        self.policy: ReplacementPolicy = policy
+        self.__entries: list[TableEntry | None] = [None] * self.capacity
+        self.__generation: int = 0
+
+    def __len__(self) -> int:
+        return self.capacity - self.__entries.count(None)
+
+    def new_search(self) -> None:
+        """
+        Marks entries of previous searches as replaceable without dropping them.
+        """
+
+        self.__generation += 1
+
+    def clear(self) -> None:
+        self.__entries = [None] * self.capacity
+
+    def get(self, key: int) -> TableEntry | None:
+        entry = self.__entries[key % self.capacity]
+
+        if entry is None or entry.key != key:
+            return None
+
+        return entry
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        value: float,
+        bound: Bound,
+        move: int | None,
+    ) -> None:
+        """
+        Stores search result unless replacement policy keeps the old entry.
+
+        Args:
+            key (int): Hash of position.
+            depth (int): Depth of search below position.
+            value (float): Evaluation for player to move.
+            bound (Bound): Whether value is exact, lower or upper bound.
+            move (int | None): Best move found.
+        """
+
+        index = key % self.capacity
+        old = self.__entries[index]
+
+        if (
+            self.policy == ReplacementPolicy.DEPTH_PREFERRED
+            and old is not None
+            and old.key != key
+            and old.generation == self.__generation
+            and old.depth > depth
+        ):
+            return
+
+        self.__entries[index] = TableEntry(
+            key, depth, value, bound, move, self.__generation
+        )
@@ -0,0 +1,170 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+
+CORPUS = {
+    "opening": ["3324", "243540"],
+    "midgame": ["433561151643", "2410200044013242"],
+    "endgame": [
+        "5556620625444053420526646111",
+        "03652060233506525341215300661652",
+    ],
+}
+
+SEARCH_DEPTHS = {"opening": 8, "midgame": 8, "endgame": 10}
+
+LOWER_IS_BETTER = {"time_to_depth"}
+NOT_COMPARED = {"nodes", "depth"}
+
+
+def create_judge(moves: str) -> ConnectFourJudge:
+    judge = ConnectFourJudge()
+
+    for move in moves:
+        judge.add_move(move)
+
+    return judge
+
+
+def measure(function: Callable[[], None], calls: int, repeat: int) -> float:
+    """
+    Runs function repeatedly and returns calls per second of the fastest round.
+    """
+
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        for _ in range(calls):
+            function()
+
+        best = min(best, time.perf_counter() - start)
+
+    return calls / best
+
+
+def benchmark_judge(moves: str, calls: int, repeat: int) -> dict[str, float]:
+    judge = create_judge(moves)
+    valid_moves = [str(move) for move in judge.get_valid_moves()]
+
+    def add_and_remove() -> None:
+        for move in valid_moves:
+            judge.add_move(move)
+            judge.remove_last_move()
+
+    return {
+        "add_remove_move": measure(add_and_remove, calls, repeat) * len(valid_moves),
+        "is_game_over": measure(judge.is_game_over, calls, repeat),
+        "analyze": measure(judge.analyze, calls, repeat),
+    }
+
+
+def benchmark_search(moves: str, depth: int, repeat: int) -> dict[str, float]:
+    best_time, nodes = float("inf"), 0
+
+    for _ in range(repeat):
+        engine = ConnectFourEngine(difficulty=10**9, judge=create_judge(moves))
+        info = engine.search(max_depth=depth)
+        best_time, nodes = min(best_time, info.time), info.nodes
+
+    return {
+        "time_to_depth": best_time,
+        "nodes": nodes,
+        "nodes_per_second": nodes / best_time,
+    }
+
+
+def run(calls: int, repeat: int) -> dict:
+    """
+    Benchmarks every position of corpus.
+
+    Returns:
+        dict: Report with metrics by position, throughputs as calls per second
+        and time to depth in seconds.
+    """
+
+    results = {}
+
+    for phase, positions in CORPUS.items():
+        for index, moves in enumerate(positions):
+            name = f"{phase}-{index}"
+            results[name] = benchmark_judge(moves, calls, repeat)
+            results[name].update(benchmark_search(moves, SEARCH_DEPTHS[phase], repeat))
+            results[name]["depth"] = SEARCH_DEPTHS[phase]
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Returns descriptions of metrics that got worse than baseline by more than
+    tolerance. Metrics missing from either report are skipped.
+    """
+
+    regressions = []
+
+    for position, metrics in current["results"].items():
+        baseline_metrics = baseline["results"].get(position, {})
+
+        for metric, value in metrics.items():
+            old_value = baseline_metrics.get(metric)
+
+            if old_value is None or metric in NOT_COMPARED:
+                continue
+
+            if metric in LOWER_IS_BETTER:
+                change = value / old_value - 1 if old_value else 0
+            else:
+                change = old_value / value - 1 if value else float("inf")
+
+            if change > tolerance:
+                regressions.append(
+                    f"{position} {metric}: {old_value:.6g} -> {value:.6g}"
+                    f" ({change:.0%} slower)"
+                )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark judge and engine.")
+    parser.add_argument("--output", help="Write results as JSON to file.")
+    parser.add_argument("--compare", help="Baseline JSON to compare results with.")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    report = run(args.calls, args.repeat)
+    output = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare(report, json.load(file), args.tolerance)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import sys
+
+from connect_four_lib.engine_server import EngineServer
+from connect_four_lib.opening_book import OpeningBook
+from connect_four_lib.transposition_table import TranspositionTable
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve engines of many games over stdin and stdout."
+    )
+    parser.add_argument("--max-games", type=int, default=256)
+    parser.add_argument("--difficulty", type=int, default=1000)
+    parser.add_argument("--table-mb", type=float, default=64)
+    parser.add_argument("--book", help="Opening book shared by all games.")
+    args = parser.parse_args()
+
+    server = EngineServer(
+        args.max_games,
+        args.difficulty,
+        table=TranspositionTable(size_mb=args.table_mb),
+        book=OpeningBook(args.book) if args.book else None,
+    )
+
+    for line in sys.stdin:
+        if line.strip() == "quit":
+            break
+
+        answer = server.handle(line)
+
+        if answer is not None:
+            print(answer, flush=True)
+
+    server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import argparse
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.connect_four_solver import ConnectFourSolver
+from connect_four_lib.opening_book import generate_opening_book
+from connect_four_lib.transposition_table import TranspositionTable
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate opening book.")
+    parser.add_argument("path")
+    parser.add_argument("--plies", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--solver", action="store_true")
+    args = parser.parse_args()
+
+    table = TranspositionTable(size_mb=256)
+
+    def choose_move(judge: ConnectFourJudge) -> str:
+        if args.solver:
+            return ConnectFourSolver(judge).get_best_move()
+
+        engine = ConnectFourEngine(difficulty=10**9, judge=judge, table=table)
+
+        return engine.get_best_move(args.depth)
+
+    size = generate_opening_book(args.path, args.plies, choose_move)
+    print(f"{size} positions written to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
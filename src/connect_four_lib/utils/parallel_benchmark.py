@@ -0,0 +1,44 @@
+import argparse
+import os
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+
+POSITIONS = [
+    "332",
+    "3232",
+    "3324452",
+    "4233",
+    "33244523",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare search depth reached with different numbers of workers."
+    )
+    parser.add_argument("--difficulty", type=int, default=1000)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count()})
+    )
+    args = parser.parse_args()
+
+    print("workers " + " ".join(f"{moves:>12}" for moves in POSITIONS))
+
+    for workers in args.workers:
+        depths = []
+
+        for moves in POSITIONS:
+            engine = ConnectFourEngine(args.difficulty, workers=workers)
+
+            for move in moves:
+                engine.add_move(move)
+
+            engine.get_best_move()
+            engine.close()
+            depths.append(engine.depth)
+
+        print(f"{workers:>7} " + " ".join(f"{depth:>12}" for depth in depths))
+
+
+if __name__ == "__main__":
+    main()
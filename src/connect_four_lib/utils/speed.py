@@ -1,20 +1,32 @@
 import cProfile
+import random
 
 from connect_four_lib.connect_four_heuristic import ConnectFourHeuristic
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.evaluation_cache import EvaluationCache
 
 
-def main():
-    board = [
-        [0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 1, 0, 0, 1],
-        [1, 2, 1, 2, 1, 0, 2],
-        [1, 2, 1, 2, 1, 2, 2],
-        [1, 2, 1, 2, 1, 1, 2],
-    ]
+def random_boards(count: int, seed: int = 0) -> list[list[list[int]]]:
+    generator = random.Random(seed)
+    boards = []
 
-    for _ in range(1000):
-        ConnectFourHeuristic.evaluate(board, 1)
+    while len(boards) < count:
+        judge = ConnectFourJudge()
 
+        for _ in range(generator.randrange(4, 30)):
+            judge.add_move(str(generator.choice(judge.get_valid_moves())))
 
-cProfile.run("main()", sort="tottime")
+        boards.append([column.copy() for column in judge.board])
+
+    return boards
+
+
+def main(boards: list[list[list[int]]]) -> None:
+    cache = EvaluationCache(capacity=0)
+
+    for board in boards:
+        ConnectFourHeuristic.evaluate(board, 1, cache)
+
+
+positions = random_boards(1000)
+cProfile.run("main(positions)", sort="tottime")
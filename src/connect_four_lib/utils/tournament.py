@@ -0,0 +1,96 @@
+import argparse
+import sys
+
+from connect_four_lib.tournament import (
+    EngineConfig,
+    balanced_openings,
+    format_report,
+    read_results,
+    run_tournament,
+    summarize,
+    write_result,
+)
+
+
+def parse_config(text: str) -> EngineConfig:
+    """
+    Parses configuration written as ``name:field=value,...``, for example
+    ``fast:difficulty=200,killers=false``. Field ``elo`` selects depth, nodes
+    and randomness of the strength level of the Elo.
+    """
+
+    name, _, fields = text.partition(":")
+    values = {}
+    elo = None
+
+    for field in filter(None, fields.split(",")):
+        key, _, value = field.partition("=")
+
+        if key == "elo":
+            elo = int(value)
+            continue
+
+        kind = EngineConfig.__annotations__.get(key)
+
+        if kind is None or key == "name":
+            raise argparse.ArgumentTypeError(f"unknown field {key}")
+
+        if kind is bool:
+            values[key] = value.lower() in ("1", "true", "yes")
+        elif kind is float:
+            values[key] = float(value)
+        else:
+            values[key] = int(value)
+
+    if elo is not None:
+        return EngineConfig.from_elo(name, elo, **values)
+
+    return EngineConfig(name, **values)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play engine configurations against each other and estimate Elo."
+    )
+    parser.add_argument(
+        "--engine",
+        type=parse_config,
+        action="append",
+        default=[],
+        help="Configuration as name:field=value,... First one is the baseline.",
+    )
+    parser.add_argument("--plies", type=int, default=3)
+    parser.add_argument("--openings", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--output", default="tournament.jsonl")
+    parser.add_argument(
+        "--report", action="store_true", help="Only report results of output file."
+    )
+    args = parser.parse_args()
+
+    if not args.report:
+        if len(args.engine) < 2:
+            parser.error("at least two engines are needed")
+
+        openings = balanced_openings(args.plies, args.openings)
+
+        with open(args.output, "a", encoding="utf-8") as file:
+            for result in run_tournament(
+                args.engine, openings, args.rounds, args.workers
+            ):
+                write_result(file, result)
+                print(
+                    f"{result.first} - {result.second} {result.score:g}"
+                    f" {result.moves}",
+                    file=sys.stderr,
+                )
+
+    baseline = args.engine[0].name if args.engine else None
+
+    with open(args.output, encoding="utf-8") as file:
+        print(format_report(summarize(read_results(file), baseline)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from functools import cache
+
+
+class WinningLines:
+    """
+    Index of all lines of cells that win the game on a board.
+
+    Cells are numbered column by column as ``column * height + row``. Bitmasks
+    use the layout of BitBoard, where every column takes ``height + 1`` bits.
+    """
+
+    def __init__(self, width: int = 7, height: int = 6, length: int = 4) -> None:
+        self.length: int = length
+        self.lines: list[tuple[tuple[int, int], ...]] = []
+        self.cell_lines: list[list[int]] = [[] for _ in range(width * height)]
+        self.cell_bits: list[int] = [
+            1 << (column * (height + 1) + row)
+            for column in range(width)
+            for row in range(height)
+        ]
+        self.masks: list[int] = []
+        self.cell_masks: list[list[int]] = [[] for _ in range(width * height)]
+
+        self.__build(width, height)
+
+    def __build(self, width: int, height: int) -> None:
+        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
+        steps = self.length - 1
+
+        for column in range(width):
+            for row in range(height):
+                for column_step, row_step in directions:
+                    if not 0 <= column + steps * column_step < width:
+                        continue
+
+                    if not 0 <= row + steps * row_step < height:
+                        continue
+
+                    line = tuple(
+                        (column + i * column_step, row + i * row_step)
+                        for i in range(self.length)
+                    )
+                    self.__add(line, height)
+
+    def __add(self, line: tuple[tuple[int, int], ...], height: int) -> None:
+        index = len(self.lines)
+        cells = [column * height + row for column, row in line]
+        mask = sum(self.cell_bits[cell] for cell in cells)
+
+        self.lines.append(line)
+        self.masks.append(mask)
+
+        for cell in cells:
+            self.cell_lines[cell].append(index)
+            self.cell_masks[cell].append(mask)
+
+
+@cache
+def get_winning_lines(width: int = 7, height: int = 6, length: int = 4) -> WinningLines:
+    """
+    Returns winning lines of board, built only once per board size.
+
+    Args:
+        width (int): Number of columns. Defaults to 7.
+        height (int): Number of rows. Defaults to 6.
+        length (int): Number of connected pieces needed to win. Defaults to 4.
+
+    Returns:
+        WinningLines: Shared index of winning lines.
+    """
+
+    return WinningLines(width, height, length)
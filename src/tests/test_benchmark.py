@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from connect_four_lib.utils.benchmark import compare
+
+
+class TestBenchmark(TestCase):
+    def setUp(self) -> None:
+        self.baseline = {
+            "results": {
+                "opening-0": {
+                    "is_game_over": 1000,
+                    "time_to_depth": 1.0,
+                    "nodes": 500,
+                }
+            }
+        }
+
+    def report(self, **metrics) -> dict:
+        return {"results": {"opening-0": metrics}}
+
+    def test_compare_accepts_changes_within_tolerance(self):
+        report = self.report(is_game_over=950, time_to_depth=1.05, nodes=900)
+
+        self.assertEqual(compare(report, self.baseline, 0.1), [])
+
+    def test_compare_flags_lower_throughput(self):
+        report = self.report(is_game_over=500, time_to_depth=1.0)
+        regressions = compare(report, self.baseline, 0.1)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("opening-0 is_game_over"))
+
+    def test_compare_flags_longer_time_to_depth(self):
+        report = self.report(is_game_over=1000, time_to_depth=1.5)
+        regressions = compare(report, self.baseline, 0.1)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("opening-0 time_to_depth"))
+
+    def test_compare_skips_new_positions(self):
+        report = {"results": {"endgame-0": {"is_game_over": 1}}}
+
+        self.assertEqual(compare(report, self.baseline, 0.1), [])
@@ -0,0 +1,151 @@
+import random
+from unittest import TestCase
+
+from connect_four_lib.bitboard import BitBoard
+from connect_four_lib.winning_lines import get_winning_lines
+
+
+class TestBitBoard(TestCase):
+    def setUp(self) -> None:
+        self.bitboard = BitBoard()
+
+    def play_moves(self, moves: list[int]) -> None:
+        for i, move in enumerate(moves):
+            self.bitboard.play(move, i % 2 + 1)
+
+    def test_play_returns_landing_row(self):
+        self.assertEqual(self.bitboard.play(3, 1), 0)
+        self.assertEqual(self.bitboard.play(3, 2), 1)
+        self.assertEqual(self.bitboard.play(4, 1), 0)
+
+    def test_undo_removes_topmost_piece(self):
+        self.play_moves([3, 3, 3])
+
+        self.assertEqual(self.bitboard.undo(3), 2)
+        self.assertEqual(self.bitboard.column_height(3), 2)
+        self.assertEqual(self.bitboard.masks[1], 1 << 21)
+
+    def test_undo_from_empty_column_raises_error(self):
+        self.assertRaises(IndexError, self.bitboard.undo, 0)
+
+    def test_full_column_can_not_be_played(self):
+        self.play_moves([0] * 6)
+
+        self.assertFalse(self.bitboard.can_play(0))
+        self.assertTrue(self.bitboard.can_play(1))
+        self.assertRaises(IndexError, self.bitboard.play, 0, 1)
+
+    def test_from_board_matches_played_moves(self):
+        board = [
+            [1, 2, 1, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [2, 0, 0, 0, 0, 0],
+            [0] * 6,
+            [0] * 6,
+            [0] * 6,
+        ]
+        self.play_moves([0, 0, 1, 3, 0])
+
+        bitboard = BitBoard.from_board(board)
+
+        self.assertEqual(bitboard.masks, self.bitboard.masks)
+        self.assertEqual(bitboard.occupied, self.bitboard.occupied)
+
+    def test_is_win_detects_all_directions(self):
+        directions = {
+            "vertical": [0, 1, 0, 1, 0, 1, 0],
+            "horizontal": [0, 0, 1, 1, 2, 2, 3],
+            "upwards diagonal": [0, 1, 1, 2, 2, 3, 2, 3, 3, 6, 3],
+            "downwards diagonal": [6, 5, 5, 4, 4, 3, 4, 3, 3, 0, 3],
+        }
+
+        for name, moves in directions.items():
+            with self.subTest(name):
+                self.bitboard = BitBoard()
+                self.play_moves(moves)
+
+                self.assertTrue(self.bitboard.is_win(self.bitboard.masks[1]))
+                self.assertFalse(self.bitboard.is_win(self.bitboard.masks[2]))
+
+    def test_is_win_does_not_wrap_between_columns(self):
+        mask = 0b10111000
+
+        self.assertFalse(self.bitboard.is_win(mask))
+
+    def test_is_winning_move(self):
+        self.play_moves([0, 1, 0, 1, 0, 1])
+
+        self.assertTrue(self.bitboard.is_winning_move(0, 1))
+        self.assertTrue(self.bitboard.is_winning_move(1, 2))
+        self.assertFalse(self.bitboard.is_winning_move(2, 1))
+
+    def test_key_is_unique(self):
+        keys = set()
+
+        for moves in ([], [0], [1], [0, 0], [0, 1], [1, 0]):
+            self.bitboard = BitBoard()
+            self.play_moves(moves)
+            keys.add(self.bitboard.key())
+
+        self.assertEqual(len(keys), 6)
+
+    def test_canonical_key_is_shared_with_mirror_image(self):
+        self.play_moves([0, 3, 1])
+        mirror_image = BitBoard()
+
+        for i, move in enumerate([6, 3, 5]):
+            mirror_image.play(move, i % 2 + 1)
+
+        key, mirrored = self.bitboard.canonical_key()
+        mirror_key, mirror_mirrored = mirror_image.canonical_key()
+
+        self.assertEqual(key, mirror_key)
+        self.assertNotEqual(mirrored, mirror_mirrored)
+
+    def test_mirror_hash_is_hash_of_mirror_image(self):
+        self.play_moves([0, 3, 1, 1])
+        mirror_image = BitBoard()
+
+        for i, move in enumerate([6, 3, 5, 5]):
+            mirror_image.play(move, i % 2 + 1)
+
+        self.assertEqual(self.bitboard.mirror_hash, mirror_image.hash)
+        self.assertEqual(self.bitboard.hash, mirror_image.mirror_hash)
+        self.assertEqual(
+            self.bitboard.canonical_hash()[0], mirror_image.canonical_hash()[0]
+        )
+
+    def test_winning_cells_and_is_win_match_winning_lines_of_variants(self):
+        generator = random.Random(5)
+
+        for width, height, length in [(7, 6, 4), (8, 7, 4), (9, 7, 5), (5, 4, 3)]:
+            lines = get_winning_lines(width, height, length)
+
+            for _ in range(30):
+                bitboard = BitBoard(width, height, length)
+
+                for ply in range(generator.randint(0, width * height - 1)):
+                    columns = [
+                        column for column in range(width) if bitboard.can_play(column)
+                    ]
+                    bitboard.play(generator.choice(columns), ply % 2 + 1)
+
+                for color in (1, 2):
+                    pieces = bitboard.masks[color]
+                    expected = 0
+
+                    for mask in lines.masks:
+                        missing = mask & ~pieces
+
+                        if (
+                            missing & (missing - 1) == 0
+                            and not missing & bitboard.occupied
+                        ):
+                            expected |= missing
+
+                    self.assertEqual(bitboard.winning_cells(color), expected)
+                    self.assertEqual(
+                        bitboard.is_win(pieces),
+                        any(mask & pieces == mask for mask in lines.masks),
+                    )
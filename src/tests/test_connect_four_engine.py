@@ -1,13 +1,21 @@
+import threading
+import time
 from unittest import TestCase
 from unittest.mock import Mock, call
 
 from connect_four_lib.connect_four_engine import ConnectFourEngine
 from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.move_ordering import MoveOrdering
+from connect_four_lib.parallel_search import ParallelSearch, worker_limits
+from connect_four_lib.search_info import StopReason
+from connect_four_lib.search_limits import CancelToken, SearchLimits
+from connect_four_lib.transposition_table import TranspositionTable
 
 
 class TestConnectFourEngine(TestCase):
     def setUp(self) -> None:
         self.judge_mock = Mock()
+        self.judge_mock.bitboard.width = 7
         self.engine = ConnectFourEngine(judge=self.judge_mock)
         self.engine_with_judge = ConnectFourEngine()
 
@@ -19,13 +27,13 @@ class TestConnectFourEngine(TestCase):
         self.judge_mock.add_move.assert_has_calls([call("1"), call("5"), call("2")])
 
     def test_get_best_move_return_value_up_to_two_moves(self):
-        self.judge_mock.get_all_moves.return_value = []
+        self.judge_mock.ply = 0
         self.assertEqual(self.engine.get_best_move(), str(3))
 
-        self.judge_mock.get_all_moves.return_value = [1]
+        self.judge_mock.ply = 1
         self.assertEqual(self.engine.get_best_move(), str(3))
 
-        self.judge_mock.get_all_moves.return_value = [2, 3]
+        self.judge_mock.ply = 2
         self.assertEqual(self.engine.get_best_move(), str(3))
 
     def test_get_best_move_starts_in_the_middle(self):
@@ -116,7 +124,7 @@ class TestConnectFourEngine(TestCase):
             judge=ConnectFourJudge(board=board1, moves=[3, 3, 2])
         )
 
-        self.assertIn(engine1.get_best_move(), ["2", "4"])
+        self.assertIn(engine1.get_best_move(), ["1", "4"])
 
     def test_engine_prefers_middle_column_in_beginning(self):
         move_list = []
@@ -154,3 +162,376 @@ class TestConnectFourEngine(TestCase):
         engine1 = ConnectFourEngine(judge=ConnectFourJudge(board=board, moves=[2] * 21))
 
         self.assertEqual(engine1.get_best_move(), "4")
+
+    def test_transposition_table_is_kept_between_moves(self):
+        table = TranspositionTable()
+        engine = ConnectFourEngine(difficulty=100, table=table)
+
+        for move in ["3", "3", "2"]:
+            engine.add_move(move)
+
+        engine.get_best_move()
+        entries = len(table)
+        engine.add_move("4")
+        engine.add_move("4")
+        engine.get_best_move()
+
+        self.assertGreater(entries, 0)
+        self.assertGreaterEqual(len(table), entries)
+
+    def test_move_ordering_reduces_visited_nodes(self):
+        nodes = []
+
+        for ordering in [MoveOrdering(False, False, False, False, False), None]:
+            judge = ConnectFourJudge()
+
+            for move in ["3", "3", "2", "4", "4"]:
+                judge.add_move(move)
+
+            engine = ConnectFourEngine(difficulty=10**6, judge=judge, ordering=ordering)
+            engine.get_best_move(max_depth=5)
+            nodes.append(engine.nodes)
+
+        self.assertLess(nodes[1], nodes[0])
+
+    def test_mirror_image_is_found_from_transposition_table(self):
+        table = TranspositionTable()
+        nodes = []
+        best_moves = []
+
+        for moves in [["2", "3", "3", "4", "4"], ["4", "3", "3", "2", "2"]]:
+            judge = ConnectFourJudge()
+
+            for move in moves:
+                judge.add_move(move)
+
+            engine = ConnectFourEngine(difficulty=10**6, judge=judge, table=table)
+            best_moves.append(int(engine.get_best_move(max_depth=5)))
+            nodes.append(engine.nodes)
+
+        self.assertLess(nodes[1], nodes[0] / 10)
+        self.assertEqual(best_moves[1], 6 - best_moves[0])
+
+    def test_only_one_half_of_symmetric_position_is_searched(self):
+        judge = ConnectFourJudge()
+
+        for move in ["3", "3", "3"]:
+            judge.add_move(move)
+
+        engine = ConnectFourEngine(difficulty=10**6, judge=judge)
+
+        self.assertLessEqual(int(engine.get_best_move(max_depth=1)), 3)
+        self.assertEqual(engine.nodes, 5)
+
+    def test_depth_is_deepest_completed_iteration(self):
+        for move in ["3", "3", "2"]:
+            self.engine_with_judge.add_move(move)
+
+        self.engine_with_judge.get_best_move(max_depth=4)
+
+        self.assertEqual(self.engine_with_judge.depth, 4)
+
+    def test_search_returns_info_of_every_iteration(self):
+        iterations = []
+        engine = ConnectFourEngine(difficulty=10**6, on_iteration=iterations.append)
+
+        for move in ["3", "3", "2"]:
+            engine.add_move(move)
+
+        info = engine.search(max_depth=4)
+
+        self.assertEqual(info.stop_reason, StopReason.MAX_DEPTH)
+        self.assertEqual(info.iterations, iterations)
+        self.assertEqual([iteration.depth for iteration in iterations], [1, 2, 3, 4])
+        self.assertEqual(info.nodes, iterations[-1].nodes)
+        self.assertGreater(info.cutoffs, 0)
+        self.assertGreater(info.table_hits, 0)
+        self.assertEqual(info.principal_variation[0], int(info.move))
+        self.assertLessEqual(len(info.principal_variation), 4)
+
+    def test_search_tells_why_it_stopped(self):
+        self.assertEqual(
+            self.engine_with_judge.search().stop_reason, StopReason.OPENING
+        )
+
+        board = [
+            [1, 0, 0, 0, 0, 0],
+            [1, 2, 1, 0, 0, 0],
+            [2, 2, 1, 2, 0, 0],
+            [2, 1, 1, 0, 0, 0],
+            [2, 2, 0, 0, 0, 0],
+            [1, 1, 1, 2, 1, 2],
+            [1, 2, 0, 0, 0, 0],
+        ]
+        engine = ConnectFourEngine(judge=ConnectFourJudge(board=board, moves=[2] * 21))
+
+        self.assertEqual(engine.search().stop_reason, StopReason.CRITICAL_MOVE)
+
+        engine = ConnectFourEngine(difficulty=50)
+
+        for move in ["3", "3", "2"]:
+            engine.add_move(move)
+
+        self.assertEqual(engine.search().stop_reason, StopReason.TIMEOUT)
+
+    def test_judge_is_restored_when_search_is_stopped(self):
+        judge = ConnectFourJudge()
+
+        for move in ["3", "3", "2"]:
+            judge.add_move(move)
+
+        position_hash = judge.hash
+        engine = ConnectFourEngine(difficulty=30, judge=judge)
+        engine.search()
+
+        self.assertEqual(judge.get_all_moves(), ["3", "3", "2"])
+        self.assertEqual(judge.hash, position_hash)
+
+    def test_search_stops_at_wall_clock_time_limit(self):
+        for move in ["3", "3", "2"]:
+            self.engine_with_judge.add_move(move)
+
+        info = self.engine_with_judge.search(limits=SearchLimits(time_limit=200))
+
+        self.assertEqual(info.stop_reason, StopReason.TIMEOUT)
+        self.assertLess(info.time, 0.3)
+
+    def test_search_stops_at_node_limit(self):
+        for move in ["3", "3", "2"]:
+            self.engine_with_judge.add_move(move)
+
+        info = self.engine_with_judge.search(limits=SearchLimits(nodes=1000))
+
+        self.assertEqual(info.stop_reason, StopReason.NODES)
+        self.assertEqual(info.nodes, 1000)
+        self.assertIn(int(info.move), range(7))
+        self.assertGreater(info.depth, 0)
+
+    def test_cancelled_search_returns_valid_move(self):
+        token = CancelToken()
+        token.cancel()
+
+        for move in ["3", "3", "2"]:
+            self.engine_with_judge.add_move(move)
+
+        info = self.engine_with_judge.search(limits=SearchLimits(cancel=token))
+
+        self.assertEqual(info.stop_reason, StopReason.CANCELLED)
+        self.assertIn(int(info.move), range(7))
+
+    def test_best_move_of_unfinished_iteration_is_kept(self):
+        board = [
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [1, 0, 0, 0, 0, 0],
+            [1, 2, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+        ]
+
+        def search(max_depth=None, limits=None):
+            judge = ConnectFourJudge([3, 3, 2], [column.copy() for column in board])
+
+            return ConnectFourEngine(judge=judge).search(max_depth, limits)
+
+        depth_5 = search(max_depth=5)
+        depth_6 = search(max_depth=6)
+        self.assertNotEqual(depth_5.move, depth_6.move)
+
+        info = search(limits=SearchLimits(nodes=depth_5.nodes + 1))
+        self.assertEqual((info.depth, info.move), (5, depth_5.move))
+
+        info = search(limits=SearchLimits(nodes=depth_6.nodes - 1))
+        self.assertEqual((info.depth, info.move), (5, depth_6.move))
+
+    def test_aspiration_windows_do_not_change_value_of_search(self):
+        class FullWindowEngine(ConnectFourEngine):
+            ASPIRATION_LIMIT = 0
+
+        for moves in ["3324", "243540", "433561151643", "2410200044013242"]:
+            values = []
+
+            for engine_class in (ConnectFourEngine, FullWindowEngine):
+                engine = engine_class(difficulty=10**6)
+
+                for move in moves:
+                    engine.add_move(move)
+
+                values.append(engine.search(max_depth=7).iterations[-1].value)
+
+            self.assertEqual(values[0], values[1])
+
+    def test_get_best_move_starts_in_the_middle_of_wider_board(self):
+        for width in (8, 9):
+            engine = ConnectFourEngine(judge=ConnectFourJudge(width=width, height=7))
+
+            self.assertEqual(engine.get_best_move(), str((width - 1) // 2))
+
+    def test_search_plays_connect_five_on_larger_board(self):
+        engine = ConnectFourEngine(judge=ConnectFourJudge(width=9, height=7, length=5))
+
+        for move in ["0", "8", "1", "8", "2", "8", "3"]:
+            engine.add_move(move)
+
+        info = engine.search(max_depth=3)
+        self.assertEqual(info.move, "4")
+
+        engine.add_move("7")
+        self.assertEqual(engine.search(max_depth=3).move, "4")
+
+
+def wait_for_cancel(_position, _move, _depth, limits, _weight):
+    cancel = worker_limits(limits).cancel
+    end = time.perf_counter() + 10
+
+    while not cancel.cancelled and time.perf_counter() < end:
+        time.sleep(0.01)
+
+    return None, 1, 0, 0
+
+
+class TestParallelSearch(TestCase):
+    def setUp(self) -> None:
+        self.board = [
+            [1, 0, 0, 0, 0, 0],
+            [1, 2, 1, 0, 0, 0],
+            [2, 2, 1, 2, 0, 0],
+            [2, 1, 0, 0, 0, 0],
+            [2, 2, 0, 0, 0, 0],
+            [1, 1, 1, 2, 1, 2],
+            [1, 2, 0, 0, 0, 0],
+        ]
+
+    def create_engine(self, moves: list[str], **kwargs) -> ConnectFourEngine:
+        judge = ConnectFourJudge()
+
+        for move in moves:
+            judge.add_move(move)
+
+        return ConnectFourEngine(difficulty=10**6, judge=judge, **kwargs)
+
+    def test_parallel_search_finds_same_move_as_serial_search(self):
+        serial_engine = self.create_engine(["3", "2", "3", "3", "4", "5", "2"])
+        engine = self.create_engine(["3", "2", "3", "3", "4", "5", "2"], workers=2)
+
+        try:
+            move = engine.get_best_move(max_depth=4)
+        finally:
+            engine.close()
+
+        self.assertEqual(move, serial_engine.get_best_move(max_depth=4))
+        self.assertEqual(engine.depth, 4)
+        self.assertEqual(len(engine.info.iterations), 4)
+        self.assertGreater(engine.nodes, 0)
+
+    def test_parallel_search_uses_weight_of_engine(self):
+        moves = list("433561151643")
+        serial_engine = self.create_engine(moves, weight=7)
+        engine = self.create_engine(moves, weight=7, workers=2)
+
+        try:
+            info = engine.search(max_depth=6)
+        finally:
+            engine.close()
+
+        serial_info = serial_engine.search(max_depth=6)
+        self.assertEqual(info.iterations[-1].value, serial_info.iterations[-1].value)
+
+    def test_parallel_search_goes_for_the_quickest_win(self):
+        engine = ConnectFourEngine(
+            difficulty=10**6,
+            judge=ConnectFourJudge(board=self.board, moves=[2] * 20),
+            workers=2,
+        )
+
+        try:
+            self.assertEqual(engine.get_best_move(max_depth=3), "4")
+        finally:
+            engine.close()
+
+    def test_parallel_search_prefers_own_win_to_block(self):
+        engine = self.create_engine(["6", "0", "6", "1", "6", "2"], workers=2)
+
+        try:
+            info = engine.search(max_depth=3)
+        finally:
+            engine.close()
+
+        self.assertEqual(info.move, "6")
+        self.assertEqual(info.stop_reason, StopReason.CRITICAL_MOVE)
+
+    def test_parallel_search_without_time_limit(self):
+        engine = self.create_engine(["3", "3", "2"], workers=2)
+
+        try:
+            depth_info = engine.search(limits=SearchLimits(depth=3))
+            nodes_info = engine.search(limits=SearchLimits(nodes=3000))
+        finally:
+            engine.close()
+
+        self.assertEqual(depth_info.depth, 3)
+        self.assertEqual(depth_info.stop_reason, StopReason.MAX_DEPTH)
+        self.assertGreaterEqual(nodes_info.depth, 1)
+        self.assertEqual(nodes_info.stop_reason, StopReason.NODES)
+
+    def test_parallel_search_stops_at_node_limit(self):
+        engine = self.create_engine(list("433561151643"), workers=2)
+
+        try:
+            for nodes in [500, 3000, 10000]:
+                info = engine.search(limits=SearchLimits(nodes=nodes))
+
+                self.assertEqual(info.stop_reason, StopReason.NODES)
+                self.assertLessEqual(info.nodes, nodes)
+        finally:
+            engine.close()
+
+    def test_cancelled_parallel_search_stops_workers(self):
+        engine = self.create_engine(["3", "3", "2"], workers=2)
+        token = CancelToken()
+        timer = threading.Timer(0.3, token.cancel)
+
+        try:
+            timer.start()
+            info = engine.search(limits=SearchLimits(cancel=token))
+            cancelled_at = time.perf_counter()
+            next_info = engine.search(max_depth=3)
+        finally:
+            timer.cancel()
+            engine.close()
+
+        self.assertEqual(info.stop_reason, StopReason.CANCELLED)
+        self.assertIn(int(info.move), range(7))
+        self.assertLess(time.perf_counter() - cancelled_at, 5)
+        self.assertEqual(next_info.stop_reason, StopReason.MAX_DEPTH)
+
+    def test_cancelled_parallel_search_stops_running_tasks(self):
+        search = ParallelSearch(2, wait_for_cancel)
+        token = CancelToken()
+        timer = threading.Timer(0.2, token.cancel)
+        start_time = time.perf_counter()
+
+        try:
+            timer.start()
+            info = search.search(ConnectFourJudge(), [3, 2], SearchLimits(cancel=token))
+        finally:
+            timer.cancel()
+            search.close()
+
+        self.assertEqual(info.stop_reason, StopReason.CANCELLED)
+        self.assertLess(time.perf_counter() - start_time, 5)
+
+    def test_parallel_search_stops_at_deadline(self):
+        engine = ConnectFourEngine(difficulty=200, workers=2)
+
+        for move in ["3", "3", "2"]:
+            engine.add_move(move)
+
+        try:
+            move = engine.get_best_move()
+        finally:
+            engine.close()
+
+        self.assertIn(int(move), range(7))
+        self.assertLess(engine.depth, 39)
@@ -1,7 +1,13 @@
-from unittest import TestCase
+import importlib.util
+import random
+from unittest import TestCase, skipIf
 
 from connect_four_lib.config import HEURISTIC_BASE, MAX_HEURISTIC
-from connect_four_lib.connect_four_heuristic import ConnectFourHeuristic
+from connect_four_lib.connect_four_heuristic import (
+    ConnectFourHeuristic,
+    IncrementalHeuristic,
+)
+from connect_four_lib.evaluation_cache import EvaluationCache
 
 
 class TestConnectFourHeuristic(TestCase):
@@ -145,3 +151,148 @@ class TestConnectFourHeuristic(TestCase):
             ConnectFourHeuristic.evaluate(board_worse_2, 2),
             ConnectFourHeuristic.evaluate(board_better_2, 2),
         )
+
+    def test_evaluations_are_cached_in_bounded_cache(self):
+        cache = EvaluationCache(capacity=10)
+        generator = random.Random(3)
+        boards = [
+            [[generator.randint(0, 2) for _ in range(6)] for _ in range(7)]
+            for _ in range(30)
+        ]
+
+        for board in boards:
+            ConnectFourHeuristic.evaluate(board, 1, cache)
+
+        self.assertEqual(len(cache), 10)
+        self.assertEqual(cache.evictions, 20)
+
+        for board in boards[-10:]:
+            self.assertEqual(
+                ConnectFourHeuristic.evaluate(board, 2, cache),
+                -ConnectFourHeuristic.evaluate(board, 1, EvaluationCache()),
+            )
+
+        self.assertEqual(cache.hits, 10)
+
+    def test_position_key_separates_board_sizes(self):
+        wide = [[0] * 6 for _ in range(7)]
+        tall = [[0] * 7 for _ in range(6)]
+        wide[6][5] = tall[5][6] = 1
+
+        self.assertNotEqual(
+            ConnectFourHeuristic.position_key(wide),
+            ConnectFourHeuristic.position_key(tall),
+        )
+        self.assertNotEqual(
+            ConnectFourHeuristic.position_key(wide),
+            ConnectFourHeuristic.position_key([[0] * 7 for _ in range(7)]),
+        )
+
+
+class TestIncrementalHeuristic(TestCase):
+    def setUp(self) -> None:
+        self.board = [[0] * 6 for _ in range(7)]
+        self.heuristic = IncrementalHeuristic(self.board)
+
+    def play(self, column: int, color: int) -> None:
+        row = self.board[column].index(0)
+        self.board[column][row] = color
+        self.heuristic.add(column, row, color)
+
+    def assert_equal_to_full_evaluation(self) -> None:
+        for color in (1, 2):
+            self.assertEqual(
+                self.heuristic.evaluate(color),
+                ConnectFourHeuristic.evaluate(self.board, color),
+            )
+
+    def test_evaluate_returns_zero_when_board_is_empty(self):
+        self.assertEqual(self.heuristic.evaluate(1), 0)
+        self.assertEqual(self.heuristic.evaluate(2), 0)
+
+    def test_evaluate_matches_full_evaluation_of_initial_board(self):
+        board = [
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [1, 2, 1, 0, 0, 0],
+            [2, 2, 2, 1, 0, 0],
+            [2, 2, 2, 1, 1, 0],
+            [1, 1, 1, 2, 2, 1],
+        ]
+
+        heuristic = IncrementalHeuristic(board)
+
+        self.assertEqual(heuristic.evaluate(1), ConnectFourHeuristic.evaluate(board, 1))
+        self.assertEqual(heuristic.evaluate(2), ConnectFourHeuristic.evaluate(board, 2))
+
+    def test_evaluate_matches_full_evaluation_during_random_games(self):
+        generator = random.Random(0)
+
+        for _ in range(20):
+            self.setUp()
+            played = []
+
+            for ply in range(generator.randint(1, 42)):
+                columns = [i for i, column in enumerate(self.board) if 0 in column]
+                column = generator.choice(columns)
+                self.play(column, ply % 2 + 1)
+                played.append(column)
+                self.assert_equal_to_full_evaluation()
+
+            while played:
+                column = played.pop()
+                row = self.board[column].index(0) if 0 in self.board[column] else 6
+                row -= 1
+                self.heuristic.remove(column, row, self.board[column][row])
+                self.board[column][row] = 0
+                self.assert_equal_to_full_evaluation()
+
+    def test_evaluate_matches_full_evaluation_of_connect_five(self):
+        generator = random.Random(1)
+        self.board = [[0] * 7 for _ in range(9)]
+        self.heuristic = IncrementalHeuristic(self.board, length=5)
+
+        for ply in range(40):
+            columns = [i for i, column in enumerate(self.board) if 0 in column]
+            self.play(generator.choice(columns), ply % 2 + 1)
+
+            for color in (1, 2):
+                self.assertEqual(
+                    self.heuristic.evaluate(color),
+                    ConnectFourHeuristic.evaluate(self.board, color, length=5),
+                )
+
+
+@skipIf(importlib.util.find_spec("numpy") is None, "numpy is not installed")
+class TestEvaluateBatch(TestCase):
+    def setUp(self) -> None:
+        self.random = random.Random(7)
+
+    def random_board(self) -> list[list[int]]:
+        filled = self.random.randint(0, 42)
+        cells = [1, 2] * 21
+        self.random.shuffle(cells)
+        cells = cells[:filled] + [0] * (42 - filled)
+        self.random.shuffle(cells)
+
+        return [cells[column * 6 : column * 6 + 6] for column in range(7)]
+
+    def test_evaluate_batch_matches_evaluate(self):
+        boards = [self.random_board() for _ in range(200)]
+
+        for color in (1, 2):
+            evaluations = ConnectFourHeuristic.evaluate_batch(boards, color)
+
+            self.assertEqual(
+                evaluations.tolist(),
+                [ConnectFourHeuristic.evaluate(board, color) for board in boards],
+            )
+
+    def test_evaluate_batch_clamps_wins(self):
+        board = [[0] * 6 for _ in range(7)]
+        board[0][:4] = [2, 2, 2, 2]
+
+        evaluations = ConnectFourHeuristic.evaluate_batch([board], 1)
+
+        self.assertEqual(evaluations.tolist(), [-MAX_HEURISTIC])
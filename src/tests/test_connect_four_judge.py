@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from duo_game_lib.game_state import GameState
@@ -57,6 +58,7 @@ class TestConnectFourJudge(unittest.TestCase):
 
     def test_move_outside_board_return_invalid_state(self):
         self.assertEqual(self.judge.validate("-1"), GameState.INVALID)
+        self.assertEqual(self.judge.validate("7"), GameState.INVALID)
         self.assertEqual(self.judge.validate("70"), GameState.INVALID)
         self.assertEqual(self.judge.validate("1000"), GameState.INVALID)
         self.assertEqual(self.judge.validate("-10000"), GameState.INVALID)
@@ -222,3 +224,107 @@ class TestConnectFourJudge(unittest.TestCase):
 
     def test_get_valid_locations(self):
         self.assertEqual(self.judge.get_valid_moves(), [0, 1, 2, 3, 4, 5, 6])
+
+    def test_hash_is_restored_after_removing_moves(self):
+        initial_hash = self.judge.hash
+        self.add_multiple_moves(self.judge, [3, 3, 4])
+        position_hash = self.judge.hash
+
+        self.judge.remove_last_move()
+        self.judge.remove_last_move()
+        self.judge.remove_last_move()
+
+        self.assertNotEqual(position_hash, initial_hash)
+        self.assertEqual(self.judge.hash, initial_hash)
+
+    def test_hash_does_not_depend_on_move_order(self):
+        judge = ConnectFourJudge()
+        self.add_multiple_moves(self.judge, [3, 2, 4, 5])
+        self.add_multiple_moves(judge, [4, 5, 3, 2])
+
+        self.assertEqual(self.judge.hash, judge.hash)
+
+    def test_mirror_images_have_same_canonical_hash(self):
+        judge = ConnectFourJudge()
+        self.add_multiple_moves(self.judge, [3, 2, 1])
+        self.add_multiple_moves(judge, [3, 4, 5])
+
+        key, mirrored = self.judge.canonical_hash
+        mirror_key, mirror_mirrored = judge.canonical_hash
+
+        self.assertNotEqual(self.judge.hash, judge.hash)
+        self.assertEqual(key, mirror_key)
+        self.assertNotEqual(mirrored, mirror_mirrored)
+
+    def test_is_symmetric(self):
+        self.assertTrue(self.judge.is_symmetric())
+
+        self.add_multiple_moves(self.judge, [3, 2])
+        self.assertFalse(self.judge.is_symmetric())
+
+        self.add_multiple_moves(self.judge, [4])
+        self.assertFalse(self.judge.is_symmetric())
+
+        self.judge.remove_last_move()
+        self.judge.remove_last_move()
+        self.add_multiple_moves(self.judge, [3])
+        self.assertTrue(self.judge.is_symmetric())
+
+    def test_larger_board_has_more_columns_and_rows(self):
+        judge = ConnectFourJudge(width=8, height=7)
+
+        self.assertEqual(judge.get_valid_moves(), list(range(8)))
+        self.assertEqual(judge.validate("7"), GameState.CONTINUE)
+
+        self.add_multiple_moves(judge, [0] * 6)
+        self.assertIn(0, judge.get_valid_moves())
+
+        judge.add_move("0")
+        self.assertEqual(judge.get_valid_moves(), list(range(1, 8)))
+        self.assertEqual(judge.validate("0"), GameState.ILLEGAL)
+
+    def test_connect_five_needs_five_pieces(self):
+        judge = ConnectFourJudge(width=9, height=7, length=5)
+        self.add_multiple_moves(judge, [0, 8, 1, 8, 2, 8, 3, 7])
+
+        self.assertEqual(judge.length, 5)
+        self.assertEqual(judge.is_game_over(), GameState.CONTINUE)
+
+        judge.add_move("4")
+        self.assertEqual(judge.is_game_over(), GameState.WIN)
+
+    def test_ply_heights_and_valid_mask_follow_moves(self):
+        self.add_multiple_moves(self.judge, [3, 3, 4, 0, 0, 0, 0, 0, 0])
+
+        self.assertEqual(self.judge.ply, 9)
+        self.assertEqual(self.judge.heights, [6, 0, 0, 2, 1, 0, 0])
+        self.assertEqual(self.judge.valid_mask, 0b1111110)
+        self.assertEqual(self.judge.get_valid_moves(), [1, 2, 3, 4, 5, 6])
+
+        self.judge.remove_last_move()
+
+        self.assertEqual(self.judge.ply, 8)
+        self.assertEqual(self.judge.heights, [5, 0, 0, 2, 1, 0, 0])
+        self.assertEqual(self.judge.valid_mask, 0b1111111)
+
+    def test_cached_state_matches_new_judge_after_moves_and_undo(self):
+        generator = random.Random(3)
+
+        for _ in range(20):
+            judge = ConnectFourJudge()
+
+            while judge.is_game_over() == GameState.CONTINUE:
+                judge.add_move(str(generator.choice(judge.get_valid_moves())))
+
+                if generator.random() < 0.3:
+                    judge.remove_last_move()
+
+                moves = [int(move) for move in judge.get_all_moves()]
+                scanned = ConnectFourJudge(
+                    moves.copy(), [column.copy() for column in judge.board]
+                )
+
+                self.assertEqual(judge.is_game_over(), scanned.is_game_over())
+                self.assertEqual(judge.heights, scanned.heights)
+                self.assertEqual(judge.valid_mask, scanned.valid_mask)
+                self.assertEqual(judge.ply, len(moves))
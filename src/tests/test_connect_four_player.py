@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from connect_four_lib.connect_four_player import ConnectFourPlayer
+
+
+class TestConnectFourPlayer(TestCase):
+    def setUp(self) -> None:
+        self.player = ConnectFourPlayer(1000)
+
+    def test_play_logs_search(self):
+        self.player.play("")
+        logs = self.player.get_and_reset_current_logs()
+
+        self.assertTrue(logs.startswith("bestmove 3"))
+        self.assertEqual(self.player.get_and_reset_current_logs(), "")
+
+    def test_iterations_are_logged(self):
+        for move in ["3", "3", "2"]:
+            self.player.engine.add_move(move)
+
+        self.player.engine.search(max_depth=2)
+        lines = self.player.get_and_reset_current_logs().split("\n")
+
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("info depth 1 move"))
+        self.assertTrue(lines[1].startswith("info depth 2 move"))
+
+    def test_all_logs_include_already_returned_logs(self):
+        self.player.play("")
+        current_logs = self.player.get_and_reset_current_logs()
+        self.player.play("3")
+        all_logs = self.player.get_and_reset_all_logs()
+
+        self.assertTrue(all_logs.startswith(current_logs))
+        self.assertEqual(len(all_logs.split("\n")), 2)
+        self.assertEqual(self.player.get_and_reset_all_logs(), "")
+        self.assertEqual(self.player.get_and_reset_current_logs(), "")
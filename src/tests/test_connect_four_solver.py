@@ -0,0 +1,168 @@
+import random
+from unittest import TestCase
+
+from duo_game_lib.game_state import GameState
+
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.connect_four_solver import ConnectFourSolver
+
+
+class TestConnectFourSolver(TestCase):
+    def create_judge(self, moves: str, **geometry) -> ConnectFourJudge:
+        judge = ConnectFourJudge(**geometry)
+
+        for move in moves:
+            judge.add_move(move)
+
+        return judge
+
+    def reference_score(self, judge: ConnectFourJudge) -> int:
+        moves = len(judge.get_all_moves())
+        cells = judge.bitboard.width * judge.bitboard.height
+        best_score = -cells
+
+        for move in judge.get_valid_moves():
+            judge.add_move(str(move))
+            state = judge.is_game_over()
+
+            if state == GameState.WIN:
+                score = (cells + 1 - moves) // 2
+            elif state == GameState.DRAW:
+                score = 0
+            else:
+                score = -self.reference_score(judge)
+
+            judge.remove_last_move()
+            best_score = max(best_score, score)
+
+        return best_score
+
+    def test_solves_end_game_positions(self):
+        positions = {
+            "1141465142351133000452254232560240330": -1,
+            "6311230624536630055022462362131455": 1,
+            "12052305013656112043356360161305644522": 0,
+            "54103562445044620455205216262110306": -1,
+        }
+
+        for moves, score in positions.items():
+            with self.subTest(moves):
+                result = ConnectFourSolver(self.create_judge(moves)).solve()
+
+                self.assertEqual(result.score, score)
+
+    def test_scores_match_full_search(self):
+        generator = random.Random(1)
+        positions = 0
+
+        while positions < 5:
+            judge = self.create_judge("")
+
+            for _ in range(33):
+                judge.add_move(str(generator.choice(judge.get_valid_moves())))
+
+                if judge.is_game_over() != GameState.CONTINUE:
+                    break
+            else:
+                result = ConnectFourSolver(judge).solve()
+                self.assertEqual(result.score, self.reference_score(judge))
+                positions += 1
+
+    def test_scores_of_connect_three_match_full_search(self):
+        generator = random.Random(2)
+        positions = 0
+
+        while positions < 5:
+            judge = self.create_judge("", width=5, height=4, length=3)
+
+            for _ in range(8):
+                judge.add_move(str(generator.choice(judge.get_valid_moves())))
+
+                if judge.is_game_over() != GameState.CONTINUE:
+                    break
+            else:
+                result = ConnectFourSolver(judge).solve()
+                self.assertEqual(result.score, self.reference_score(judge))
+                positions += 1
+
+    def test_scores_of_small_end_games_match_full_search(self):
+        generator = random.Random(3)
+        positions = 0
+
+        while positions < 40:
+            judge = self.create_judge("", width=4, height=4, length=3)
+
+            for _ in range(generator.randrange(10, 15)):
+                judge.add_move(str(generator.choice(judge.get_valid_moves())))
+
+                if judge.is_game_over() != GameState.CONTINUE:
+                    break
+            else:
+                result = ConnectFourSolver(judge).solve()
+                self.assertEqual(result.score, self.reference_score(judge))
+                positions += 1
+
+    def test_win_on_last_cell_is_draw(self):
+        judge = self.create_judge("21333212010", width=4, height=3, length=3)
+        result = ConnectFourSolver(judge).solve()
+
+        self.assertTrue(judge.check_lose("0"))
+        self.assertEqual(result.state, GameState.DRAW)
+        self.assertEqual(result.score, 0)
+        self.assertEqual(result.plies, 1)
+        self.assertEqual(result.move, 0)
+
+    def test_immediate_win_of_connect_three_is_found(self):
+        judge = self.create_judge("0101", width=5, height=4, length=3)
+        result = ConnectFourSolver(judge).solve()
+
+        self.assertEqual(result.state, GameState.WIN)
+        self.assertEqual(result.plies, 1)
+        self.assertEqual(result.move, 0)
+
+    def test_immediate_win_is_found(self):
+        result = ConnectFourSolver(self.create_judge("010101")).solve()
+
+        self.assertEqual(result.state, GameState.WIN)
+        self.assertEqual(result.plies, 1)
+        self.assertEqual(result.move, 0)
+        self.assertEqual(result.score, 18)
+
+    def test_forced_loss_is_detected(self):
+        result = ConnectFourSolver(self.create_judge("26364")).solve()
+
+        self.assertEqual(result.state, GameState.LOSE)
+        self.assertEqual(result.plies, 2)
+
+    def test_move_reaches_score(self):
+        judge = self.create_judge("33331222210513112302155")
+        result = ConnectFourSolver(judge).solve()
+
+        judge.add_move(str(result.move))
+
+        self.assertEqual(-ConnectFourSolver(judge).solve().score, result.score)
+
+    def test_forced_win_is_found(self):
+        result = ConnectFourSolver(self.create_judge("2636")).solve()
+
+        self.assertEqual(result.state, GameState.WIN)
+        self.assertEqual(result.plies, 3)
+        self.assertEqual(result.move, 4)
+
+    def test_finished_game_is_lost_for_player_to_move(self):
+        result = ConnectFourSolver(self.create_judge("0101010")).solve()
+
+        self.assertEqual(result.state, GameState.LOSE)
+        self.assertEqual(result.plies, 0)
+        self.assertIsNone(result.move)
+
+    def test_nodes_and_time_are_reported(self):
+        result = ConnectFourSolver(self.create_judge("33331222210511434122")).solve()
+
+        self.assertGreater(result.nodes, 0)
+        self.assertGreater(result.time, 0)
+
+    def test_time_limit_raises_timeout_error(self):
+        solver = ConnectFourSolver(self.create_judge("33"), time_limit=10)
+
+        self.assertRaises(TimeoutError, solver.solve)
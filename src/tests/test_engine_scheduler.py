@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+from unittest import IsolatedAsyncioTestCase
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.engine_scheduler import EngineBusy, EngineScheduler
+from connect_four_lib.search_info import StopReason
+from connect_four_lib.search_limits import SearchLimits
+
+
+class TestEngineScheduler(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.scheduler = EngineScheduler(workers=1, max_queue=8)
+        self.release = threading.Event()
+
+    def tearDown(self) -> None:
+        self.release.set()
+        self.scheduler.close()
+
+    def block(self, limits: SearchLimits) -> str:
+        while not self.release.is_set() and not limits.cancel.cancelled:
+            time.sleep(0.001)
+
+        return "blocked"
+
+    async def test_games_take_turns(self):
+        order = []
+
+        def job(name):
+            def run(_limits):
+                order.append(name)
+                return name
+
+            return run
+
+        results = await asyncio.gather(
+            self.scheduler.run("a", job("a1"), SearchLimits()),
+            self.scheduler.run("a", job("a2"), SearchLimits()),
+            self.scheduler.run("a", job("a3"), SearchLimits()),
+            self.scheduler.run("a", job("a4"), SearchLimits()),
+            self.scheduler.run("b", job("b1"), SearchLimits()),
+        )
+
+        self.assertEqual(results, ["a1", "a2", "a3", "a4", "b1"])
+        self.assertEqual(order, ["a1", "a2", "b1", "a3", "a4"])
+        self.assertEqual(self.scheduler.metrics.completed, 5)
+        self.assertEqual(self.scheduler.metrics.max_queue_depth, 4)
+        self.assertEqual(self.scheduler.metrics.queue_depth, 0)
+
+    async def test_full_queue_rejects_jobs(self):
+        scheduler = EngineScheduler(workers=1, max_queue=1)
+        running = asyncio.create_task(scheduler.run("a", self.block, SearchLimits()))
+        queued = asyncio.create_task(scheduler.run("b", self.block, SearchLimits()))
+        await asyncio.sleep(0.01)
+
+        with self.assertRaises(EngineBusy):
+            await scheduler.run("c", self.block, SearchLimits())
+
+        self.release.set()
+        await asyncio.gather(running, queued)
+        scheduler.close()
+
+        self.assertEqual(scheduler.metrics.rejected, 1)
+        self.assertEqual(scheduler.metrics.completed, 2)
+
+    async def test_deadline_expires_queued_job(self):
+        running = asyncio.create_task(
+            self.scheduler.run("a", self.block, SearchLimits())
+        )
+        await asyncio.sleep(0.01)
+        limits = SearchLimits(deadline=time.perf_counter() + 0.05)
+
+        with self.assertRaises(TimeoutError):
+            await self.scheduler.run("b", self.block, limits)
+
+        self.release.set()
+        await running
+
+        self.assertEqual(self.scheduler.metrics.expired, 1)
+        self.assertEqual(self.scheduler.metrics.queue_depth, 0)
+
+    async def test_cancelling_stops_running_search_and_frees_worker(self):
+        running = asyncio.create_task(
+            self.scheduler.run("a", self.block, SearchLimits())
+        )
+        queued = asyncio.create_task(
+            self.scheduler.run("b", lambda limits: "done", SearchLimits())
+        )
+        await asyncio.sleep(0.01)
+        running.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await running
+
+        self.assertEqual(await asyncio.wait_for(queued, 5), "done")
+        self.assertEqual(self.scheduler.metrics.cancelled, 1)
+
+    async def test_cancelling_removes_queued_job(self):
+        running = asyncio.create_task(
+            self.scheduler.run("a", self.block, SearchLimits())
+        )
+        queued = asyncio.create_task(
+            self.scheduler.run("b", self.block, SearchLimits())
+        )
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        await asyncio.sleep(0)
+
+        self.assertEqual(self.scheduler.metrics.queue_depth, 0)
+
+        self.release.set()
+        await running
+
+        self.assertEqual(self.scheduler.metrics.completed, 1)
+
+    async def test_closing_fails_queued_jobs(self):
+        running = asyncio.create_task(
+            self.scheduler.run("a", self.block, SearchLimits())
+        )
+        queued = asyncio.create_task(
+            self.scheduler.run("b", self.block, SearchLimits())
+        )
+        await asyncio.sleep(0.01)
+        self.scheduler.close()
+
+        with self.assertRaises(EngineBusy):
+            await asyncio.wait_for(queued, 5)
+
+        self.assertEqual(await asyncio.wait_for(running, 5), "blocked")
+        self.assertEqual(self.scheduler.metrics.queue_depth, 0)
+
+        with self.assertRaises(EngineBusy):
+            await self.scheduler.run("c", self.block, SearchLimits())
+
+    async def test_event_loop_runs_while_job_is_running(self):
+        started = threading.Event()
+
+        def job(_limits):
+            started.set()
+            return self.release.wait(5)
+
+        running = asyncio.create_task(self.scheduler.run("a", job, SearchLimits()))
+
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+
+        self.assertFalse(running.done())
+
+        self.release.set()
+
+        self.assertTrue(await running)
+
+    async def test_engine_searches_in_thread_of_scheduler(self):
+        judge = ConnectFourJudge()
+
+        for move in "3324":
+            judge.add_move(move)
+
+        engine = ConnectFourEngine(judge=judge)
+        move = await engine.get_best_move_async(
+            limits=SearchLimits(time_limit=300), scheduler=self.scheduler
+        )
+
+        self.assertIn(move, [str(column) for column in judge.get_valid_moves()])
+        self.assertEqual(engine.info.stop_reason, StopReason.TIMEOUT)
+        self.assertEqual(judge.get_all_moves(), list("3324"))
+        self.assertEqual(self.scheduler.metrics.completed, 1)
+        self.assertGreater(self.scheduler.metrics.run_time(), 0)
+
+    async def test_async_search_finds_same_move_as_search(self):
+        judge = ConnectFourJudge()
+
+        for move in "433561151643":
+            judge.add_move(move)
+
+        engine = ConnectFourEngine(judge=judge)
+        expected = engine.search(max_depth=6).move
+        info = await engine.search_async(max_depth=6, scheduler=self.scheduler)
+
+        self.assertEqual(info.move, expected)
+        self.assertEqual(info.depth, 6)
@@ -0,0 +1,105 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from connect_four_lib.engine_server import EngineServer
+from connect_four_lib.search_info import StopReason
+from connect_four_lib.search_limits import SearchLimits
+
+
+class TestEngineServer(TestCase):
+    def setUp(self) -> None:
+        self.server = EngineServer(max_games=2)
+
+    def tearDown(self) -> None:
+        self.server.close()
+
+    def test_games_are_kept_separate(self):
+        self.server.set_position("a", "3324")
+        self.server.set_position("b", "33")
+        self.server.add_move("b", "4")
+
+        self.assertEqual(self.server.search("a", SearchLimits(depth=2)).depth, 2)
+        self.assertEqual(
+            self.server.search("b", SearchLimits(depth=2)).stop_reason,
+            StopReason.MAX_DEPTH,
+        )
+        self.assertEqual(len(self.server), 2)
+
+    def test_set_position_plays_only_new_moves(self):
+        self.server.set_position("a", "33")
+        self.server.set_position("a", "3324")
+        self.server.set_position("b", "3324")
+
+        self.assertEqual(
+            self.server.search("a", SearchLimits(depth=4)).move,
+            self.server.search("b", SearchLimits(depth=4)).move,
+        )
+
+    def test_set_position_restarts_game_with_different_history(self):
+        self.server.set_position("a", "3324")
+        self.server.set_position("a", "4")
+        self.server.add_move("a", "3")
+
+        self.assertEqual(self.server.get_best_move("a"), "3")
+
+    def test_invalid_position_leaves_game_unchanged(self):
+        self.server.set_position("a", "3324")
+
+        for moves in ("33249", "3333333", "01010103", "49"):
+            with self.subTest(moves):
+                self.assertRaises(ValueError, self.server.set_position, "a", moves)
+
+        self.assertEqual(
+            self.server.handle("position a 3 3 2 4 7"),
+            "error position invalid move 7",
+        )
+
+        self.server.add_move("a", "4")
+        self.server.set_position("b", "33244")
+
+        self.assertEqual(
+            self.server.search("a", SearchLimits(depth=4)).move,
+            self.server.search("b", SearchLimits(depth=4)).move,
+        )
+
+    def test_least_recently_used_game_is_evicted(self):
+        self.server.set_position("a", "33")
+        self.server.set_position("b", "33")
+        self.server.get_best_move("a")
+        self.server.set_position("c", "33")
+
+        self.assertIn("a", self.server)
+        self.assertNotIn("b", self.server)
+        self.assertEqual(self.server.evictions, 1)
+
+        with self.assertRaises(KeyError):
+            self.server.get_best_move("b")
+
+    def test_games_share_transposition_table(self):
+        self.server.set_position("a", "433561151643")
+        first = self.server.search("a", SearchLimits(depth=6))
+        self.server.set_position("b", "433561151643")
+        second = self.server.search("b", SearchLimits(depth=6))
+
+        self.assertEqual(first.move, second.move)
+        self.assertLess(second.nodes, first.nodes)
+
+    def test_text_protocol(self):
+        self.assertEqual(self.server.handle("isready"), "readyok")
+        self.assertIsNone(self.server.handle("position a 3 3 2 4"))
+        self.assertIsNone(self.server.handle("move a 3"))
+        self.assertTrue(self.server.handle("go a depth 2").startswith("bestmove "))
+        self.assertIsNone(self.server.handle("end a"))
+        self.assertNotIn("a", self.server)
+        self.assertTrue(self.server.handle("go a").startswith("error go"))
+        self.assertTrue(self.server.handle("jump").startswith("error jump"))
+        self.assertIsNone(self.server.handle(""))
+
+
+class TestEngineServerAsync(IsolatedAsyncioTestCase):
+    async def test_search_async(self):
+        server = EngineServer()
+        server.set_position("a", "3324")
+        info = await server.search_async("a", SearchLimits(depth=4))
+        server.close()
+
+        self.assertEqual(info.depth, 4)
@@ -0,0 +1,63 @@
+import threading
+from unittest import TestCase
+
+from connect_four_lib.evaluation_cache import EvaluationCache
+
+
+class TestEvaluationCache(TestCase):
+    def setUp(self) -> None:
+        self.cache = EvaluationCache(capacity=2)
+
+    def test_miss_and_hit_are_counted(self):
+        self.assertIsNone(self.cache.get("a"))
+
+        self.cache.put("a", 0)
+
+        self.assertEqual(self.cache.get("a"), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")
+        self.cache.put("c", 3)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+
+    def test_clear_removes_entries(self):
+        self.cache.put("a", 1)
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertIsNone(self.cache.get("a"))
+
+    def test_cache_can_be_shared_by_threads(self):
+        errors = []
+
+        def use_cache(step: int) -> None:
+            try:
+                for index in range(5000):
+                    key = index * step % 3
+
+                    if self.cache.get(key) is None:
+                        self.cache.put(key, index)
+            except KeyError as error:
+                errors.append(error)
+
+        threads = [
+            threading.Thread(target=use_cache, args=(step,)) for step in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.cache.hits + self.cache.misses, 20000)
+        self.assertLessEqual(len(self.cache), 2)
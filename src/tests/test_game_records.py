@@ -0,0 +1,158 @@
+import io
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from duo_game_lib.game_state import GameState
+
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.game_records import (
+    GameArchive,
+    read_move_strings,
+    replay,
+    write_move_strings,
+)
+
+
+def play_random_game(
+    generator: random.Random, width: int = 7, height: int = 6, length: int = 4
+) -> list[int]:
+    judge = ConnectFourJudge(width=width, height=height, length=length)
+
+    while judge.is_game_over() == GameState.CONTINUE:
+        judge.add_move(str(generator.choice(judge.get_valid_moves())))
+
+    return [int(move) for move in judge.get_all_moves()]
+
+
+class TestGameArchive(TestCase):
+    def setUp(self) -> None:
+        generator = random.Random(2)
+        self.games = [play_random_game(generator) for _ in range(20)] + [[], [3]]
+
+    def test_games_are_read_back_in_order(self):
+        file = io.BytesIO()
+        written = GameArchive.write(file, iter(self.games))
+        file.seek(0)
+
+        archive = GameArchive(file)
+
+        self.assertEqual(written, len(self.games))
+        self.assertEqual((archive.width, archive.height, archive.length), (7, 6, 4))
+        self.assertEqual(list(archive), self.games)
+
+    def test_moves_take_half_a_byte(self):
+        file = io.BytesIO()
+        GameArchive.write(file, [[3, 3, 4], [0] * 6])
+
+        self.assertEqual(len(file.getvalue()), GameArchive.HEADER.size + 3 + 4)
+
+    def test_games_are_read_lazily_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.bin")
+
+            with open(path, "wb") as file:
+                GameArchive.write(file, self.games, (9, 7), 5)
+
+            with open(path, "rb") as file:
+                archive = GameArchive(file)
+                first = next(iter(archive))
+
+                self.assertEqual(first, self.games[0])
+                self.assertLess(file.tell(), os.path.getsize(path))
+                self.assertEqual((archive.width, archive.height), (9, 7))
+                self.assertEqual(archive.length, 5)
+
+    def test_other_files_are_rejected(self):
+        with self.assertRaises(ValueError):
+            GameArchive(io.BytesIO(b"C4BK\x07\x06\x04"))
+
+    def test_too_large_boards_are_rejected(self):
+        with self.assertRaises(ValueError):
+            GameArchive.write(io.BytesIO(), [], (17, 6))
+
+        with self.assertRaises(ValueError):
+            GameArchive.write(io.BytesIO(), [], (16, 16))
+
+
+class TestMoveStrings(TestCase):
+    def test_games_are_read_back_in_order(self):
+        file = io.StringIO()
+        written = write_move_strings(file, [[3, 3, 4], [], [0, 6]])
+
+        self.assertEqual(written, 3)
+        self.assertEqual(file.getvalue(), "334\n\n06\n")
+
+        file.seek(0)
+        self.assertEqual(list(read_move_strings(file)), [[3, 3, 4], [0, 6]])
+
+    def test_comments_and_whitespace_are_skipped(self):
+        lines = ["# archive\n", "  3344 \n", "\n", "0\n"]
+
+        self.assertEqual(list(read_move_strings(lines)), [[3, 3, 4, 4], [0]])
+
+
+class TestReplay(TestCase):
+    def assert_replay_matches_judge(
+        self, games: list[list[int]], width: int, height: int, length: int
+    ) -> None:
+        plies = replay(games, width, height, length, analyze=True)
+
+        for game, moves in enumerate(games):
+            judge = ConnectFourJudge(width=width, height=height, length=length)
+
+            for ply, move in enumerate(moves, 1):
+                judge.add_move(str(move))
+
+                self.assertEqual(
+                    next(plies),
+                    (
+                        game,
+                        ply,
+                        move,
+                        judge.bitboard.key(),
+                        judge.is_game_over(),
+                        judge.analyze(),
+                    ),
+                )
+
+        self.assertIsNone(next(plies, None))
+
+    def test_replay_matches_judge(self):
+        generator = random.Random(4)
+        games = [play_random_game(generator) for _ in range(30)]
+
+        self.assert_replay_matches_judge(games, 7, 6, 4)
+
+    def test_replay_matches_judge_of_connect_five(self):
+        generator = random.Random(5)
+        games = [play_random_game(generator, 9, 7, 5) for _ in range(10)]
+
+        self.assert_replay_matches_judge(games, 9, 7, 5)
+
+    def test_full_board_is_draw(self):
+        generator = random.Random(0)
+        moves = play_random_game(generator)
+
+        while len(moves) < 42:
+            moves = play_random_game(generator)
+
+        states = [ply.state for ply in replay([moves], analyze=True)]
+
+        self.assertEqual(states, [GameState.CONTINUE] * 41 + [GameState.DRAW])
+
+    def test_positions_are_not_analyzed_by_default(self):
+        plies = list(replay([[3, 3]]))
+
+        self.assertEqual([ply.score for ply in plies], [None, None])
+        self.assertEqual([ply.state for ply in plies], [GameState.CONTINUE] * 2)
+
+    def test_games_are_replayed_lazily(self):
+        def games():
+            yield [3, 3, 3]
+            raise AssertionError("second game was read too early")
+
+        plies = replay(games())
+
+        self.assertEqual([next(plies).ply for _ in range(3)], [1, 2, 3])
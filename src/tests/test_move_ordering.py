@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from connect_four_lib.bitboard import BitBoard
+from connect_four_lib.move_ordering import MoveOrdering
+
+
+class TestMoveOrdering(TestCase):
+    def setUp(self) -> None:
+        self.ordering = MoveOrdering()
+        self.bitboard = BitBoard()
+
+    def play_moves(self, moves: list[int]) -> None:
+        for i, move in enumerate(moves):
+            self.bitboard.play(move, i % 2 + 1)
+
+    def test_center_columns_are_first(self):
+        self.assertEqual(
+            self.ordering.order(self.bitboard, 1, 0), [3, 2, 4, 1, 5, 0, 6]
+        )
+
+    def test_moves_are_from_left_to_right_when_everything_is_off(self):
+        ordering = MoveOrdering(False, False, False, False, False)
+
+        self.assertEqual(ordering.order(self.bitboard, 1, 0), [0, 1, 2, 3, 4, 5, 6])
+
+    def test_full_columns_are_skipped(self):
+        self.play_moves([3] * 6)
+
+        self.assertNotIn(3, self.ordering.order(self.bitboard, 1, 6))
+
+    def test_hash_move_is_first(self):
+        self.assertEqual(self.ordering.order(self.bitboard, 1, 0, 6)[0], 6)
+
+    def test_winning_move_is_before_block(self):
+        self.play_moves([0, 6, 0, 6, 0, 6])
+
+        self.assertEqual(self.ordering.order(self.bitboard, 1, 6)[:2], [0, 6])
+        self.assertEqual(self.ordering.order(self.bitboard, 2, 6)[:2], [6, 0])
+
+    def test_killer_moves_are_before_other_moves(self):
+        self.ordering.record_cutoff(5, 1, 4, 1)
+        self.ordering.record_cutoff(6, 2, 4, 1)
+
+        self.assertEqual(self.ordering.order(self.bitboard, 1, 4)[:2], [6, 5])
+        self.assertEqual(self.ordering.order(self.bitboard, 1, 3)[0], 5)
+
+    def test_history_orders_remaining_moves(self):
+        ordering = MoveOrdering(killers=False)
+        ordering.record_cutoff(0, 1, 4, 3)
+        ordering.record_cutoff(6, 1, 8, 2)
+
+        self.assertEqual(ordering.order(self.bitboard, 1, 0)[:3], [0, 6, 3])
+        self.assertEqual(ordering.order(self.bitboard, 2, 0)[0], 3)
+
+    def test_new_search_forgets_killer_moves(self):
+        self.ordering.record_cutoff(5, 1, 4, 1)
+        self.ordering.new_search()
+
+        self.assertEqual(self.ordering.order(self.bitboard, 1, 4)[0], 3)
+
+    def test_new_search_halves_history(self):
+        ordering = MoveOrdering(killers=False)
+        ordering.record_cutoff(0, 1, 4, 2)
+        ordering.record_cutoff(6, 1, 4, 1)
+        ordering.new_search()
+
+        self.assertEqual(ordering.order(self.bitboard, 1, 0)[:2], [0, 3])
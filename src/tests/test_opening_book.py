@@ -0,0 +1,69 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.opening_book import OpeningBook, generate_opening_book
+
+
+class TestOpeningBook(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "book.bin")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def create_judge(self, moves: str) -> ConnectFourJudge:
+        judge = ConnectFourJudge()
+
+        for move in moves:
+            judge.add_move(move)
+
+        return judge
+
+    def choose_last_move(self, judge: ConnectFourJudge) -> str:
+        moves = judge.get_all_moves()
+
+        if moves and judge.validate(moves[-1]).value == "CONTINUE":
+            return moves[-1]
+
+        return str(judge.get_valid_moves()[0])
+
+    def test_generated_book_contains_moves_of_positions_before_ply(self):
+        size = generate_opening_book(self.path, 3, self.choose_last_move)
+
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), size)
+            self.assertEqual((book.width, book.height, book.plies), (7, 6, 3))
+            self.assertEqual(book.get_move(self.create_judge("").bitboard), 0)
+            self.assertEqual(book.get_move(self.create_judge("5").bitboard), 5)
+            self.assertEqual(book.get_move(self.create_judge("1").bitboard), 1)
+            self.assertEqual(book.get_move(self.create_judge("42").bitboard), 2)
+            self.assertEqual(book.get_move(self.create_judge("24").bitboard), 4)
+            self.assertIsNone(book.get_move(self.create_judge("424").bitboard))
+
+    def test_mirror_images_are_stored_once(self):
+        size = generate_opening_book(self.path, 2, self.choose_last_move)
+
+        self.assertEqual(size, 5)
+
+    def test_engine_plays_book_move(self):
+        judge = self.create_judge("332")
+        OpeningBook.write(self.path, {judge.bitboard.canonical_key()[0]: 5})
+
+        with OpeningBook(self.path) as book:
+            engine = ConnectFourEngine(judge=judge, book=book)
+            mirrored_engine = ConnectFourEngine(
+                judge=self.create_judge("334"), book=book
+            )
+
+            self.assertEqual(engine.get_best_move(), "5")
+            self.assertEqual(mirrored_engine.get_best_move(), "1")
+
+    def test_file_without_header_is_rejected(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a book")
+
+        self.assertRaises(ValueError, OpeningBook, self.path)
@@ -1,5 +1,9 @@
+import pickle
+import tracemalloc
 from unittest import TestCase
 
+from connect_four_lib import point as point_module
+from connect_four_lib.connect_four_judge import ConnectFourJudge
 from connect_four_lib.point import Point
 
 
@@ -21,3 +25,65 @@ class TestPoint(TestCase):
         self.assertEqual(-Point(0, 0), Point(0, 0))
         self.assertEqual(-Point(3, 4), Point(-3, -4))
         self.assertEqual(-(-Point(7, 1)), Point(7, 1))
+
+    def test_points_are_immutable_and_hashable(self):
+        point = Point(1, 2)
+
+        with self.assertRaises(AttributeError):
+            point.x = 3
+
+        with self.assertRaises(AttributeError):
+            point.z = 3
+
+        self.assertEqual({Point(1, 2): "a"}[Point(1, 2)], "a")
+        self.assertEqual(repr(Point(-1, 20)), "Point(-1, 20)")
+        self.assertEqual(pickle.loads(pickle.dumps(Point(30, 2))), Point(30, 2))
+
+    def test_board_cells_and_directions_are_shared(self):
+        self.assertIs(Point(5, 6), Point(5, 6))
+        self.assertIs(Point(2, 3) + Point(1, -1), Point(3, 2))
+        self.assertIs(-Point(1, 1), Point(-1, -1))
+        self.assertIsNot(Point(100, 0), Point(100, 0))
+
+    def test_arithmetic_on_board_does_not_allocate(self):
+        direction = Point(1, 1)
+
+        def walk():
+            return [
+                Point(x, y) + direction - direction for x in range(7) for y in range(6)
+            ]
+
+        self.assertEqual(self.count_allocations(walk), 0)
+        self.assertGreaterEqual(
+            self.count_allocations(lambda: [Point(x, 100) for x in range(100)]), 100
+        )
+
+    def test_judge_does_not_allocate_points(self):
+        judge = ConnectFourJudge()
+
+        def play():
+            points = []
+
+            for _ in range(6):
+                for move in range(7):
+                    points.append(judge.add_move(str(move)))
+
+            return points
+
+        self.assertEqual(self.count_allocations(play), 0)
+
+    def count_allocations(self, function) -> int:
+        tracemalloc.start()
+
+        try:
+            result = function()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        del result
+        statistics = snapshot.filter_traces(
+            [tracemalloc.Filter(True, point_module.__file__)]
+        ).statistics("filename")
+
+        return sum(statistic.count for statistic in statistics)
@@ -0,0 +1,128 @@
+import time
+from unittest import TestCase
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.connect_four_player import ConnectFourPlayer
+from connect_four_lib.search_info import StopReason
+from connect_four_lib.search_limits import SearchLimits
+from connect_four_lib.strength import LEVELS
+
+
+class TestPondering(TestCase):
+    def setUp(self) -> None:
+        self.judge = ConnectFourJudge()
+        self.engine = ConnectFourEngine(difficulty=10**6, judge=self.judge)
+
+        for move in ["3", "3", "2"]:
+            self.engine.add_move(move)
+
+        self.info = self.engine.search(max_depth=4)
+        self.engine.add_move(self.info.move)
+        self.prediction = str(self.info.principal_variation[1])
+
+    def tearDown(self) -> None:
+        self.engine.close()
+
+    def wait_for_pondering(self, engine: ConnectFourEngine | None = None) -> None:
+        engine = engine or self.engine
+        end = time.perf_counter() + 10
+
+        while engine.pondering and time.perf_counter() < end:
+            time.sleep(0.01)
+
+    def test_ponder_hit_returns_result_of_pondering(self):
+        self.engine.ponder(SearchLimits(depth=4))
+        self.wait_for_pondering()
+        self.engine.add_move(self.prediction)
+        info = self.engine.search(max_depth=4)
+
+        self.assertEqual(info.stop_reason, StopReason.PONDER_HIT)
+        self.assertEqual(info.depth, 4)
+        self.assertEqual(self.judge.get_all_moves()[-1], self.prediction)
+
+    def test_time_spent_pondering_is_subtracted_from_time_limit(self):
+        self.engine.ponder()
+        time.sleep(0.2)
+        self.engine.add_move(self.prediction)
+        info = self.engine.search(limits=SearchLimits(time_limit=100))
+
+        self.assertEqual(info.stop_reason, StopReason.PONDER_HIT)
+        self.assertFalse(self.engine.pondering)
+
+    def test_ponder_miss_searches_again_with_shared_table(self):
+        miss = next(str(move) for move in range(7) if str(move) != self.prediction)
+        self.engine.ponder(SearchLimits(depth=4))
+        self.wait_for_pondering()
+        self.engine.add_move(miss)
+        info = self.engine.search(max_depth=4)
+
+        self.assertNotEqual(info.stop_reason, StopReason.PONDER_HIT)
+        self.assertEqual(self.judge.get_all_moves()[-1], miss)
+
+    def test_ponder_hit_is_forgotten_after_another_move(self):
+        self.engine.ponder(SearchLimits(depth=4))
+        self.wait_for_pondering()
+        self.engine.add_move(self.prediction)
+        self.engine.add_move("0")
+        info = self.engine.search(max_depth=2)
+
+        self.assertNotEqual(info.stop_reason, StopReason.PONDER_HIT)
+        self.assertEqual(info.depth, 2)
+
+    def test_pondering_uses_weight_of_engine(self):
+        values = []
+
+        for ponder in (False, True):
+            engine = ConnectFourEngine(difficulty=10**6, weight=7)
+
+            for move in "433561151643":
+                engine.add_move(move)
+
+            info = engine.search(max_depth=6)
+            engine.add_move(info.move)
+
+            if ponder:
+                engine.ponder(SearchLimits(depth=6))
+                self.wait_for_pondering(engine)
+
+            engine.add_move(str(info.principal_variation[1]))
+            info = engine.search(max_depth=6)
+            values.append((info.stop_reason, info.iterations[-1].value))
+            engine.close()
+
+        self.assertEqual(values[1], (StopReason.PONDER_HIT, values[0][1]))
+
+    def test_judge_is_not_changed_by_pondering(self):
+        moves = self.judge.get_all_moves()
+        self.engine.ponder()
+        time.sleep(0.05)
+        self.engine.stop_pondering()
+
+        self.assertEqual(self.judge.get_all_moves(), moves)
+        self.assertFalse(self.engine.pondering)
+
+    def test_player_ponders_after_its_move(self):
+        with ConnectFourPlayer(1000, ponder=True) as player:
+            player.engine.add_move("3")
+            player.play("2")
+
+            self.assertTrue(player.engine.pondering)
+
+        self.assertFalse(player.engine.pondering)
+
+    def test_pondering_player_keeps_budget_of_its_level(self):
+        level = LEVELS[2]
+
+        with ConnectFourPlayer(level.elo, ponder=True) as player:
+            for move in "332":
+                player.engine.add_move(move)
+
+            player.play("4")
+            prediction = str(player.engine.info.principal_variation[1])
+            self.wait_for_pondering(player.engine)
+            player.play(prediction)
+
+            self.assertEqual(player.engine.info.stop_reason, StopReason.PONDER_HIT)
+            self.assertLessEqual(player.engine.info.depth, level.depth)
+            self.assertLess(player.engine.info.nodes, 100)
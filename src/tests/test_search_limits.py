@@ -0,0 +1,52 @@
+import time
+from unittest import TestCase
+
+from connect_four_lib.search_info import StopReason
+from connect_four_lib.search_limits import (
+    CancelToken,
+    LimitChecker,
+    SearchLimits,
+    SearchStopped,
+)
+
+
+class TestLimitChecker(TestCase):
+    def test_no_limits_never_stop(self):
+        checker = LimitChecker(SearchLimits())
+
+        self.assertIsNone(checker.stop_reason(10**9))
+        self.assertEqual(checker.next_check, LimitChecker.CHECK_INTERVAL)
+
+    def test_node_limit_is_checked_exactly(self):
+        checker = LimitChecker(SearchLimits(nodes=300))
+        checker.check(LimitChecker.CHECK_INTERVAL)
+
+        self.assertEqual(checker.next_check, 300)
+
+        with self.assertRaises(SearchStopped) as context:
+            checker.check(300)
+
+        self.assertEqual(context.exception.reason, StopReason.NODES)
+
+    def test_cancelled_token_stops_search(self):
+        token = CancelToken()
+        checker = LimitChecker(SearchLimits(cancel=token))
+
+        self.assertIsNone(checker.stop_reason())
+
+        token.cancel()
+        self.assertEqual(checker.stop_reason(), StopReason.CANCELLED)
+
+        token.reset()
+        self.assertIsNone(checker.stop_reason())
+
+    def test_earlier_of_time_limit_and_deadline_is_used(self):
+        deadline = time.perf_counter() + 100
+        checker = LimitChecker(SearchLimits(time_limit=1000, deadline=deadline))
+
+        self.assertLess(checker.deadline, deadline)
+        self.assertLessEqual(checker.time_left(), 1)
+
+        checker = LimitChecker(SearchLimits(deadline=time.perf_counter()))
+
+        self.assertEqual(checker.stop_reason(), StopReason.TIMEOUT)
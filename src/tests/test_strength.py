@@ -0,0 +1,120 @@
+import random
+from unittest import TestCase
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_player import ConnectFourPlayer
+from connect_four_lib.search_info import StopReason
+from connect_four_lib.search_limits import SearchLimits
+from connect_four_lib.strength import LEVELS, get_level, play_move
+
+
+class TestStrengthLevels(TestCase):
+    def test_levels_are_ordered_by_elo(self):
+        elos = [level.elo for level in LEVELS]
+
+        self.assertEqual(elos, sorted(set(elos)))
+
+    def test_levels_are_limited_by_budget_not_time(self):
+        for level in LEVELS:
+            self.assertIsNone(level.limits.time_limit)
+            self.assertTrue(level.depth is not None or level.nodes is not None)
+
+    def test_level_of_elo_is_strongest_level_not_above_it(self):
+        self.assertEqual(get_level(0), LEVELS[0])
+        self.assertEqual(get_level(LEVELS[1].elo), LEVELS[1])
+        self.assertEqual(get_level(LEVELS[2].elo - 1), LEVELS[1])
+        self.assertEqual(get_level(10**6), LEVELS[-1])
+
+
+class TestPlayMove(TestCase):
+    def setUp(self) -> None:
+        self.engine = ConnectFourEngine()
+
+    def play_moves(self, moves: str) -> None:
+        for move in moves:
+            self.engine.add_move(move)
+
+    def test_immediate_win_is_never_replaced(self):
+        self.play_moves("001122")
+        generator = random.Random(0)
+
+        for _ in range(10):
+            move = play_move(self.engine, SearchLimits(depth=2), 1, generator)
+
+            self.assertEqual(move, "3")
+            self.assertEqual(self.engine.info.stop_reason, StopReason.CRITICAL_MOVE)
+
+    def test_random_moves_do_not_let_opponent_win(self):
+        self.play_moves("45640605")
+        generator = random.Random(0)
+        moves = {
+            play_move(self.engine, SearchLimits(depth=1), 1, generator)
+            for _ in range(30)
+        }
+
+        self.assertNotIn("3", moves)
+        self.assertGreater(len(moves), 1)
+
+    def test_moves_are_repeatable_with_same_seed(self):
+        self.play_moves("332")
+
+        def play(seed: int) -> list[str]:
+            generator = random.Random(seed)
+
+            return [
+                play_move(self.engine, LEVELS[0].limits, 0.5, generator)
+                for _ in range(10)
+            ]
+
+        self.assertEqual(play(1), play(1))
+
+
+class TestPlayerStrength(TestCase):
+    def play_game(self, elo: int, seed: int) -> list[str]:
+        moves = []
+
+        with ConnectFourPlayer(elo, seed=seed) as first, ConnectFourPlayer(
+            elo, seed=seed + 1
+        ) as second:
+            move = ""
+
+            for _ in range(4):
+                move = first.play(move)
+                moves.append(move)
+                move = second.play(move)
+                moves.append(move)
+
+        return moves
+
+    def test_player_uses_level_of_its_elo(self):
+        player = ConnectFourPlayer(LEVELS[3].elo)
+
+        self.assertEqual(player.level, LEVELS[3])
+
+    def test_weak_player_searches_little(self):
+        player = ConnectFourPlayer(0)
+
+        for move in "332":
+            player.engine.add_move(move)
+
+        player.play("4")
+
+        self.assertLessEqual(player.engine.info.depth, 1)
+        self.assertLess(player.engine.info.nodes, 20)
+
+    def test_games_are_repeatable_with_same_seed(self):
+        self.assertEqual(self.play_game(0, 3), self.play_game(0, 3))
+
+    def test_random_moves_are_logged(self):
+        logs = []
+
+        for seed in range(10):
+            with ConnectFourPlayer(0, seed=seed) as player:
+                for move in "3324":
+                    player.engine.add_move(move)
+
+                player.play("")
+                logs.append(player.get_and_reset_current_logs())
+
+        self.assertTrue(any("\nrandom move" in log for log in logs))
+        self.assertTrue(any("random move" not in log for log in logs))
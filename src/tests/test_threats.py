@@ -0,0 +1,115 @@
+import random
+from unittest import TestCase
+
+from connect_four_lib.connect_four_engine import ConnectFourEngine
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.search_info import StopReason
+from connect_four_lib.threats import ThreatTracker
+
+
+class TestThreats(TestCase):
+    def setUp(self) -> None:
+        self.judge = ConnectFourJudge()
+
+    def play_moves(self, moves: str) -> None:
+        for move in moves:
+            self.judge.add_move(move)
+
+    def create_board(self, columns: list[list[int]]) -> list[list[int]]:
+        return [column + [0] * (6 - len(column)) for column in columns]
+
+    def columns(self, mask: int) -> list[int]:
+        return self.judge.bitboard.columns(mask)
+
+    def test_empty_board_has_no_threats(self):
+        threats = self.judge.threats(1)
+
+        self.assertEqual(threats, (0, 0, 0, 0))
+
+    def test_immediate_threat_is_playable_winning_cell(self):
+        self.play_moves("001122")
+        threats = self.judge.threats(1)
+
+        self.assertEqual(self.columns(threats.immediate), [3])
+        self.assertEqual(threats.double, 0)
+        self.assertEqual(self.columns(self.judge.threats(2).winning), [3])
+        self.assertEqual(self.judge.threats(2).immediate, 0)
+
+    def test_open_three_is_double_threat(self):
+        board = [[], [1], [1], [1], [], [], [2, 2]]
+        self.judge = ConnectFourJudge([0] * 5, self.create_board(board))
+        threats = self.judge.threats(1)
+
+        self.assertEqual(self.columns(threats.immediate), [0, 4])
+        self.assertEqual(self.columns(threats.double), [0, 4])
+
+    def test_stacked_threats_are_double_threat(self):
+        board = [[1, 1, 2], [1, 1, 2], [1, 1, 2], [], [], [], [2, 2]]
+        self.judge = ConnectFourJudge([0] * 11, self.create_board(board))
+        threats = self.judge.threats(1)
+
+        self.assertEqual(self.columns(threats.immediate), [3])
+        self.assertEqual(self.columns(threats.double), [3])
+        self.assertEqual(self.columns(self.judge.threats(2).losing), [3])
+
+    def test_cell_below_winning_cell_of_opponent_is_losing(self):
+        self.play_moves("45640605")
+
+        self.assertEqual(self.columns(self.judge.threats(2).winning), [3])
+        self.assertEqual(self.judge.threats(2).immediate, 0)
+        self.assertEqual(self.columns(self.judge.threats(1).losing), [3])
+
+    def test_tracker_matches_full_scan_after_moves_and_undo(self):
+        generator = random.Random(7)
+
+        for _ in range(20):
+            played = 0
+
+            while self.judge.is_game_over().value == "CONTINUE":
+                self.judge.add_move(str(generator.choice(self.judge.get_valid_moves())))
+                played += 1
+
+                if generator.random() < 0.3:
+                    self.judge.remove_last_move()
+                    played -= 1
+
+                scanned = ThreatTracker(self.judge.bitboard)
+
+                for color in (1, 2):
+                    self.assertEqual(self.judge.threats(color), scanned.threats(color))
+
+            for _ in range(played):
+                self.judge.remove_last_move()
+
+        self.assertEqual(self.judge.threats(1), (0, 0, 0, 0))
+
+    def test_check_win_and_check_lose_use_threats(self):
+        self.play_moves("001122")
+
+        self.assertFalse(self.judge.check_win("3"))
+        self.assertTrue(self.judge.check_lose("3"))
+        self.assertFalse(self.judge.check_lose("4"))
+
+
+class TestEngineThreats(TestCase):
+    def test_forced_move_stops_search_at_first_depth(self):
+        judge = ConnectFourJudge()
+
+        for move in "00112":
+            judge.add_move(move)
+
+        info = ConnectFourEngine(judge=judge).search()
+
+        self.assertEqual(info.move, "3")
+        self.assertEqual(info.stop_reason, StopReason.CRITICAL_MOVE)
+        self.assertEqual(info.depth, 1)
+
+    def test_move_under_winning_cell_of_opponent_is_avoided(self):
+        judge = ConnectFourJudge()
+
+        for move in "45640605":
+            judge.add_move(move)
+
+        info = ConnectFourEngine(judge=judge).search(max_depth=1)
+
+        self.assertNotEqual(info.move, "3")
@@ -0,0 +1,165 @@
+import io
+import math
+from unittest import TestCase
+
+from duo_game_lib.game_state import GameState
+
+from connect_four_lib.connect_four_judge import ConnectFourJudge
+from connect_four_lib.strength import LEVELS
+from connect_four_lib.tournament import (
+    EngineConfig,
+    GameResult,
+    MoveStats,
+    balanced_openings,
+    estimate_elo,
+    format_report,
+    play_game,
+    read_results,
+    run_tournament,
+    summarize,
+    write_result,
+)
+from connect_four_lib.utils.tournament import parse_config
+
+
+class TestTournament(TestCase):
+    def setUp(self) -> None:
+        self.shallow = EngineConfig("shallow", depth=1, table_mb=1)
+        self.deep = EngineConfig("deep", depth=3, table_mb=1)
+
+    def create_result(
+        self, first: str, second: str, score: float, nodes: int = 10
+    ) -> GameResult:
+        return GameResult(
+            first,
+            second,
+            "332",
+            "332",
+            score,
+            MoveStats(2, 0.5, nodes, 4),
+            MoveStats(2, 0.25, nodes, 2),
+        )
+
+    def test_play_game_plays_until_end_of_game(self):
+        result = play_game(self.shallow, self.deep, "332")
+        judge = ConnectFourJudge()
+
+        for move in result.moves:
+            judge.add_move(move)
+
+        self.assertTrue(result.moves.startswith("332"))
+        self.assertNotEqual(judge.is_game_over(), GameState.CONTINUE)
+        self.assertEqual(
+            result.first_stats.moves + result.second_stats.moves,
+            len(result.moves) - 3,
+        )
+        self.assertEqual(result.second_stats.moves, (len(result.moves) - 2) // 2)
+
+        if judge.is_game_over() == GameState.DRAW:
+            self.assertEqual(result.score, 0.5)
+        else:
+            self.assertEqual(result.score, len(result.moves) % 2)
+
+    def test_every_pair_plays_every_opening_with_both_colors(self):
+        results = list(run_tournament([self.shallow, self.deep], ["332", "4"], 1, 2))
+        games = sorted((result.first, result.opening) for result in results)
+
+        self.assertEqual(
+            games,
+            [("deep", "332"), ("deep", "4"), ("shallow", "332"), ("shallow", "4")],
+        )
+
+    def test_results_are_read_back(self):
+        file = io.StringIO()
+        results = [self.create_result("a", "b", 1), self.create_result("b", "a", 0.5)]
+
+        for result in results:
+            write_result(file, result)
+
+        file.seek(0)
+
+        self.assertEqual(list(read_results(file)), results)
+
+    def test_balanced_openings_leave_out_mirror_images(self):
+        openings = balanced_openings(plies=2, count=5, depth=2)
+
+        self.assertEqual(len(openings), 5)
+
+        for opening in openings:
+            mirrored = "".join(str(6 - int(move)) for move in opening)
+            self.assertTrue(opening == mirrored or mirrored not in openings)
+
+
+class TestElo(TestCase):
+    def test_even_score_is_zero_with_symmetric_interval(self):
+        estimate = estimate_elo([1, 0] * 50)
+
+        self.assertAlmostEqual(estimate.elo, 0)
+        self.assertAlmostEqual(estimate.low, -estimate.high)
+        self.assertLess(estimate.low, 0)
+
+    def test_elo_of_score(self):
+        self.assertAlmostEqual(estimate_elo([1, 1, 1, 0]).elo, 190.85, places=2)
+        self.assertAlmostEqual(estimate_elo([0.5] * 10).elo, 0)
+        self.assertEqual(estimate_elo([0.5] * 10).low, 0)
+
+    def test_interval_narrows_with_more_games(self):
+        few = estimate_elo([1, 1, 0, 0.5] * 10)
+        many = estimate_elo([1, 1, 0, 0.5] * 1000)
+
+        self.assertAlmostEqual(few.elo, many.elo)
+        self.assertLess(many.high - many.low, few.high - few.low)
+
+    def test_perfect_scores_are_infinite(self):
+        self.assertEqual(estimate_elo([1, 1]).elo, math.inf)
+        self.assertEqual(estimate_elo([0]).elo, -math.inf)
+
+    def test_summary_is_relative_to_baseline(self):
+        results = [
+            GameResult("a", "b", "", "", 0, MoveStats(2, 1, 100, 6), MoveStats()),
+            GameResult("b", "a", "", "", 1, MoveStats(4, 1, 20, 4), MoveStats()),
+            GameResult("a", "c", "", "", 0.5, MoveStats(), MoveStats(1, 0, 0, 1)),
+        ]
+        summaries = {summary.name: summary for summary in summarize(results)}
+
+        self.assertEqual(list(summaries), ["a", "b", "c"])
+        self.assertEqual(summaries["a"].elo, (0, 0, 0))
+        self.assertEqual(summaries["a"].games, 3)
+        self.assertAlmostEqual(summaries["a"].score, 1 / 6)
+        self.assertEqual(summaries["b"].elo.elo, math.inf)
+        self.assertEqual(summaries["c"].elo.elo, 0)
+        self.assertEqual(summaries["b"].nodes_per_move, 5)
+        self.assertEqual(summaries["b"].depth_per_move, 1)
+        self.assertEqual(summaries["b"].time_per_move, 0.25)
+
+        report = format_report(summaries.values())
+        self.assertEqual(len(report.splitlines()), 4)
+
+    def test_summary_of_other_baseline(self):
+        results = [GameResult("a", "b", "", "", 1, MoveStats(), MoveStats())]
+        summaries = summarize(results, "b")
+
+        self.assertEqual(summaries[0].elo.elo, math.inf)
+        self.assertEqual(summaries[1].elo, (0, 0, 0))
+
+
+class TestParseConfig(TestCase):
+    def test_fields_are_converted_to_their_types(self):
+        config = parse_config("fast:difficulty=200,killers=false,table_mb=0.5")
+
+        self.assertEqual(
+            config,
+            EngineConfig("fast", difficulty=200, killers=False, table_mb=0.5),
+        )
+        self.assertEqual(parse_config("base"), EngineConfig("base"))
+        self.assertEqual(parse_config("deep:depth=6").depth, 6)
+
+    def test_elo_selects_strength_level(self):
+        config = parse_config("weak:elo=0,table_mb=1")
+
+        self.assertEqual(
+            (config.depth, config.nodes, config.randomness),
+            (LEVELS[0].depth, LEVELS[0].nodes, LEVELS[0].randomness),
+        )
+        self.assertEqual(config.table_mb, 1)
+        self.assertIsNone(config.limits.time_limit)
@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+from connect_four_lib.transposition_table import (
+    Bound,
+    ReplacementPolicy,
+    TranspositionTable,
+)
+
+
+class TestTranspositionTable(TestCase):
+    def setUp(self) -> None:
+        self.table = TranspositionTable(size_mb=0.001)
+
+    def test_capacity_is_derived_from_size(self):
+        self.assertEqual(
+            self.table.capacity, 1024 * 1024 // 1000 // TranspositionTable.ENTRY_SIZE
+        )
+        self.assertEqual(TranspositionTable(size_mb=0).capacity, 1)
+
+    def test_get_returns_stored_entry(self):
+        self.table.store(12345, 3, 25, Bound.EXACT, 4)
+
+        entry = self.table.get(12345)
+
+        self.assertEqual(
+            (entry.depth, entry.value, entry.bound, entry.move), (3, 25, Bound.EXACT, 4)
+        )
+        self.assertEqual(len(self.table), 1)
+
+    def test_get_returns_none_for_unknown_key(self):
+        self.table.store(1, 3, 25, Bound.EXACT, 4)
+
+        self.assertIsNone(self.table.get(1 + self.table.capacity))
+        self.assertIsNone(self.table.get(2))
+
+    def test_depth_preferred_keeps_deeper_entry(self):
+        key = self.table.capacity + 1
+        self.table.store(1, 5, 10, Bound.LOWER, 2)
+        self.table.store(key, 2, 20, Bound.EXACT, 3)
+
+        self.assertIsNotNone(self.table.get(1))
+        self.assertIsNone(self.table.get(key))
+
+    def test_depth_preferred_replaces_entries_of_previous_search(self):
+        key = self.table.capacity + 1
+        self.table.store(1, 5, 10, Bound.LOWER, 2)
+        self.table.new_search()
+        self.table.store(key, 2, 20, Bound.EXACT, 3)
+
+        self.assertIsNone(self.table.get(1))
+        self.assertIsNotNone(self.table.get(key))
+
+    def test_always_replaces_entry(self):
+        table = TranspositionTable(size_mb=0.001, policy=ReplacementPolicy.ALWAYS)
+        key = table.capacity + 1
+        table.store(1, 5, 10, Bound.LOWER, 2)
+        table.store(key, 2, 20, Bound.EXACT, 3)
+
+        self.assertIsNone(table.get(1))
+        self.assertIsNotNone(table.get(key))
+
+    def test_clear_removes_entries(self):
+        self.table.store(1, 5, 10, Bound.LOWER, 2)
+        self.table.clear()
+
+        self.assertEqual(len(self.table), 0)
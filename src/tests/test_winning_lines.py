@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+from connect_four_lib.winning_lines import get_winning_lines
+
+
+class TestWinningLines(TestCase):
+    def setUp(self) -> None:
+        self.lines = get_winning_lines()
+
+    def test_standard_board_has_69_lines(self):
+        self.assertEqual(len(self.lines.lines), 69)
+        self.assertEqual(len(self.lines.masks), 69)
+
+    def test_lines_stay_inside_board(self):
+        for line in self.lines.lines:
+            for column, row in line:
+                self.assertTrue(0 <= column < 7 and 0 <= row < 6)
+
+    def test_cell_lines_contain_lines_through_cell(self):
+        self.assertEqual(len(self.lines.cell_lines[0]), 3)
+        self.assertEqual(len(self.lines.cell_lines[3 * 6 + 2]), 13)
+
+        for cell, line_indexes in enumerate(self.lines.cell_lines):
+            for index in line_indexes:
+                self.assertIn(divmod(cell, 6), self.lines.lines[index])
+
+    def test_cell_masks_match_line_masks(self):
+        for cell, line_indexes in enumerate(self.lines.cell_lines):
+            self.assertEqual(
+                self.lines.cell_masks[cell],
+                [self.lines.masks[index] for index in line_indexes],
+            )
+
+    def test_mask_of_line_contains_its_cells(self):
+        self.assertEqual(self.lines.masks[0], 0b1111)
+
+    def test_lines_are_built_once_per_size(self):
+        self.assertIs(get_winning_lines(), self.lines)
+        self.assertIsNot(get_winning_lines(8, 7), self.lines)
+        self.assertEqual(len(get_winning_lines(1, 42).lines), 39)
@@ -25,3 +25,60 @@ def coverage_xml(ctx):
 @task
 def lint(ctx):
     ctx.run("poetry run pylint src -j 0")
+
+
+@task
+def generate_book(ctx, path="book.bin", plies=4, depth=8, solver=False):
+    command = f"poetry run python -m connect_four_lib.utils.generate_book {path}"
+    command += f" --plies {plies} --depth {depth}"
+
+    if solver:
+        command += " --solver"
+
+    ctx.run(command, env={"PYTHONPATH": "src"}, pty=True)
+
+
+@task
+def parallel_benchmark(ctx, difficulty=1000):
+    ctx.run(
+        "poetry run python -m connect_four_lib.utils.parallel_benchmark"
+        f" --difficulty {difficulty}",
+        env={"PYTHONPATH": "src"},
+        pty=True,
+    )
+
+
+@task
+def engine_server(ctx, max_games=256, difficulty=1000, book=""):
+    command = "poetry run python -m connect_four_lib.utils.engine_server"
+    command += f" --max-games {max_games} --difficulty {difficulty}"
+
+    if book:
+        command += f" --book {book}"
+
+    ctx.run(command, env={"PYTHONPATH": "src"}, pty=True)
+
+
+@task
+def benchmark(ctx, output="", compare="", tolerance=0.1):
+    command = "poetry run python -m connect_four_lib.utils.benchmark"
+    command += f" --tolerance {tolerance}"
+
+    if output:
+        command += f" --output {output}"
+
+    if compare:
+        command += f" --compare {compare}"
+
+    ctx.run(command, env={"PYTHONPATH": "src"}, pty=True)
+
+
+@task(iterable=["engine"])
+def tournament(ctx, engine, openings=16, rounds=1, output="tournament.jsonl"):
+    command = "poetry run python -m connect_four_lib.utils.tournament"
+    command += f" --openings {openings} --rounds {rounds} --output {output}"
+
+    for config in engine:
+        command += f" --engine {config}"
+
+    ctx.run(command, env={"PYTHONPATH": "src"}, pty=True)